@@ -0,0 +1,314 @@
+import argparse
+import contextlib
+import json
+import shlex
+import sys
+
+from typing import Any, Iterable, TextIO
+
+from app.library import BookStatus, Library, Query
+from app.library.bulk import FORMATS
+
+
+class _ArgumentParser(argparse.ArgumentParser):
+    """Разборщик аргументов, который сообщает об ошибке исключением, а не завершением процесса."""
+
+    def error(self, message: str):
+        raise ValueError(message)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Создает разборщик аргументов командной строки.
+
+    Returns:
+        argparse.ArgumentParser: Разборщик с подкомандами add, delete, search, list, status, import, export и batch.
+    """
+
+    parser = _ArgumentParser(
+        prog='python -m app',
+        description='Неинтерактивное управление библиотекой. Результат каждой команды выводится '
+                    'одной строкой JSON: {"ok": true, "result": ...} или {"ok": false, "error": ...}.'
+    )
+    parser.add_argument('--storage', default='library.json',
+                        help='файл хранилища (.json, .db или каталог .shards, по умолчанию library.json)')
+    commands = parser.add_subparsers(dest='command', required=True, parser_class=_ArgumentParser)
+
+    add = commands.add_parser('add', help='добавить книгу')
+    add.add_argument('title', help='название книги')
+    add.add_argument('author', help='автор книги')
+    add.add_argument('year', type=int, help='год издания')
+
+    delete = commands.add_parser('delete', help='удалить книгу')
+    delete.add_argument('id', type=int, help='ID книги')
+
+    search = commands.add_parser('search', help='найти книги')
+    search.add_argument('keyword', help='ключевое слово')
+    search.add_argument('--field', choices=Library.SEARCH_FIELDS, default='title',
+                        help='поле для поиска (по умолчанию title)')
+
+    list_ = commands.add_parser('list', help='показать книги')
+    list_.add_argument('--status', choices=BookStatus.values(), help='только книги с указанным статусом')
+
+    status = commands.add_parser('status', help='изменить статус книги')
+    status.add_argument('id', type=int, help='ID книги')
+    status.add_argument('status', choices=BookStatus.values(), help='новый статус')
+
+    import_ = commands.add_parser('import', help='массово импортировать книги из CSV или JSON Lines')
+    import_.add_argument('file', help='файл с книгами')
+    import_.add_argument('--format', choices=FORMATS,
+                         help='формат файла (по умолчанию определяется по расширению: .jsonl - jsonl, иначе csv)')
+    import_.add_argument('--report', help='файл для отчета об отклоненных записях (JSON Lines)')
+    import_.add_argument('--workers', type=int, help='число процессов проверки (по умолчанию число процессоров)')
+
+    export = commands.add_parser('export', help='выгрузить книги в CSV или JSON Lines')
+    export.add_argument('file', help='файл для выгрузки')
+    export.add_argument('--format', choices=FORMATS,
+                        help='формат файла (по умолчанию определяется по расширению: .jsonl - jsonl, иначе csv)')
+    export.add_argument('--search', metavar='KEYWORD', help='выгрузить только книги, найденные по ключевому слову')
+    export.add_argument('--field', choices=Library.SEARCH_FIELDS, default='title',
+                        help='поле для поиска (по умолчанию title)')
+    export.add_argument('--status', choices=BookStatus.values(), help='выгрузить только книги с указанным статусом')
+
+    batch = commands.add_parser('batch', help='выполнить команды из файла (по одной в строке)')
+    batch.add_argument('file', nargs='?', default='-', help='файл с командами (по умолчанию stdin)')
+    return parser
+
+
+def execute(library: Library, args: argparse.Namespace) -> Any:
+    """
+    Выполняет одну команду (кроме batch) над загруженной библиотекой.
+
+    Args:
+        library (Library): Библиотека.
+        args (argparse.Namespace): Разобранные аргументы команды.
+
+    Raises:
+        ValueError: Если команда не выполнена (книга не найдена, не проходит валидацию и т.п.).
+
+    Returns:
+        Any: Результат команды, сериализуемый в JSON: книга или список книг в формате `Book.to_dict`,
+            для import - итоги импорта (см. `Library.import_books`), для export - число выгруженных книг.
+    """
+
+    if args.command == 'add':
+        return library.add_book_record(args.title, args.author, args.year).to_dict()
+    if args.command == 'delete':
+        return library.remove_book(args.id).to_dict()
+    if args.command == 'status':
+        return library.set_status(args.id, BookStatus.from_value(args.status)).to_dict()
+    if args.command == 'import':
+        return import_file(library, args.file, args.format, args.report, args.workers)
+    if args.command == 'export':
+        return {'exported': export_file(library, args.file, args.format, args.search, args.field, args.status)}
+    if args.command == 'search':
+        books = library.search_books(args.keyword, args.field)
+    elif args.status is not None:
+        books = library.books_with_status(BookStatus.from_value(args.status))
+    else:
+        books = library.books
+    return [book.to_dict() for book in books]
+
+
+def file_format(path: str) -> str:
+    """
+    Определяет формат файла книг по расширению.
+
+    Args:
+        path (str): Путь к файлу.
+
+    Returns:
+        str: 'jsonl' для файлов .jsonl, иначе 'csv'.
+    """
+
+    return 'jsonl' if path.lower().endswith('.jsonl') else 'csv'
+
+
+def import_file(
+        library: Library,
+        path: str,
+        format: str | None = None,
+        report: str | None = None,
+        workers: int | None = None
+) -> dict:
+    """
+    Импортирует книги из файла (см. `Library.import_books`).
+
+    Args:
+        library (Library): Библиотека.
+        path (str): Путь к файлу CSV или JSON Lines.
+        format (str | None, optional): Формат файла (по умолчанию определяется по расширению).
+        report (str | None, optional): Путь к файлу отчета об отклоненных записях.
+        workers (int | None, optional): Число процессов проверки.
+
+    Raises:
+        ValueError: Если файл не удалось прочитать или импорт не выполнен.
+
+    Returns:
+        dict: Итоги импорта.
+    """
+
+    format = format or file_format(path)
+    try:
+        with open(path, encoding='utf-8', newline='') as file, \
+                (open(report, 'w', encoding='utf-8') if report else contextlib.nullcontext()) as report_file:
+            return library.import_books(file, format, report_file, workers)
+    except OSError as e:
+        raise ValueError(f'Не удалось открыть файл: {e}') from e
+
+
+def export_file(
+        library: Library,
+        path: str,
+        format: str | None = None,
+        keyword: str | None = None,
+        field: str = 'title',
+        status: str | None = None
+) -> int:
+    """
+    Выгружает книги в файл (см. `Library.export`).
+
+    Args:
+        library (Library): Библиотека.
+        path (str): Путь к файлу CSV или JSON Lines.
+        format (str | None, optional): Формат файла (по умолчанию определяется по расширению).
+        keyword (str | None, optional): Ключевое слово для отбора книг поиском.
+        field (str, optional): Поле для поиска (по умолчанию 'title').
+        status (str | None, optional): Статус для отбора книг.
+
+    Raises:
+        ValueError: Если файл не удалось записать.
+
+    Returns:
+        int: Число выгруженных книг.
+    """
+
+    format = format or file_format(path)
+    query = None
+    if keyword is not None or status is not None:
+        query = Query()
+        if keyword is not None:
+            query.contains(field, keyword)
+        if status is not None:
+            query.status_is(BookStatus.from_value(status))
+    try:
+        with open(path, 'w', encoding='utf-8', newline='') as file:
+            return library.export(file, format, query)
+    except OSError as e:
+        raise ValueError(f'Не удалось записать файл: {e}') from e
+
+
+def write_result(stream: TextIO, result: Any = None, error: str | None = None) -> None:
+    """
+    Выводит результат команды одной строкой JSON.
+
+    Args:
+        stream (TextIO): Поток вывода.
+        result (Any, optional): Результат успешной команды.
+        error (str | None, optional): Сообщение об ошибке, если команда не выполнена.
+    """
+
+    document = {'ok': False, 'error': error} if error is not None else {'ok': True, 'result': result}
+    stream.write(json.dumps(document, ensure_ascii=False) + '\n')
+
+
+def run_batch(library: Library, parser: argparse.ArgumentParser, lines: Iterable[str], stream: TextIO) -> int:
+    """
+    Выполняет команды по одной в строке над одной загруженной библиотекой.
+
+    Строки разбираются как аргументы командной строки (с кавычками). Пустые строки и строки,
+    начинающиеся с '#', пропускаются. Ошибка в команде не прерывает выполнение остальных.
+
+    Args:
+        library (Library): Библиотека.
+        parser (argparse.ArgumentParser): Разборщик аргументов (`build_parser`).
+        lines (Iterable[str]): Строки с командами.
+        stream (TextIO): Поток вывода результатов.
+
+    Returns:
+        int: Число команд, завершившихся ошибкой.
+    """
+
+    failed = 0
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        try:
+            args = parser.parse_args(shlex.split(line))
+            if args.command == 'batch':
+                raise ValueError('Команда batch недоступна внутри пакета')
+            result = execute(library, args)
+        except SystemExit:
+            # --help выводит справку (в stderr) и пытается завершить процесс.
+            result = None
+        except ValueError as e:
+            failed += 1
+            write_result(stream, error=f'{line}: {e}')
+            continue
+        write_result(stream, result)
+    return failed
+
+
+def main(argv: list[str] | None = None, stream: TextIO | None = None) -> int:
+    """
+    Точка входа неинтерактивного интерфейса.
+
+    Одиночная команда записывает изменение в хранилище сразу, и ее результат выводится только
+    после записи. В пакетном режиме изменения всех команд накапливаются в памяти и записываются
+    в хранилище одной записью при завершении; если запись не удалась, последней выводится строка
+    с ошибкой. Сообщения библиотеки выводятся в stderr, чтобы не смешиваться с результатами.
+
+    Args:
+        argv (list[str] | None, optional): Аргументы командной строки (по умолчанию `sys.argv[1:]`).
+        stream (TextIO | None, optional): Поток вывода результатов (по умолчанию `sys.stdout`).
+
+    Returns:
+        int: Код завершения: 0 - все команды выполнены, 1 - есть ошибки или изменения не записаны,
+            2 - неверные аргументы.
+    """
+
+    stream = sys.stdout if stream is None else stream
+    parser = build_parser()
+    try:
+        args = parser.parse_args(argv)
+    except ValueError as e:
+        write_result(stream, error=str(e))
+        return 2
+
+    batch = args.command == 'batch'
+    if not batch or args.file == '-':
+        commands = contextlib.nullcontext(sys.stdin)
+    else:
+        try:
+            commands = open(args.file, encoding='utf-8')
+        except OSError as e:
+            write_result(stream, error=f'Не удалось прочитать файл с командами: {e}')
+            return 2
+
+    with commands as lines, contextlib.redirect_stdout(sys.stderr):
+        try:
+            library = Library(args.storage, flush_interval=0 if batch else None, multiprocess=True)
+        except ValueError as e:
+            write_result(stream, error=str(e))
+            return 2
+
+        output, code = None, 0
+        try:
+            try:
+                if batch:
+                    code = 1 if run_batch(library, parser, lines, stream) else 0
+                else:
+                    try:
+                        output = {'result': execute(library, args)}
+                    except ValueError as e:
+                        output, code = {'error': str(e)}, 1
+            finally:
+                library.exit()
+        except OSError as e:
+            write_result(stream, error=f'Не удалось записать изменения в хранилище: {e}')
+            return 1
+
+    if output is not None:
+        write_result(stream, **output)
+    return code
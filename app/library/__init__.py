@@ -1,2 +1,7 @@
 from .book import Book, BookStatus, BookInterface
 from .library import Library
+from .async_library import AsyncLibrary
+from .query import Query
+from .storage import StorageBackend, JsonStorage
+from .sqlite_storage import SqliteStorage
+from .sharded_storage import ShardedStorage
@@ -0,0 +1,281 @@
+import asyncio
+
+from typing import Any, Callable
+
+from .book import Book, BookStatus
+from .library import Library
+from .metrics import Metrics
+from .query import Query
+
+
+class AsyncLibrary:
+    """
+    Асинхронный интерфейс библиотеки для приложений на asyncio.
+
+    Все обращения к библиотеке выполняются в пуле потоков, поэтому блокировки и файловый
+    ввод-вывод не останавливают цикл событий. Методы не печатают сообщения, а возвращают данные
+    и пробрасывают исключения (в том числе ошибки валидации `Book`).
+
+    Изменения сначала применяются в памяти, а затем записываются в хранилище групповой фиксацией:
+    изменения, сделанные конкурентно, пока предыдущая запись еще выполнялась, записываются
+    одной следующей записью. Метод изменения завершается, когда его изменение записано.
+
+    Example:
+        >>> async with await AsyncLibrary.open('library.json') as library:
+        ...     book = await library.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+        ...     books = await library.search_books('толстой', 'author')
+    """
+
+    def __init__(self, library: Library):
+        """
+        Инициализация асинхронного интерфейса.
+
+        Args:
+            library (Library): Библиотека. Для групповой фиксации она должна работать в режиме
+                отложенной записи с явным сбросом (`flush_interval=0`), как при создании через `open`.
+        """
+
+        self._library = library
+        self._batch: asyncio.Future | None = None
+        self._saver: asyncio.Task | None = None
+
+    @classmethod
+    async def open(cls, storage: str = 'library.json', **options) -> 'AsyncLibrary':
+        """
+        Загружает библиотеку в пуле потоков и создает для нее асинхронный интерфейс.
+
+        Args:
+            storage (str, optional): Путь к файлу хранилища (по умолчанию 'library.json').
+            **options: Остальные параметры `Library`, кроме `flush_interval`.
+
+        Returns:
+            AsyncLibrary: Асинхронный интерфейс библиотеки.
+        """
+
+        library = await asyncio.to_thread(Library, storage, flush_interval=0, **options)
+        return cls(library)
+
+    @property
+    def metrics(self) -> Metrics:
+        """Метрики операций библиотеки (см. `Library.metrics`)."""
+
+        return self._library.metrics
+
+    async def __aenter__(self) -> 'AsyncLibrary':
+        """Возвращает асинхронный интерфейс для использования в `async with`."""
+
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Закрывает библиотеку при выходе из блока `async with`."""
+
+        await self.close()
+
+    async def _run(self, function: Callable, *args) -> Any:
+        """
+        Выполняет вызов библиотеки в пуле потоков.
+
+        Args:
+            function (Callable): Метод библиотеки.
+            *args: Аргументы метода.
+
+        Returns:
+            Any: Результат метода.
+        """
+
+        return await asyncio.to_thread(function, *args)
+
+    async def _persist(self) -> None:
+        """
+        Ожидает записи уже примененных в памяти изменений.
+
+        Если очередная запись еще не запланирована, создает ее. Все изменения, которые успели
+        присоединиться к ней до начала записи, записываются одним сбросом библиотеки.
+
+        Raises:
+            Exception: Если запись не удалась. Изменения остаются в очереди и будут записаны
+                следующей записью.
+        """
+
+        if self._batch is None:
+            self._batch = asyncio.get_running_loop().create_future()
+            if self._saver is None or self._saver.done():
+                self._saver = asyncio.create_task(self._save_batches())
+        await asyncio.shield(self._batch)
+
+    async def _save_batches(self) -> None:
+        """Последовательно выполняет запланированные записи, пока они появляются."""
+
+        while self._batch is not None:
+            batch, self._batch = self._batch, None
+            try:
+                await self._run(self._library.flush)
+            except Exception as e:
+                batch.set_exception(e)
+            else:
+                batch.set_result(None)
+
+    async def add_book(self, title: str, author: str, year: int) -> Book:
+        """
+        Добавляет книгу в библиотеку.
+
+        Args:
+            title (str): Название книги.
+            author (str): Автор книги.
+            year (int): Год издания книги.
+
+        Raises:
+            ValueError: Если книга не проходит валидацию.
+
+        Returns:
+            Book: Добавленная книга.
+        """
+
+        book = await self._run(self._library.add_book_record, title, author, year)
+        await self._persist()
+        return book
+
+    async def delete_book(self, book_id: int) -> Book:
+        """
+        Удаляет книгу из библиотеки по ID.
+
+        Args:
+            book_id (int): ID книги для удаления.
+
+        Raises:
+            ValueError: Если книга не найдена.
+
+        Returns:
+            Book: Удаленная книга.
+        """
+
+        book = await self._run(self._library.remove_book, book_id)
+        await self._persist()
+        return book
+
+    async def change_status(self, book_id: int, new_status: BookStatus) -> Book:
+        """
+        Изменяет статус книги.
+
+        Args:
+            book_id (int): ID книги для изменения статуса.
+            new_status (BookStatus): Новый статус книги.
+
+        Raises:
+            ValueError: Если книга не найдена.
+
+        Returns:
+            Book: Измененная книга.
+        """
+
+        book = await self._run(self._library.set_status, book_id, new_status)
+        await self._persist()
+        return book
+
+    async def search_books(self, keyword: str, field: str) -> list[Book]:
+        """
+        Ищет книги по указанному полю (см. `Library.search_books`).
+
+        Args:
+            keyword (str): Ключевое слово для поиска.
+            field (str): Поле для поиска ('title', 'author' или 'year').
+
+        Raises:
+            ValueError: Если указано недопустимое поле для поиска.
+
+        Returns:
+            list[Book]: Список найденных книг.
+        """
+
+        return await self._run(self._library.search_books, keyword, field)
+
+    async def search_fuzzy(self, keyword: str, field: str, max_distance: int = 2) -> list[Book]:
+        """
+        Ищет книги с опечатками (см. `Library.search_fuzzy`).
+
+        Args:
+            keyword (str): Ключевое слово.
+            field (str): Поле для поиска ('title' или 'author').
+            max_distance (int, optional): Максимальное число правок (по умолчанию 2).
+
+        Raises:
+            ValueError: Если поле или число правок недопустимы.
+
+        Returns:
+            list[Book]: Найденные книги, упорядоченные по расстоянию.
+        """
+
+        return await self._run(self._library.search_fuzzy, keyword, field, max_distance)
+
+    async def search_by_year_range(self, start_year: int, end_year: int) -> list[Book]:
+        """
+        Ищет книги, изданные в диапазоне лет включительно.
+
+        Args:
+            start_year (int): Начальный год диапазона.
+            end_year (int): Конечный год диапазона.
+
+        Raises:
+            ValueError: Если начальный год больше конечного.
+
+        Returns:
+            list[Book]: Список книг, упорядоченный по году издания и ID.
+        """
+
+        return await self._run(self._library.search_by_year_range, start_year, end_year)
+
+    async def query(self, query: Query) -> list[Book]:
+        """
+        Выполняет составной запрос (см. `Library.query`).
+
+        Args:
+            query (Query): Запрос.
+
+        Returns:
+            list[Book]: Книги, удовлетворяющие всем условиям запроса.
+        """
+
+        return await self._run(self._library.query, query)
+
+    async def count_by_status(self) -> dict[BookStatus, int]:
+        """
+        Возвращает число книг с каждым статусом (см. `Library.count_by_status`).
+
+        Returns:
+            dict[BookStatus, int]: Статус -> число книг.
+        """
+
+        return await self._run(self._library.count_by_status)
+
+    async def books_with_status(self, status: BookStatus) -> list[Book]:
+        """
+        Возвращает книги с указанным статусом (см. `Library.books_with_status`).
+
+        Args:
+            status (BookStatus): Статус книги.
+
+        Raises:
+            ValueError: Если статус недопустим.
+
+        Returns:
+            list[Book]: Список книг, упорядоченный по ID.
+        """
+
+        return await self._run(self._library.books_with_status, status)
+
+    async def list_books(self) -> list[Book]:
+        """
+        Возвращает все книги библиотеки в порядке добавления.
+
+        Returns:
+            list[Book]: Список книг.
+        """
+
+        return await self._run(lambda: self._library.books)
+
+    async def close(self) -> None:
+        """Дожидается запланированных записей и закрывает библиотеку с сохранением изменений."""
+
+        if self._saver is not None:
+            await self._saver
+        await self._run(self._library.exit)
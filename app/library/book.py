@@ -1,9 +1,11 @@
 # P.S. Для валидации я бы использовал модели pydantic, ну либо так :)
 
 import re
+import sys
 
 from datetime import datetime, timezone
 from enum import Enum
+from typing import Callable
 
 from app.utils import get_int_input, get_str_input, handle_input_errors
 
@@ -38,7 +40,7 @@ class BookStatus(Enum):
             value (str): Строковое значение статуса книги (например, 'в наличии').
 
         Raises:
-            ValueError: Если переданное значение не соответствует ни одному статусу.
+            ValueError: Если переданное значение не строка или не соответствует ни одному статусу.
 
         Returns:
             BookStatus: Соответствующий элемент перечисления BookStatus.
@@ -48,6 +50,9 @@ class BookStatus(Enum):
             <BookStatus.IN_STOCK: 'в наличии'>
         """
 
+        if not isinstance(value, str):
+            raise ValueError('Статус книги должен быть строкой')
+
         value = value.lower()
         for status in cls:
             if status.value.lower() == value:
@@ -59,7 +64,12 @@ class Book:
     """
     Класс, представляющий книгу в библиотеке.
 
+    Экземпляры не имеют `__dict__` (используются `__slots__`), а имена авторов интернируются,
+    поэтому книги одного автора разделяют одну строку. Это заметно снижает расход памяти
+    на больших каталогах.
+
     Attributes:
+        MAX_ID (int): Максимально допустимый ID книги. Индекс по году упаковывает ID в 32 бита.
         MIN_YEAR (int): Минимально допустимый год издания книги.
         MIN_TITLE_LENGTH (int): Минимальная длина названия книги.
         MAX_TITLE_LENGTH (int): Максимальная длина названия книги.
@@ -67,6 +77,9 @@ class Book:
         MAX_AUTHOR_LENGTH (int): Максимальная длина имени автора.
     """
 
+    __slots__ = ('id', 'title', 'author', 'year', 'status')
+
+    MAX_ID = 2 ** 32 - 1
     MIN_YEAR = 1000
     MIN_TITLE_LENGTH = 2
     MAX_TITLE_LENGTH = 50
@@ -131,6 +144,59 @@ class Book:
             'status': self.status.value
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Book':
+        """
+        Создает объект книги из словаря, полученного методом `to_dict`.
+
+        Args:
+            data (dict): Словарь с ключами 'id', 'title', 'author', 'year' и 'status'.
+
+        Raises:
+            ValueError: Если данные не словарь или какой-либо из параметров не проходит валидацию.
+
+        Returns:
+            Book: Новый объект книги.
+        """
+
+        if not isinstance(data, dict):
+            raise ValueError('Запись должна быть объектом')
+
+        return cls(
+            id_=data.get('id'),
+            title=data.get('title'),
+            author=data.get('author'),
+            year=data.get('year'),
+            status=BookStatus.from_value(data.get('status'))
+        )
+
+    @classmethod
+    def unchecked(cls, id_: int, title: str, author: str, year: int, status: BookStatus) -> 'Book':
+        """
+        Создает объект книги без валидации.
+
+        Используется только для данных из доверенного источника, которые уже прошли валидацию
+        при записи (например, бинарного снимка с совпавшей контрольной суммой).
+
+        Args:
+            id_ (int): Уникальный идентификатор книги.
+            title (str): Название книги.
+            author (str): Автор книги.
+            year (int): Год издания книги.
+            status (BookStatus): Статус книги.
+
+        Returns:
+            Book: Новый объект книги.
+        """
+
+        book = cls.__new__(cls)
+        book.id = id_
+        book.title = title
+        book.author = sys.intern(author)
+        book.year = year
+        book.status = status
+        return book
+
     @staticmethod
     def validate_id(id_: int) -> int:
         """
@@ -140,14 +206,14 @@ class Book:
             id_ (int): Идентификатор книги.
 
         Raises:
-            ValueError: Если id не является положительным целым числом.
+            ValueError: Если id не является целым числом в диапазоне от 1 до `MAX_ID`.
 
         Returns:
             int: Валидный идентификатор книги.
         """
 
-        if not isinstance(id_, int) or id_ < 1:
-            raise ValueError('ID книги должен быть положительным целым числом')
+        if not isinstance(id_, int) or not (1 <= id_ <= Book.MAX_ID):
+            raise ValueError(f'ID книги должен быть целым числом в диапазоне от 1 до {Book.MAX_ID}')
         return id_
 
     @classmethod
@@ -188,7 +254,7 @@ class Book:
             ValueError: Если имя автора пустое, не строка или содержит недопустимые символы.
 
         Returns:
-            str: Валидное имя автора.
+            str: Валидное имя автора (интернированная строка).
         """
 
         if not isinstance(author, str):
@@ -202,7 +268,7 @@ class Book:
                              f'до {cls.MAX_AUTHOR_LENGTH} символов')
         if not re.fullmatch(r'^[А-ЯЁа-яёA-Za-z\s.]+$', author):
             raise ValueError('Имя автора может содержать только буквы, пробелы и точки')
-        return author
+        return sys.intern(author)
 
     @classmethod
     def validate_year(cls, year: int) -> int:
@@ -270,33 +336,43 @@ class BookInterface:
 
     @staticmethod
     @handle_input_errors
-    def input_title(prompt: str = 'Введите название книги: ') -> str:
+    def input_title(
+            prompt: str = 'Введите название книги: ',
+            complete: Callable[[str], list[str]] | None = None
+    ) -> str:
         """
         Ввод названия книги с валидацией.
 
         Args:
             prompt (str): Сообщение для пользователя. По умолчанию: 'Введите название книги: '.
+            complete (Callable[[str], list[str]] | None): Функция подсказок существующих названий
+                для автодополнения по клавише Tab (например, `Library.suggest`).
 
         Returns:
             str: Валидное название книги.
         """
 
-        return Book.validate_title(get_str_input(prompt))
+        return Book.validate_title(get_str_input(prompt, complete=complete))
 
     @staticmethod
     @handle_input_errors
-    def input_author(prompt: str = 'Введите автора книги: ') -> str:
+    def input_author(
+            prompt: str = 'Введите автора книги: ',
+            complete: Callable[[str], list[str]] | None = None
+    ) -> str:
         """
         Ввод имени автора с валидацией.
 
         Args:
             prompt (str): Сообщение для пользователя. По умолчанию: 'Введите автора книги: '.
+            complete (Callable[[str], list[str]] | None): Функция подсказок существующих авторов
+                для автодополнения по клавише Tab (например, `Library.suggest`).
 
         Returns:
-            str: Валидное имя автора.
+            str: Валидное имя автора (интернированная строка).
         """
 
-        return Book.validate_author(get_str_input(prompt))
+        return Book.validate_author(get_str_input(prompt, complete=complete))
 
     @staticmethod
     @handle_input_errors
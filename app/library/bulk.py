@@ -0,0 +1,224 @@
+import csv
+import io
+import json
+import os
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, TextIO
+
+from .book import Book, BookStatus
+
+FORMATS = ('csv', 'jsonl')
+CSV_FIELDS = ('title', 'author', 'year')
+EXPORT_FIELDS = ('id', 'title', 'author', 'year', 'status')
+# Статусы по значению в нижнем регистре: поиск по словарю вместо перебора `BookStatus.from_value`.
+STATUSES = {status.value.lower(): status for status in BookStatus}
+
+# Строка входных данных: номер строки и запись (словарь CSV или строка JSON).
+Row = tuple[int, dict | str]
+# Проверенная запись: название, автор, год издания и статус.
+ValidRow = tuple[str, str, int, BookStatus]
+# Отклоненная запись: номер строки, исходная запись и сообщение об ошибке.
+RejectedRow = tuple[int, dict | str, str]
+
+
+def read_rows(stream: TextIO, format: str) -> Iterator[Row]:
+    """
+    Потоково читает записи книг из CSV или JSON Lines, не разбирая и не проверяя их содержимое.
+
+    В CSV первая строка - заголовок со столбцами `CSV_FIELDS` (и, необязательно, 'status').
+    В JSON Lines каждая непустая строка - объект с теми же ключами; строки разбираются
+    при проверке, чтобы разбор JSON тоже выполнялся в пуле процессов.
+
+    Args:
+        stream (TextIO): Входной поток.
+        format (str): Формат: 'csv' или 'jsonl'.
+
+    Raises:
+        ValueError: Если формат недопустим или в заголовке CSV нет обязательных столбцов.
+
+    Yields:
+        Row: Номер строки и запись.
+    """
+
+    if format not in FORMATS:
+        raise ValueError(f'Недопустимый формат. Допустимые значения: {FORMATS}')
+
+    if format == 'jsonl':
+        for line_number, line in enumerate(stream, start=1):
+            if line.strip():
+                yield line_number, line
+        return
+
+    reader = csv.DictReader(stream)
+    missing = set(CSV_FIELDS) - set(reader.fieldnames or ())
+    if missing:
+        raise ValueError(f'В заголовке CSV нет обязательных столбцов: {sorted(missing)}')
+    for record in reader:
+        yield reader.line_num, record
+
+
+def validate_record(record: dict) -> ValidRow:
+    """
+    Проверяет запись книги валидаторами `Book`.
+
+    Год может быть задан строкой из цифр (как в CSV). Отсутствующий или пустой статус
+    означает «в наличии». ID из записи не используется: библиотека выделяет новые.
+
+    Args:
+        record (dict): Запись с ключами 'title', 'author', 'year' и, необязательно, 'status'.
+
+    Raises:
+        ValueError: Если запись не проходит валидацию.
+
+    Returns:
+        ValidRow: Проверенные название, автор, год издания и статус.
+    """
+
+    year = record.get('year')
+    if isinstance(year, str) and year.strip().isdigit():
+        year = int(year)
+    status = record.get('status') or BookStatus.IN_STOCK
+    if isinstance(status, str):
+        status = STATUSES.get(status.lower()) or BookStatus.from_value(status)
+    elif status is not BookStatus.IN_STOCK:
+        raise ValueError('Статус книги должен быть строкой')
+    return (
+        Book.validate_title(record.get('title')),
+        Book.validate_author(record.get('author')),
+        Book.validate_year(year),
+        status
+    )
+
+
+def validate_rows(rows: list[Row]) -> tuple[list[ValidRow], list[RejectedRow]]:
+    """
+    Разбирает и проверяет пачку записей. Выполняется в процессах пула.
+
+    Args:
+        rows (list[Row]): Записи с номерами строк.
+
+    Returns:
+        tuple[list[ValidRow], list[RejectedRow]]: Проверенные записи в исходном порядке и отклоненные записи.
+    """
+
+    valid, rejected = [], []
+    for line_number, record in rows:
+        try:
+            if isinstance(record, str):
+                record = json.loads(record)
+            if not isinstance(record, dict):
+                raise ValueError('Запись должна быть объектом')
+            valid.append(validate_record(record))
+        except ValueError as e:
+            rejected.append((line_number, record.rstrip('\n') if isinstance(record, str) else record, str(e)))
+    return valid, rejected
+
+
+def validate_chunks(
+        rows: Iterable[Row],
+        chunk_size: int,
+        workers: int | None = None
+) -> Iterator[tuple[list[ValidRow], list[RejectedRow]]]:
+    """
+    Проверяет записи пачками в пуле процессов и возвращает результаты в исходном порядке.
+
+    Одновременно в обработке находится не больше двух пачек на процесс, поэтому память
+    ограничена размером пачки, а не размером входных данных.
+
+    Args:
+        rows (Iterable[Row]): Записи с номерами строк.
+        chunk_size (int): Число записей в пачке.
+        workers (int | None, optional): Число процессов (по умолчанию число процессоров).
+            0 или 1 - проверка в текущем процессе.
+
+    Raises:
+        ValueError: Если размер пачки или число процессов недопустимы.
+
+    Yields:
+        tuple[list[ValidRow], list[RejectedRow]]: Результат проверки очередной пачки (см. `validate_rows`).
+    """
+
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError('Размер пачки должен быть положительным целым числом')
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if not isinstance(workers, int) or workers < 0:
+        raise ValueError('Число процессов должно быть неотрицательным целым числом')
+
+    rows = iter(rows)
+    chunks = iter(lambda: list(islice(rows, chunk_size)), [])
+    if workers <= 1:
+        yield from map(validate_rows, chunks)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(validate_rows, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def write_rejected(report: TextIO, rejected: list[RejectedRow]) -> None:
+    """
+    Дописывает отклоненные записи в отчет в формате JSON Lines.
+
+    Args:
+        report (TextIO): Поток отчета.
+        rejected (list[RejectedRow]): Отклоненные записи.
+    """
+
+    for line_number, record, error in rejected:
+        report.write(json.dumps({'line': line_number, 'record': record, 'error': error}, ensure_ascii=False) + '\n')
+
+
+def write_books(stream: TextIO, books: Iterable[Book], format: str, chunk_size: int) -> int:
+    """
+    Потоково записывает книги в CSV (с заголовком `EXPORT_FIELDS`) или JSON Lines.
+
+    Книги сериализуются пачками по `chunk_size`, и каждая пачка записывается в поток одной записью,
+    поэтому дополнительная память ограничена размером пачки. Результат читается `read_rows`.
+
+    Args:
+        stream (TextIO): Поток вывода.
+        books (Iterable[Book]): Книги.
+        format (str): Формат: 'csv' или 'jsonl'.
+        chunk_size (int): Число книг в пачке.
+
+    Raises:
+        ValueError: Если формат или размер пачки недопустимы.
+
+    Returns:
+        int: Число записанных книг.
+    """
+
+    if format not in FORMATS:
+        raise ValueError(f'Недопустимый формат. Допустимые значения: {FORMATS}')
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError('Размер пачки должен быть положительным целым числом')
+
+    books = iter(books)
+    count = 0
+    if format == 'jsonl':
+        while chunk := list(islice(books, chunk_size)):
+            stream.write(''.join(json.dumps(book.to_dict(), ensure_ascii=False) + '\n' for book in chunk))
+            count += len(chunk)
+        return count
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(EXPORT_FIELDS)
+    while chunk := list(islice(books, chunk_size)):
+        writer.writerows((book.id, book.title, book.author, book.year, book.status.value) for book in chunk)
+        stream.write(buffer.getvalue())
+        buffer.seek(0)
+        buffer.truncate()
+        count += len(chunk)
+    if not count:
+        stream.write(buffer.getvalue())
+    return count
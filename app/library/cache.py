@@ -0,0 +1,125 @@
+import threading
+
+from collections import OrderedDict
+from typing import Hashable
+
+
+class SearchCache:
+    """
+    Ограниченный LRU-кеш результатов поиска с отметкой поколения.
+
+    Каждая запись хранит поколение библиотеки, для которого был получен результат. Библиотека
+    увеличивает поколение при каждом изменении, поэтому записи прежних поколений считаются
+    промахом и вытесняются без явной очистки кеша. При переполнении вытесняется запись,
+    к которой дольше всего не обращались.
+
+    Кеш безопасен для одновременного использования из нескольких потоков.
+
+    Attributes:
+        max_size (int): Максимальное число записей. 0 - кеш выключен.
+        hits (int): Число попаданий.
+        misses (int): Число промахов.
+    """
+
+    def __init__(self, max_size: int = 128):
+        """
+        Инициализация кеша.
+
+        Args:
+            max_size (int, optional): Максимальное число записей (по умолчанию 128). 0 - кеш выключен.
+
+        Raises:
+            ValueError: Если размер отрицательный.
+        """
+
+        if not isinstance(max_size, int) or max_size < 0:
+            raise ValueError('Размер кеша должен быть неотрицательным целым числом')
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[int, tuple]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """
+        Возвращает число записей в кеше.
+
+        Returns:
+            int: Число записей.
+        """
+
+        return len(self._entries)
+
+    def get(self, key: Hashable, generation: int) -> tuple | None:
+        """
+        Ищет результат в кеше и учитывает попадание или промах.
+
+        Args:
+            key (Hashable): Ключ запроса.
+            generation (int): Текущее поколение библиотеки.
+
+        Returns:
+            tuple | None: Результат или None, если его нет либо он получен для другого поколения.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != generation:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, generation: int, result: tuple) -> None:
+        """
+        Сохраняет результат в кеше, вытесняя самую давно использованную запись при переполнении.
+
+        Args:
+            key (Hashable): Ключ запроса.
+            generation (int): Поколение библиотеки, для которого получен результат.
+            result (tuple): Результат запроса.
+        """
+
+        if not self.max_size:
+            return
+
+        with self._lock:
+            self._entries[key] = (generation, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Удаляет все записи и сбрасывает статистику."""
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Возвращает статистику кеша.
+
+        Returns:
+            dict: Число попаданий ('hits') и промахов ('misses'), доля попаданий ('hit_rate'),
+                текущий ('size') и максимальный ('max_size') размер.
+
+        Example:
+            >>> cache.stats()
+            {'hits': 3, 'misses': 1, 'hit_rate': 0.75, 'size': 1, 'max_size': 128}
+        """
+
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'size': len(self._entries),
+                'max_size': self.max_size
+            }
@@ -0,0 +1,139 @@
+import os
+import struct
+import threading
+
+from contextlib import contextmanager
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows: рекомендательные блокировки недоступны
+    fcntl = None
+
+
+class FileLock:
+    """
+    Межпроцессная блокировка хранилища и счетчик поколений.
+
+    Блокировка реализована рекомендательной блокировкой `fcntl.flock` на служебном файле рядом
+    с хранилищем. В этом же файле хранится состояние, общее для всех процессов:
+
+    - поколение (generation) - номер, который увеличивается при каждой фиксации изменений
+      в хранилище. По нему процесс за одно чтение 16 байт узнает, нужно ли перечитывать хранилище;
+    - последний выданный ID, чтобы ID новых книг были уникальны во всех процессах, даже если
+      их изменения еще не записаны в хранилище (режим отложенной записи).
+
+    Захват реентерабелен в пределах объекта: вложенные захваты только увеличивают счетчик.
+    Объект не синхронизирует потоки - вызывающая сторона должна сериализовать захваты
+    (библиотека делает это своей блокировкой). На платформах без `fcntl` блокировка не выполняется,
+    а общее состояние по-прежнему читается и записывается.
+
+    Attributes:
+        path (str): Путь к файлу блокировки.
+    """
+
+    # Поколение, последний выданный ID.
+    STATE = struct.Struct('<QQ')
+
+    def __init__(self, path: str):
+        """
+        Инициализация блокировки. Создает файл блокировки, если его нет.
+
+        Args:
+            path (str): Путь к файлу блокировки.
+        """
+
+        self.path = path
+        # O_BINARY (только Windows) отключает преобразование переводов строк в упакованном состоянии.
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644)
+        self._depth = 0
+        # Позиционирование и чтение (запись) - две операции над общим дескриптором, поэтому
+        # они выполняются под блокировкой: состояние читается и вне блокировки библиотеки.
+        self._state_lock = threading.Lock()
+
+    @property
+    def locked(self) -> bool:
+        """
+        Удерживается ли блокировка этим объектом.
+
+        Returns:
+            bool: True, если блокировка захвачена.
+        """
+
+        return self._depth > 0
+
+    def acquire(self, exclusive: bool) -> None:
+        """
+        Захватывает блокировку, ожидая ее освобождения другими процессами.
+
+        Во вложенном захвате режим не меняется.
+
+        Args:
+            exclusive (bool): True - исключительная блокировка (запись), False - разделяемая (чтение).
+        """
+
+        if not self._depth and fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        self._depth += 1
+
+    def release(self) -> None:
+        """Освобождает блокировку."""
+
+        self._depth -= 1
+        if not self._depth and fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        """Контекстный менеджер исключительной блокировки."""
+
+        self.acquire(exclusive=True)
+        try:
+            yield
+        finally:
+            self.release()
+
+    @contextmanager
+    def shared(self) -> Iterator[None]:
+        """Контекстный менеджер разделяемой блокировки."""
+
+        self.acquire(exclusive=False)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def read_state(self) -> tuple[int, int]:
+        """
+        Читает общее состояние процессов.
+
+        Returns:
+            tuple[int, int]: Поколение хранилища и последний выданный ID (нули, если состояния еще нет).
+        """
+
+        with self._state_lock:
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            data = os.read(self._fd, self.STATE.size)
+        if len(data) < self.STATE.size:
+            return 0, 0
+        return self.STATE.unpack(data)
+
+    def write_state(self, generation: int, last_id: int) -> None:
+        """
+        Записывает общее состояние процессов. Вызывается под исключительной блокировкой.
+
+        Args:
+            generation (int): Поколение хранилища.
+            last_id (int): Последний выданный ID.
+        """
+
+        with self._state_lock:
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            os.write(self._fd, self.STATE.pack(generation, last_id))
+
+    def close(self) -> None:
+        """Закрывает файл блокировки."""
+
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
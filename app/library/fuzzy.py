@@ -0,0 +1,201 @@
+def levenshtein(first: str, second: str) -> int:
+    """
+    Вычисляет расстояние Левенштейна (число вставок, удалений и замен символов) между строками.
+
+    Используется битово-параллельный алгоритм Майерса (в формулировке Хюрё): столбец матрицы
+    динамического программирования хранится как битовые векторы положительных и отрицательных
+    приращений, поэтому на каждый символ длинной строки выполняется несколько операций с целыми
+    числами вместо прохода по всему столбцу.
+
+    Args:
+        first (str): Первая строка.
+        second (str): Вторая строка.
+
+    Returns:
+        int: Расстояние редактирования.
+    """
+
+    if len(first) < len(second):
+        first, second = second, first
+    if not second:
+        return len(first)
+
+    masks: dict[str, int] = {}
+    for i, char in enumerate(second):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    full = (1 << len(second)) - 1
+    last = 1 << (len(second) - 1)
+
+    positive, negative = full, 0
+    score = len(second)
+    for char in first:
+        eq = masks.get(char, 0)
+        xv = eq | negative
+        xh = (((eq & positive) + positive) ^ positive) | eq
+        ph = negative | ~(xh | positive)
+        mh = positive & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        positive = (mh | ~(xv | ph)) & full
+        negative = ph & xv
+    return score
+
+
+def normalize(text: str) -> str:
+    """
+    Приводит строку к виду для нечеткого сравнения: нижний регистр, одиночные пробелы.
+
+    Args:
+        text (str): Строка.
+
+    Returns:
+        str: Нормализованная строка.
+    """
+
+    return ' '.join(text.lower().split())
+
+
+def fuzzy_terms(text: str) -> set[str]:
+    """
+    Возвращает термы значения для нечеткого поиска: значение целиком и его отдельные слова.
+
+    Благодаря словам опечатка в одной фамилии («Толстои») находит автора «Толстой Л.Н.».
+
+    Args:
+        text (str): Значение поля книги.
+
+    Returns:
+        set[str]: Нормализованные термы.
+    """
+
+    value = normalize(text)
+    terms = set(value.split())
+    terms.add(value)
+    return terms
+
+
+class BKTree:
+    """
+    BK-дерево (Burkhard-Keller) для поиска термов в пределах расстояния Левенштейна.
+
+    Каждый узел хранит терм и потомков, пронумерованных расстоянием до него. По неравенству
+    треугольника при поиске с допуском k достаточно спускаться только в потомков с номерами
+    от d - k до d + k, где d - расстояние до узла, поэтому расстояние вычисляется лишь для малой
+    части термов. Для каждого терма хранится множество ключей (ID книг).
+
+    Дерево поддерживается инкрементально: термы без ключей остаются в дереве как удаленные
+    и пропускаются при поиске, а когда их становится больше, чем действующих, дерево перестраивается.
+    """
+
+    def __init__(self):
+        """Инициализация пустого дерева."""
+
+        self._root: list | None = None
+        self._keys: dict[str, set[int]] = {}
+        self._dead = 0
+
+    def __len__(self) -> int:
+        return len(self._keys) - self._dead
+
+    def _insert(self, term: str) -> None:
+        """
+        Вставляет новый терм в дерево.
+
+        Args:
+            term (str): Терм.
+        """
+
+        if self._root is None:
+            self._root = [term, {}]
+            return
+
+        node = self._root
+        while True:
+            distance = levenshtein(term, node[0])
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = [term, {}]
+                return
+            node = child
+
+    def add(self, key: int, term: str) -> None:
+        """
+        Добавляет ключ к терму, вставляя терм в дерево при необходимости.
+
+        Args:
+            key (int): Ключ (ID книги).
+            term (str): Нормализованный терм.
+        """
+
+        keys = self._keys.get(term)
+        if keys is None:
+            self._keys[term] = {key}
+            self._insert(term)
+            return
+        if not keys:
+            self._dead -= 1
+        keys.add(key)
+
+    def remove(self, key: int, term: str) -> None:
+        """
+        Удаляет ключ из терма. Терм без ключей помечается удаленным.
+
+        Args:
+            key (int): Ключ (ID книги).
+            term (str): Нормализованный терм.
+        """
+
+        keys = self._keys.get(term)
+        if not keys or key not in keys:
+            return
+        keys.discard(key)
+        if not keys:
+            self._dead += 1
+            if self._dead > len(self._keys) - self._dead:
+                self._rebuild()
+
+    def _rebuild(self) -> None:
+        """Перестраивает дерево только из действующих термов."""
+
+        self._keys = {term: keys for term, keys in self._keys.items() if keys}
+        self._dead = 0
+        self._root = None
+        for term in self._keys:
+            self._insert(term)
+
+    def clear(self) -> None:
+        """Очищает дерево."""
+
+        self._root = None
+        self._keys.clear()
+        self._dead = 0
+
+    def search(self, term: str, max_distance: int) -> dict[int, int]:
+        """
+        Ищет ключи термов, находящихся от запроса на расстоянии не больше `max_distance`.
+
+        Args:
+            term (str): Нормализованный запрос.
+            max_distance (int): Максимальное расстояние Левенштейна.
+
+        Returns:
+            dict[int, int]: Ключ -> наименьшее расстояние среди его термов.
+        """
+
+        found: dict[int, int] = {}
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node_term, children = stack.pop()
+            distance = levenshtein(term, node_term)
+            if distance <= max_distance:
+                for key in self._keys[node_term]:
+                    if distance < found.get(key, max_distance + 1):
+                        found[key] = distance
+            for child_distance, child in children.items():
+                if distance - max_distance <= child_distance <= distance + max_distance:
+                    stack.append(child)
+        return found
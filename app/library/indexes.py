@@ -0,0 +1,500 @@
+import threading
+
+from array import array
+from bisect import bisect_left, insort
+from typing import Hashable, Iterable
+
+
+class NGramIndex:
+    """
+    Инвертированный n-граммный индекс для поиска подстроки без учета регистра.
+
+    Для каждой n-граммы хранится множество ключей (ID книг), в значениях которых она встречается.
+    Поиск подстроки пересекает списки ключей всех n-грамм запроса и затем проверяет кандидатов,
+    поэтому результат совпадает с проверкой `keyword.lower() in text.lower()` по всем значениям.
+    Порядок результатов соответствует порядку добавления ключей.
+
+    Attributes:
+        n (int): Длина n-граммы.
+    """
+
+    def __init__(self, n: int = 3):
+        """
+        Инициализация индекса.
+
+        Args:
+            n (int, optional): Длина n-граммы (по умолчанию 3).
+        """
+
+        self.n = n
+        self._postings: dict[str, set[int]] = {}
+        self._texts: dict[int, tuple[int, str]] = {}
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def _ngrams(self, text: str) -> set[str]:
+        """
+        Возвращает множество n-грамм строки.
+
+        Args:
+            text (str): Строка в нижнем регистре.
+
+        Returns:
+            set[str]: Множество n-грамм.
+        """
+
+        return {text[i:i + self.n] for i in range(len(text) - self.n + 1)}
+
+    def add(self, key: int, text: str) -> None:
+        """
+        Добавляет значение в индекс.
+
+        Args:
+            key (int): Ключ значения (ID книги).
+            text (str): Индексируемое значение.
+        """
+
+        if key in self._texts:
+            self.remove(key)
+
+        lowered = text.lower()
+        self._seq += 1
+        self._texts[key] = (self._seq, lowered)
+        for ngram in self._ngrams(lowered):
+            self._postings.setdefault(ngram, set()).add(key)
+
+    def remove(self, key: int) -> None:
+        """
+        Удаляет значение из индекса.
+
+        Args:
+            key (int): Ключ значения (ID книги).
+        """
+
+        entry = self._texts.pop(key, None)
+        if entry is None:
+            return
+
+        for ngram in self._ngrams(entry[1]):
+            keys = self._postings.get(ngram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[ngram]
+
+    def clear(self) -> None:
+        """Очищает индекс."""
+
+        self._postings.clear()
+        self._texts.clear()
+        self._seq = 0
+
+    def search(self, keyword: str) -> list[int]:
+        """
+        Ищет ключи, значения которых содержат подстроку без учета регистра.
+
+        Запросы короче n символов выполняются перебором заранее приведенных к нижнему регистру значений.
+
+        Args:
+            keyword (str): Искомая подстрока.
+
+        Returns:
+            list[int]: Ключи найденных значений в порядке добавления.
+        """
+
+        keyword = keyword.lower()
+        if len(keyword) < self.n:
+            return [key for key, (_, text) in self._texts.items() if keyword in text]
+
+        postings = []
+        for ngram in self._ngrams(keyword):
+            keys = self._postings.get(ngram)
+            if not keys:
+                return []
+            postings.append(keys)
+
+        postings.sort(key=len)
+        candidates = postings[0].intersection(*postings[1:])
+        matched = [key for key in candidates if keyword in self._texts[key][1]]
+        matched.sort(key=lambda key: self._texts[key][0])
+        return matched
+
+    def estimate(self, keyword: str) -> int:
+        """
+        Оценивает сверху число значений, содержащих подстроку, без выполнения поиска.
+
+        Оценка - размер самого короткого списка ключей среди n-грамм запроса
+        (для запросов короче n символов - число всех значений).
+
+        Args:
+            keyword (str): Искомая подстрока.
+
+        Returns:
+            int: Верхняя оценка числа найденных значений.
+        """
+
+        keyword = keyword.lower()
+        if len(keyword) < self.n:
+            return len(self._texts)
+        return min(len(self._postings.get(ngram, ())) for ngram in self._ngrams(keyword))
+
+
+class SortedIndex:
+    """
+    Упорядоченный индекс по целочисленному значению на основе `bisect`.
+
+    Каждая запись упаковывается в одно 64-битное число `(значение << 32) | ключ` и хранится
+    в компактном массиве `array('Q')` (8 байт на запись вместо кортежа из двух объектов).
+    Добавления накапливаются в конце массива, а сортировка выполняется лениво перед первым запросом,
+    поэтому массовая загрузка стоит O(n log n), а запросы по точному значению и по диапазону
+    выполняются за O(log n + k).
+
+    Attributes:
+        KEY_BITS (int): Число бит, отводимых под ключ. Ключи и значения должны быть
+            неотрицательными и меньше 2 ** KEY_BITS.
+    """
+
+    KEY_BITS = 32
+    _KEY_MASK = (1 << KEY_BITS) - 1
+
+    def __init__(self):
+        """Инициализация индекса."""
+
+        self._entries = array('Q')
+        self._sorted = True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _pack(self, key: int, value: int) -> int:
+        """
+        Упаковывает пару (значение, ключ) в одно число с сохранением порядка.
+
+        Args:
+            key (int): Ключ значения.
+            value (int): Индексируемое значение.
+
+        Raises:
+            ValueError: Если ключ или значение выходят за допустимый диапазон.
+
+        Returns:
+            int: Упакованная запись.
+        """
+
+        if not (0 <= key <= self._KEY_MASK and 0 <= value <= self._KEY_MASK):
+            raise ValueError(f'Ключ и значение индекса должны быть в диапазоне от 0 до {self._KEY_MASK}')
+        return (value << self.KEY_BITS) | key
+
+    def _ensure_sorted(self) -> None:
+        """Сортирует накопленные записи, если это требуется."""
+
+        if not self._sorted:
+            self._entries = array('Q', sorted(self._entries))
+            self._sorted = True
+
+    def add(self, key: int, value: int) -> None:
+        """
+        Добавляет значение в индекс.
+
+        Args:
+            key (int): Ключ значения (ID книги).
+            value (int): Индексируемое значение.
+        """
+
+        entry = self._pack(key, value)
+        if self._sorted and self._entries and entry < self._entries[-1]:
+            self._sorted = False
+        self._entries.append(entry)
+
+    def remove(self, key: int, value: int) -> None:
+        """
+        Удаляет значение из индекса.
+
+        Args:
+            key (int): Ключ значения (ID книги).
+            value (int): Индексированное значение.
+        """
+
+        self._ensure_sorted()
+        entry = self._pack(key, value)
+        position = bisect_left(self._entries, entry)
+        if position < len(self._entries) and self._entries[position] == entry:
+            del self._entries[position]
+
+    def clear(self) -> None:
+        """Очищает индекс."""
+
+        self._entries = array('Q')
+        self._sorted = True
+
+    def range(self, low: int, high: int) -> list[int]:
+        """
+        Возвращает ключи, значения которых лежат в диапазоне [low, high].
+
+        Args:
+            low (int): Нижняя граница диапазона включительно.
+            high (int): Верхняя граница диапазона включительно.
+
+        Returns:
+            list[int]: Ключи в порядке возрастания значения, а при равных значениях - ключа.
+        """
+
+        start, end = self._bounds(low, high)
+        return [entry & self._KEY_MASK for entry in self._entries[start:end]]
+
+    def count(self, low: int, high: int) -> int:
+        """
+        Возвращает число ключей, значения которых лежат в диапазоне [low, high], за O(log n).
+
+        Args:
+            low (int): Нижняя граница диапазона включительно.
+            high (int): Верхняя граница диапазона включительно.
+
+        Returns:
+            int: Число ключей.
+        """
+
+        start, end = self._bounds(low, high)
+        return max(end - start, 0)
+
+    def _bounds(self, low: int, high: int) -> tuple[int, int]:
+        """
+        Находит границы записей диапазона [low, high] в отсортированном массиве.
+
+        Args:
+            low (int): Нижняя граница диапазона включительно.
+            high (int): Верхняя граница диапазона включительно.
+
+        Returns:
+            tuple[int, int]: Позиции первой записи диапазона и записи, следующей за последней.
+        """
+
+        self._ensure_sorted()
+        start = bisect_left(self._entries, max(low, 0) << self.KEY_BITS)
+        end = bisect_left(self._entries, max(high + 1, 0) << self.KEY_BITS)
+        return start, end
+
+
+class GroupIndex:
+    """
+    Индекс принадлежности ключей к группам (например, книг к статусам).
+
+    Для каждой группы хранится множество ключей, поэтому число ключей в группе возвращается
+    за O(1), а сами ключи - без перебора остальных значений.
+    """
+
+    def __init__(self, groups: Iterable[Hashable] = ()):
+        """
+        Инициализация индекса.
+
+        Args:
+            groups (Iterable[Hashable], optional): Заранее известные группы. Они присутствуют
+                в `counts` даже без ключей.
+        """
+
+        self._groups: dict[Hashable, set[int]] = {group: set() for group in groups}
+
+    def __len__(self) -> int:
+        return sum(len(keys) for keys in self._groups.values())
+
+    def add(self, key: int, group: Hashable) -> None:
+        """
+        Добавляет ключ в группу.
+
+        Args:
+            key (int): Ключ (ID книги).
+            group (Hashable): Группа.
+        """
+
+        self._groups.setdefault(group, set()).add(key)
+
+    def remove(self, key: int, group: Hashable) -> None:
+        """
+        Удаляет ключ из группы.
+
+        Args:
+            key (int): Ключ (ID книги).
+            group (Hashable): Группа.
+        """
+
+        keys = self._groups.get(group)
+        if keys is not None:
+            keys.discard(key)
+
+    def move(self, key: int, old_group: Hashable, new_group: Hashable) -> None:
+        """
+        Переносит ключ из одной группы в другую.
+
+        Args:
+            key (int): Ключ (ID книги).
+            old_group (Hashable): Прежняя группа.
+            new_group (Hashable): Новая группа.
+        """
+
+        if old_group != new_group:
+            self.remove(key, old_group)
+            self.add(key, new_group)
+
+    def clear(self) -> None:
+        """Очищает индекс, сохраняя известные группы."""
+
+        for keys in self._groups.values():
+            keys.clear()
+
+    def count(self, group: Hashable) -> int:
+        """
+        Возвращает число ключей в группе за O(1).
+
+        Args:
+            group (Hashable): Группа.
+
+        Returns:
+            int: Число ключей.
+        """
+
+        return len(self._groups.get(group, ()))
+
+    def counts(self) -> dict[Hashable, int]:
+        """
+        Возвращает число ключей в каждой группе.
+
+        Returns:
+            dict[Hashable, int]: Группа -> число ключей.
+        """
+
+        return {group: len(keys) for group, keys in self._groups.items()}
+
+    def keys(self, group: Hashable) -> list[int]:
+        """
+        Возвращает ключи группы.
+
+        Args:
+            group (Hashable): Группа.
+
+        Returns:
+            list[int]: Ключи группы в порядке возрастания.
+        """
+
+        return sorted(self._groups.get(group, ()))
+
+
+class PrefixIndex:
+    """
+    Индекс различных строковых значений для подсказок по префиксу без учета регистра.
+
+    Значения хранятся в массиве, отсортированном по нижнему регистру, поэтому подсказки
+    находятся двоичным поиском за O(log n + k) - время зависит от длины префикса и числа
+    подсказок, а не от размера каталога. В массиве хранятся ссылки на те же строки, что и в книгах,
+    а для каждого значения - число книг с ним. Новые значения накапливаются и вливаются в массив
+    перед ближайшим запросом; значения, оставшиеся без книг, пропускаются при поиске и удаляются
+    из массива, когда их становится больше, чем действующих.
+
+    Attributes:
+        MERGE_THRESHOLD (int): Число новых значений, до которого они вставляются в массив
+            по одному (`insort`), а не полной пересортировкой.
+    """
+
+    MERGE_THRESHOLD = 64
+
+    def __init__(self):
+        """Инициализация индекса."""
+
+        self._counts: dict[str, int] = {}
+        self._values: list[str] = []
+        self._pending: list[str] = []
+        self._dead = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._counts) - self._dead
+
+    def add(self, value: str) -> None:
+        """
+        Учитывает значение одной книги.
+
+        Args:
+            value (str): Значение поля книги.
+        """
+
+        count = self._counts.get(value)
+        if count is None:
+            self._counts[value] = 1
+            self._pending.append(value)
+            return
+        if not count:
+            self._dead -= 1
+        self._counts[value] = count + 1
+
+    def remove(self, value: str) -> None:
+        """
+        Убирает значение одной книги.
+
+        Args:
+            value (str): Значение поля книги.
+        """
+
+        count = self._counts.get(value)
+        if not count:
+            return
+        self._counts[value] = count - 1
+        if count == 1:
+            self._dead += 1
+
+    def clear(self) -> None:
+        """Очищает индекс."""
+
+        self._counts = {}
+        self._values = []
+        self._pending = []
+        self._dead = 0
+
+    def _merge(self) -> None:
+        """
+        Вливает новые значения в отсортированный массив и удаляет значения без книг.
+        """
+
+        if self._dead > len(self._counts) - self._dead:
+            self._counts = {value: count for value, count in self._counts.items() if count}
+            self._values = [value for value in self._values if value in self._counts]
+            self._pending = [value for value in self._pending if value in self._counts]
+            self._dead = 0
+        if not self._pending:
+            return
+        if len(self._pending) <= self.MERGE_THRESHOLD:
+            for value in self._pending:
+                insort(self._values, value, key=str.lower)
+        else:
+            self._values.extend(self._pending)
+            self._values.sort(key=str.lower)
+        self._pending = []
+
+    def suggest(self, prefix: str, limit: int) -> list[str]:
+        """
+        Возвращает значения, начинающиеся с префикса без учета регистра.
+
+        Args:
+            prefix (str): Префикс.
+            limit (int): Максимальное число подсказок.
+
+        Returns:
+            list[str]: Значения в алфавитном порядке без учета регистра.
+        """
+
+        prefix = prefix.lower()
+        result = []
+        # Запросы выполняются и из читающих потоков библиотеки, а слияние изменяет массив,
+        # поэтому индекс защищен собственной блокировкой.
+        with self._lock:
+            self._merge()
+            values = self._values
+            position = bisect_left(values, prefix, key=str.lower)
+            while position < len(values) and len(result) < limit:
+                value = values[position]
+                if not value.lower().startswith(prefix):
+                    break
+                if self._counts.get(value):
+                    result.append(value)
+                position += 1
+        return result
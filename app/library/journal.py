@@ -0,0 +1,88 @@
+import json
+import os
+
+from typing import Iterator
+
+
+class Journal:
+    """
+    Журнал операций библиотеки в формате JSON Lines.
+
+    Каждая изменяющая операция дописывается в конец файла отдельной строкой, поэтому
+    стоимость записи не зависит от размера каталога. При загрузке журнал воспроизводится
+    поверх базового снимка, а при уплотнении (compaction) очищается.
+
+    Attributes:
+        path (str): Путь к файлу журнала.
+        size (int): Текущий размер журнала в байтах.
+        entries (int): Количество операций в журнале.
+    """
+
+    def __init__(self, path: str):
+        """
+        Инициализация журнала.
+
+        Args:
+            path (str): Путь к файлу журнала.
+        """
+
+        self.path = path
+        self.size = os.path.getsize(path) if os.path.exists(path) else 0
+        self.entries = 0
+
+    def append(self, operations: list[dict]) -> int:
+        """
+        Дописывает операции в конец журнала одной строкой.
+
+        Несколько операций записываются как одна пакетная операция {'op': 'batch', 'operations': [...]},
+        поэтому при аварийном завершении пакет либо воспроизводится целиком, либо отбрасывается.
+
+        Args:
+            operations (list[dict]): Операции, например [{'op': 'delete', 'id': 1}].
+
+        Returns:
+            int: Число записанных байтов.
+        """
+
+        record = operations[0] if len(operations) == 1 else {'op': 'batch', 'operations': operations}
+        line = (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+        with open(self.path, 'ab') as file:
+            file.write(line)
+            # Размер берется из файла, так как журнал могут дописывать и другие процессы.
+            self.size = file.tell()
+        self.entries += len(operations)
+        return len(line)
+
+    def replay(self) -> Iterator[dict]:
+        """
+        Последовательно читает операции из журнала.
+
+        Оборванная последняя строка (например, после аварийного завершения) пропускается,
+        пакетные операции разворачиваются в исходные.
+
+        Yields:
+            dict: Очередная операция журнала.
+        """
+
+        self.entries = 0
+        self.size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    operations = record['operations'] if record.get('op') == 'batch' else [record]
+                    self.entries += len(operations)
+                    yield from operations
+        except FileNotFoundError:
+            return
+
+    def clear(self) -> None:
+        """Удаляет все операции из журнала."""
+
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self.size = 0
+        self.entries = 0
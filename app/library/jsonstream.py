@@ -0,0 +1,182 @@
+import json
+import re
+
+from typing import Any, Iterable, Iterator, TextIO
+
+CHUNK_SIZE = 64 * 1024
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+class _JsonStreamReader:
+    """
+    Буферизированный посимвольный читатель JSON-документа.
+
+    Читает файл блоками фиксированного размера и декодирует отдельные значения
+    через `json.JSONDecoder.raw_decode`, поэтому в памяти одновременно находится
+    только текущий блок и разбираемое значение.
+    """
+
+    def __init__(self, file: TextIO, chunk_size: int):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """
+        Дочитывает следующий блок файла в буфер, отбрасывая уже разобранную часть.
+
+        Returns:
+            bool: False, если файл прочитан до конца.
+        """
+
+        if self._eof:
+            return False
+
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._pos)
+
+    def peek(self) -> str:
+        """
+        Возвращает следующий значимый символ, не потребляя его.
+
+        Returns:
+            str: Символ или пустая строка в конце файла.
+        """
+
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer) or not self._fill():
+                break
+        return self._buffer[self._pos:self._pos + 1]
+
+    def next_char(self) -> str:
+        """
+        Возвращает и потребляет следующий значимый символ.
+
+        Returns:
+            str: Символ или пустая строка в конце файла.
+        """
+
+        char = self.peek()
+        self._pos += len(char)
+        return char
+
+    def expect(self, char: str) -> None:
+        """
+        Потребляет ожидаемый символ.
+
+        Args:
+            char (str): Ожидаемый символ.
+
+        Raises:
+            json.JSONDecodeError: Если следующий символ отличается от ожидаемого.
+        """
+
+        if self.next_char() != char:
+            raise self.error(f'Ожидался символ {char!r}')
+
+    def value(self) -> Any:
+        """
+        Декодирует следующее JSON-значение целиком.
+
+        Если значение не помещается в буфер или может продолжаться в следующем блоке
+        (например, число на границе блока), буфер дочитывается и разбор повторяется.
+
+        Raises:
+            json.JSONDecodeError: Если значение некорректно.
+
+        Returns:
+            Any: Декодированное значение.
+        """
+
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+def iter_json_object(
+        file: TextIO,
+        stream_keys: Iterable[str] = (),
+        chunk_size: int = CHUNK_SIZE
+) -> Iterator[tuple[str, Any]]:
+    """
+    Потоково разбирает JSON-объект верхнего уровня.
+
+    Для каждого поля объекта возвращает пару (ключ, значение). Если ключ указан в `stream_keys`
+    и его значение - массив, то вместо массива возвращается отдельная пара для каждого элемента,
+    поэтому массив никогда не материализуется целиком. Поля могут идти в любом порядке.
+
+    Args:
+        file (TextIO): Открытый текстовый файл.
+        stream_keys (Iterable[str], optional): Ключи массивов, которые нужно разбирать поэлементно.
+        chunk_size (int, optional): Размер блока чтения в символах (по умолчанию 64 КиБ).
+
+    Raises:
+        json.JSONDecodeError: Если документ некорректен или не является объектом.
+
+    Yields:
+        tuple[str, Any]: Ключ поля и его значение (или очередной элемент потокового массива).
+
+    Example:
+        >>> with open('library.json', encoding='utf-8') as file:
+        ...     for key, value in iter_json_object(file, stream_keys=('books',)):
+        ...         print(key, value)
+        books {'id': 1, ...}
+        last_id 1
+    """
+
+    stream_keys = set(stream_keys)
+    reader = _JsonStreamReader(file, chunk_size)
+
+    reader.expect('{')
+    if reader.peek() == '}':
+        reader.next_char()
+        return
+
+    while True:
+        key = reader.value()
+        if not isinstance(key, str):
+            raise reader.error('Ключ объекта должен быть строкой')
+        reader.expect(':')
+
+        if key in stream_keys and reader.peek() == '[':
+            reader.next_char()
+            if reader.peek() == ']':
+                reader.next_char()
+            else:
+                while True:
+                    yield key, reader.value()
+                    separator = reader.next_char()
+                    if separator == ']':
+                        break
+                    if separator != ',':
+                        raise reader.error('Ожидался символ \',\' или \']\'')
+        else:
+            yield key, reader.value()
+
+        separator = reader.next_char()
+        if separator == '}':
+            return
+        if separator != ',':
+            raise reader.error('Ожидался символ \',\' или \'}\'')
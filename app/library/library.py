@@ -1,25 +1,254 @@
-import json
-
+import heapq
+import math
+import sys
+import threading
+import time
+
+from contextlib import contextmanager
+from itertools import islice
+from functools import wraps
+from typing import Callable, Iterable, Iterator, TextIO
+
+from . import bulk
 from .book import Book, BookStatus
+from .cache import SearchCache
+from .filelock import FileLock
+from .fuzzy import BKTree, fuzzy_terms, levenshtein, normalize
+from .indexes import GroupIndex, NGramIndex, PrefixIndex, SortedIndex
+from .locks import ReadWriteLock
+from .metrics import Metrics
+from .query import Contains, IdEquals, Predicate, Query, StatusEquals, YearBetween
+from .sharded_storage import ShardedStorage
+from .sqlite_storage import SqliteStorage
+from .storage import JsonStorage, StorageBackend
+
+
+def _write_locked(method: Callable) -> Callable:
+    """
+    Декоратор, выполняющий метод библиотеки под ее блокировкой на запись.
+
+    Args:
+        method (Callable): Метод класса `Library`, изменяющий библиотеку.
+
+    Returns:
+        Callable: Обернутый метод.
+    """
+
+    @wraps(method)
+    def _wrapper(self: 'Library', *args, **kwargs):
+        with self._writing():
+            return method(self, *args, **kwargs)
+
+    return _wrapper
+
+
+def _read_locked(method: Callable) -> Callable:
+    """
+    Декоратор, выполняющий метод библиотеки под ее блокировкой на чтение.
+
+    Методы чтения выполняются параллельно друг с другом, но не с изменениями библиотеки.
+    В многопроцессном режиме перед чтением библиотека перечитывает хранилище, если его изменил
+    другой процесс.
+
+    Args:
+        method (Callable): Метод класса `Library`, только читающий библиотеку.
+
+    Returns:
+        Callable: Обернутый метод.
+    """
+
+    @wraps(method)
+    def _wrapper(self: 'Library', *args, **kwargs):
+        if self._file_lock is not None and not self._lock.held():
+            self.refresh()
+        with self._lock.read():
+            return method(self, *args, **kwargs)
+
+    return _wrapper
+
+
+def _timed(operation: str) -> Callable[[Callable], Callable]:
+    """
+    Декоратор, учитывающий вызов и длительность метода библиотеки в ее метриках (`Library.metrics`).
+
+    Длительность включает ожидание блокировок. Если метрики выключены, метод вызывается напрямую.
+
+    Args:
+        operation (str): Название операции в метриках.
+
+    Returns:
+        Callable[[Callable], Callable]: Декоратор.
+    """
+
+    def _decorator(method: Callable) -> Callable:
+        @wraps(method)
+        def _wrapper(self: 'Library', *args, **kwargs):
+            if not self.metrics.enabled:
+                return method(self, *args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self.metrics.observe(operation, time.perf_counter() - start)
+
+        return _wrapper
+
+    return _decorator
+
+
+class _Transaction:
+    """
+    Состояние открытой транзакции библиотеки.
+
+    Хранит отложенные операции для хранилища и сведения для отката изменений в памяти.
+
+    Attributes:
+        last_id (int): Последний использованный ID на момент начала транзакции.
+        operations (list[dict]): Отложенные операции для хранилища.
+        added (list[Book]): Книги, добавленные в транзакции.
+        statuses (list[tuple[Book, BookStatus]]): Книги с измененным статусом и их прежние статусы.
+        snapshot (list[Book] | None): Книги на момент первого удаления в транзакции. Нужны, чтобы
+            при откате восстановить удаленные книги на прежних местах.
+    """
+
+    def __init__(self, last_id: int):
+        self.last_id = last_id
+        self.operations: list[dict] = []
+        self.added: list[Book] = []
+        self.statuses: list[tuple[Book, BookStatus]] = []
+        self.snapshot: list[Book] | None = None
 
 
 class Library:
-    """Класс, управляющий операциями библиотеки."""
+    """
+    Класс, управляющий операциями библиотеки.
 
-    SEARCH_FIELDS = ('title', 'author', 'year')
+    Библиотека безопасна для использования из нескольких потоков: поиск и просмотр выполняются
+    под блокировкой на чтение и не мешают друг другу, а изменения сериализуются блокировкой на запись.
+    """
 
-    def __init__(self, storage: str = 'library.json'):
+    SEARCH_FIELDS = ('title', 'author', 'year')
+    TEXT_INDEX_FIELDS = ('title', 'author')
+    JSON_EXTENSIONS = ('.json',)
+    SQLITE_EXTENSIONS = ('.db', '.sqlite', '.sqlite3')
+    SHARDED_EXTENSIONS = ('.shards',)
+    # Число строк таблицы, которые выводятся одной записью в поток, если вывод не разбит на страницы.
+    DISPLAY_CHUNK_SIZE = 1000
+    # Число записей в пачке, которую `import_books` передает на проверку одному процессу.
+    IMPORT_CHUNK_SIZE = 10000
+    # Число книг, которые `export` сериализует и записывает в поток одной записью.
+    EXPORT_CHUNK_SIZE = 1000
+
+    def __init__(
+            self,
+            storage: str | StorageBackend = 'library.json',
+            journal: bool = False,
+            journal_max_size: int = 1024 * 1024,
+            journal_max_ratio: float = 0.5,
+            text_index: bool = False,
+            binary_snapshot: bool = False,
+            flush_interval: float | None = None,
+            multiprocess: bool = False,
+            search_cache_size: int = 128,
+            fuzzy_index: bool = False,
+            prefix_index: bool = False,
+            metrics: bool = False
+    ):
         """
         Инициализация библиотеки.
 
         Args:
-            storage (str, optional): Путь к файлу для хранения данных библиотеки (по умолчанию 'library.json').
+            storage (str | StorageBackend, optional): Путь к файлу для хранения данных библиотеки
+                (по умолчанию 'library.json') или готовое хранилище. Тип хранилища выбирается
+                по расширению файла: JSON (`JSON_EXTENSIONS`), SQLite (`SQLITE_EXTENSIONS`)
+                или каталог сегментов по диапазонам ID (`SHARDED_EXTENSIONS`).
+            journal (bool, optional): Включает журналируемый режим JSON-хранилища: изменения дописываются
+                в журнал операций вместо полной перезаписи файла (по умолчанию False).
+            journal_max_size (int, optional): Размер журнала в байтах, после превышения которого
+                выполняется уплотнение (по умолчанию 1 МиБ).
+            journal_max_ratio (float, optional): Отношение числа операций в журнале к числу книг,
+                после превышения которого выполняется уплотнение (по умолчанию 0.5).
+            text_index (bool, optional): Строит триграммный индекс по полям `TEXT_INDEX_FIELDS`
+                для ускорения поиска подстроки (по умолчанию False).
+            binary_snapshot (bool, optional): Ведет рядом с JSON-файлом бинарный снимок, из которого
+                книги загружаются без разбора JSON и повторной валидации (по умолчанию False).
+            flush_interval (float | None, optional): Включает режим отложенной записи: изменения
+                накапливаются в памяти и записываются фоновым потоком не чаще одного раза
+                за указанное число секунд. 0 - изменения накапливаются до явного вызова `flush`
+                без фонового потока. None - каждое изменение записывается сразу (по умолчанию).
+            multiprocess (bool, optional): Включает совместную работу нескольких процессов с одним
+                хранилищем: изменения выполняются под межпроцессной блокировкой файла `<хранилище>.lock`,
+                хранилище перечитывается только после фиксации изменений другим процессом, а ID новых
+                книг уникальны во всех процессах (по умолчанию False). Режим должен быть включен
+                во всех процессах, работающих с хранилищем.
+            search_cache_size (int, optional): Максимальное число результатов `search_books`
+                в LRU-кеше (по умолчанию 128). 0 - кеш выключен.
+            fuzzy_index (bool, optional): Строит BK-деревья по полям `TEXT_INDEX_FIELDS` для ускорения
+                нечеткого поиска `search_fuzzy` (по умолчанию False).
+            prefix_index (bool, optional): Строит индексы различных значений полей `TEXT_INDEX_FIELDS`
+                для подсказок `suggest` за время, не зависящее от размера каталога (по умолчанию False).
+            metrics (bool, optional): Сразу включает запись метрик операций (по умолчанию False).
+                Метрики можно включить и выключить во время работы через атрибут `metrics`.
         """
 
-        self._storage = self._validate_storage(storage)
-        self._books: list[Book] = []
+        if isinstance(storage, str):
+            self._storage = self._validate_storage(storage)
+            self._backend = self._create_backend(
+                self._storage, journal, journal_max_size, journal_max_ratio, binary_snapshot
+            )
+        else:
+            self._backend = storage
+            self._storage = storage.path
+        self._text_indexes: dict[str, NGramIndex] = (
+            {field: NGramIndex() for field in self.TEXT_INDEX_FIELDS} if text_index else {}
+        )
+        self._fuzzy_indexes: dict[str, BKTree] = (
+            {field: BKTree() for field in self.TEXT_INDEX_FIELDS} if fuzzy_index else {}
+        )
+        self._prefix_indexes: dict[str, PrefixIndex] = (
+            {field: PrefixIndex() for field in self.TEXT_INDEX_FIELDS} if prefix_index else {}
+        )
+        self._year_index = SortedIndex()
+        self._status_index = GroupIndex(BookStatus)
+        self._search_cache = SearchCache(search_cache_size)
+        self.metrics = Metrics(metrics)
+        self._mutation_generation = 0
+        self._saved_generation: int | None = None
+        self._books_by_id: dict[int, Book] = {}
         self._last_id = 0
-        self._load_books()
+        self._transaction: _Transaction | None = None
+        self._lock = ReadWriteLock()
+        self._pending: list[dict] = []
+        self._dirty = False
+        self._file_lock = FileLock(f'{self._storage}.lock') if multiprocess else None
+        self._storage_generation: int | None = None
+        self._committed = False
+        if self._file_lock is not None:
+            with self._file_lock.shared():
+                self._sync()
+        else:
+            self._load_books()
+
+        self._flush_interval = flush_interval
+        self._flusher: threading.Thread | None = None
+        self._flusher_stop = threading.Event()
+        if flush_interval:
+            self._flusher = threading.Thread(target=self._flush_periodically, name='library-flusher', daemon=True)
+            self._flusher.start()
+
+    @property
+    @_read_locked
+    def books(self) -> list[Book]:
+        """
+        Список книг библиотеки в порядке добавления.
+
+        Книги хранятся в индексе `_books_by_id` (ID -> Book), который сохраняет порядок вставки.
+
+        Returns:
+            list[Book]: Список книг.
+        """
+
+        return list(self._books_by_id.values())
 
     @staticmethod
     def _validate_storage(storage: str) -> str:
@@ -30,7 +259,7 @@ class Library:
             storage (str): Путь к файлу.
 
         Raises:
-            ValueError: Если путь к файлу не является строкой или не имеет расширение .json.
+            ValueError: Если путь к файлу не является строкой или имеет неподдерживаемое расширение.
 
         Returns:
             str: Валидированный путь к файлу.
@@ -39,88 +268,437 @@ class Library:
         if not isinstance(storage, str):
             raise ValueError('Путь к файлу должен быть строкой')
 
-        if not storage.lower().endswith('.json'):
-            raise ValueError('Файл для хранения данных должен иметь расширение .json')
+        extensions = Library.JSON_EXTENSIONS + Library.SQLITE_EXTENSIONS + Library.SHARDED_EXTENSIONS
+        if not storage.lower().endswith(extensions):
+            raise ValueError(f'Файл для хранения данных должен иметь одно из расширений: {extensions}')
 
         return storage
 
+    @classmethod
+    def _create_backend(
+            cls,
+            storage: str,
+            journal: bool,
+            journal_max_size: int,
+            journal_max_ratio: float,
+            binary_snapshot: bool
+    ) -> StorageBackend:
+        """
+        Создает хранилище по расширению файла.
+
+        Args:
+            storage (str): Валидированный путь к файлу.
+            journal (bool): Включает журналируемый режим JSON-хранилища.
+            journal_max_size (int): Лимит размера журнала в байтах.
+            journal_max_ratio (float): Лимит отношения числа операций в журнале к числу книг.
+            binary_snapshot (bool): Включает бинарный снимок JSON-хранилища.
+
+        Returns:
+            StorageBackend: Хранилище данных библиотеки.
+        """
+
+        if storage.lower().endswith(cls.SQLITE_EXTENSIONS):
+            return SqliteStorage(storage)
+        if storage.lower().endswith(cls.SHARDED_EXTENSIONS):
+            return ShardedStorage(storage)
+        return JsonStorage(
+            storage,
+            journal=journal,
+            max_size=journal_max_size,
+            max_ratio=journal_max_ratio,
+            binary_snapshot=binary_snapshot
+        )
+
+    @_timed('load')
     def _load_books(self) -> None:
         """
-        Загружает книги из JSON-файла.
+        Загружает книги из хранилища.
 
-        Загружает список книг и последний используемый ID из файла, если файл существует.
-        В случае ошибок при загрузке или отсутствии файла сбрасывает данные.
+        Хранилище отдает содержимое потоком операций: каждая запись сразу превращается в объект
+        книги, а исходный словарь отбрасывается, поэтому данные не материализуются целиком.
+        Невалидные записи пропускаются с сообщением об ошибке.
+
+        Если все записи загружены, книги в памяти совпадают с хранилищем, и `exit` не перезаписывает
+        его без изменений. Хранилище с пропущенными записями перезаписывается при выходе без них.
         """
 
-        try:
-            with open(self._storage, 'r', encoding='utf-8') as file:
-                data: dict = json.load(file)
-                self._last_id = data.get('last_id', 0)
-                books_data = data.get('books', [])
-                for book_data in books_data:
-                    try:
-                        book = Book(
-                            id_=book_data.get('id'),
-                            title=book_data.get('title'),
-                            author=book_data.get('author'),
-                            year=book_data.get('year'),
-                            status=BookStatus.from_value(book_data.get('status'))
-                        )
-                        self._append_book_to_list(book)
-                    except ValueError as e:
-                        print(f'Ошибка при загрузке книги: {book_data} - {e}')
-        except (FileNotFoundError, json.JSONDecodeError):
-            self._books = []
-            self._last_id = 0
+        valid = True
+        for operation in self._backend.load():
+            try:
+                self._apply_operation(operation)
+            except (ValueError, KeyError) as e:
+                valid = False
+                print(f'Ошибка при загрузке книги: {operation} - {e}')
+        if valid:
+            self._saved_generation = self._mutation_generation
 
+    def _reset_books(self) -> None:
+        """Сбрасывает книги, последний ID и все индексы библиотеки."""
+
+        self._books_by_id = {}
+        self._last_id = 0
+        self._mutation_generation += 1
+        self._year_index.clear()
+        self._status_index.clear()
+        for index in self._text_indexes.values():
+            index.clear()
+        for tree in self._fuzzy_indexes.values():
+            tree.clear()
+        for index in self._prefix_indexes.values():
+            index.clear()
+
+    def _apply_operation(self, operation: dict) -> None:
+        """
+        Применяет операцию загрузки хранилища к книгам в памяти.
+
+        Применение идемпотентно: операции, уже отраженные в снимке (например, если сбой произошел
+        между записью снимка и очисткой журнала), не приводят к ошибкам и дублированию книг.
+
+        Args:
+            operation (dict): Операция хранилища ('reset', 'last_id', 'add', 'delete' или 'status').
+
+        Raises:
+            ValueError: Если операция неизвестна или содержит невалидные данные.
+        """
+
+        kind = operation.get('op')
+        if kind == 'reset':
+            self._reset_books()
+        elif kind == 'last_id':
+            self._last_id = max(self._last_id, operation['last_id'])
+        elif kind == 'add':
+            book = operation['book']
+            if not isinstance(book, Book):
+                book = Book.from_dict(book)
+            if book.id not in self._books_by_id:
+                self._append_book_to_list(book)
+        elif kind == 'delete':
+            book = self._find_book_by_id(operation['id'])
+            if book:
+                self._remove_book_from_list(book)
+        elif kind == 'status':
+            book = self._find_book_by_id(operation['id'])
+            if book:
+                self._set_book_status(book, BookStatus.from_value(operation['status']))
+        else:
+            raise ValueError(f'Неизвестная операция хранилища: {kind}')
+
+    @_timed('save')
     def _save_books(self) -> None:
         """
-        Сохраняет книги в JSON-файл.
+        Сохраняет полный снимок книг в хранилище.
 
-        Сохраняет текущий список книг и последний используемый ID в файл.
+        Сохраняет текущий список книг и последний используемый ID. Снимок включает
+        все отложенные изменения, поэтому после записи они считаются сохраненными.
         """
 
-        data = {
-            'last_id': self._last_id,
-            'books': [book.to_dict() for book in self._books]
-        }
+        with self._lock.write():
+            written = self._backend_bytes()
+            self._backend.save(self._last_id, self._books_by_id.values())
+            self._saved_generation = self._mutation_generation
+            if self.metrics.enabled:
+                self.metrics.add('bytes_written', 'save', self._backend_bytes() - written)
+            self._pending = []
+            self._dirty = False
+            self._committed = True
+
+    def _backend_bytes(self) -> int:
+        """
+        Возвращает число байтов, записанных хранилищем, если хранилище его учитывает (`JsonStorage.bytes_written`).
+
+        Returns:
+            int: Число записанных байтов или 0.
+        """
+
+        return getattr(self._backend, 'bytes_written', 0)
+
+    @_timed('commit')
+    def _commit_to_backend(self, operations: list[dict]) -> bool:
+        """
+        Фиксирует операции изменения в хранилище.
+
+        Args:
+            operations (list[dict]): Операции изменения в порядке выполнения.
+
+        Returns:
+            bool: True, если хранилище требует записи полного снимка.
+        """
+
+        written = self._backend_bytes()
+        needs_save = self._backend.commit(operations)
+        if self.metrics.enabled:
+            self.metrics.add('bytes_written', 'commit', self._backend_bytes() - written)
+        return needs_save
+
+    def _persist(self, operations: list[dict]) -> None:
+        """
+        Передает зафиксированные изменения в хранилище.
+
+        В режиме отложенной записи изменения только помечают библиотеку как измененную
+        и накапливаются до следующего сброса.
+
+        Args:
+            operations (list[dict]): Операции изменения в порядке выполнения.
+        """
+
+        if self._flush_interval is not None:
+            self._pending.extend(operations)
+            self._dirty = True
+            return
+
+        self._committed = True
+        if self._commit_to_backend(operations):
+            self._save_books()
+
+    @_timed('flush')
+    def flush(self) -> None:
+        """
+        Записывает в хранилище все накопленные изменения одной операцией.
+
+        Если хранилище требует полного снимка, он записывается один раз для всех изменений.
+        Без накопленных изменений блокировки не захватываются, поэтому периодический сброс
+        простаивающей библиотеки не мешает чтению и не занимает хранилище в многопроцессном режиме.
+        """
+
+        if not self._dirty:
+            return
+
+        with self._writing():
+            # Изменения могли быть записаны, пока ожидалась блокировка.
+            if not self._dirty:
+                return
+
+            self._committed = True
+            if self._commit_to_backend(self._pending):
+                self._save_books()
+            self._pending = []
+            self._dirty = False
+
+    def _flush_periodically(self) -> None:
+        """Цикл фонового потока отложенной записи."""
+
+        while not self._flusher_stop.wait(self._flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                print(f'Ошибка фоновой записи библиотеки: {e}')
 
-        with open(self._storage, 'w', encoding='utf-8') as file:
-            json.dump(data, file, ensure_ascii=False, indent=4)
+    def _sync(self) -> None:
+        """
+        Приводит книги в памяти в соответствие с хранилищем в многопроцессном режиме.
+
+        Вызывается под межпроцессной блокировкой. Хранилище перечитывается, только если
+        его поколение изменилось, то есть другой процесс зафиксировал изменения. Накопленные,
+        но еще не записанные изменения этого процесса применяются поверх перечитанных данных.
+        Последний ID берется как максимум из своего и выданного другими процессами.
+        """
+
+        generation, last_id = self._file_lock.read_state()
+        if generation != self._storage_generation:
+            self._reset_books()
+            self._load_books()
+            for operation in self._pending:
+                self._apply_operation(operation)
+            self._storage_generation = generation
+        self._last_id = max(self._last_id, last_id)
+
+    def _publish(self, state: tuple[int, int]) -> None:
+        """
+        Сообщает другим процессам о зафиксированных изменениях и выданных ID.
+
+        Args:
+            state (tuple[int, int]): Общее состояние, прочитанное при захвате блокировки.
+        """
+
+        if self._committed:
+            self._storage_generation += 1
+            self._committed = False
+        if (self._storage_generation, self._last_id) != state:
+            self._file_lock.write_state(self._storage_generation, self._last_id)
+
+    @contextmanager
+    def _writing(self) -> Iterator[None]:
+        """
+        Контекстный менеджер изменения библиотеки.
+
+        Захватывает блокировку библиотеки на запись, а в многопроцессном режиме на время
+        самого внешнего изменения - еще и исключительную межпроцессную блокировку: перед изменением
+        библиотека синхронизируется с хранилищем, после него публикует новое поколение и последний ID.
+        Так чтение, изменение и запись хранилища выполняются атомарно относительно других процессов.
+        """
+
+        with self._lock.write():
+            if self._file_lock is None or self._file_lock.locked:
+                yield
+                return
+
+            with self._file_lock.exclusive():
+                self._sync()
+                state = (self._storage_generation, self._last_id)
+                self._committed = False
+                try:
+                    yield
+                finally:
+                    self._publish(state)
+
+    def refresh(self) -> None:
+        """
+        Перечитывает хранилище, если другой процесс зафиксировал в нем изменения.
+
+        Проверка изменений стоит одного чтения файла блокировки. Вне многопроцессного режима
+        ничего не делает.
+        """
+
+        if self._file_lock is None or self._file_lock.read_state()[0] == self._storage_generation:
+            return
+
+        with self._lock.write(), self._file_lock.shared():
+            self._sync()
+
+    def _commit(self, operation: dict) -> None:
+        """
+        Фиксирует изменение в хранилище.
+
+        Хранилище само решает, как записать изменение (например, одной строкой журнала или
+        одним SQL-запросом). Если ему требуется полный снимок, он записывается.
+        Внутри транзакции изменение откладывается до ее завершения.
+
+        Args:
+            operation (dict): Описание изменения ('add', 'delete' или 'status').
+        """
+
+        if self._transaction is not None:
+            self._transaction.operations.append(operation)
+        else:
+            self._persist([operation])
+
+    @contextmanager
+    def transaction(self) -> Iterator['Library']:
+        """
+        Объединяет несколько изменений в одну запись в хранилище.
+
+        Изменения внутри блока сразу видны в памяти, а в хранилище фиксируются одной операцией
+        при выходе из блока. Если внутри блока возникло исключение (например, книга не прошла
+        валидацию в `add_book`), все изменения в памяти, включая последний ID, откатываются,
+        в хранилище ничего не записывается, а исключение пробрасывается дальше.
+        Вложенные транзакции входят в состав внешней. На время транзакции другие потоки
+        не могут изменять библиотеку.
+
+        Yields:
+            Library: Текущая библиотека.
+
+        Example:
+            >>> with library.transaction():
+            ...     library.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+            ...     library.change_status(1, BookStatus.BORROWED)
+        """
+
+        with self._writing():
+            if self._transaction is not None:
+                yield self
+                return
+
+            self._transaction = _Transaction(self._last_id)
+            try:
+                yield self
+            except BaseException:
+                self._rollback()
+                raise
+            else:
+                operations = self._transaction.operations
+                self._transaction = None
+                if operations:
+                    self._persist(operations)
+            finally:
+                self._transaction = None
+
+    def _rollback(self) -> None:
+        """Откатывает изменения в памяти, сделанные в текущей транзакции."""
+
+        transaction = self._transaction
+        self._transaction = None
+
+        for book, status in reversed(transaction.statuses):
+            self._set_book_status(book, status)
+
+        if transaction.snapshot is not None:
+            added = {id(book) for book in transaction.added}
+            self._reset_books()
+            for book in transaction.snapshot:
+                if id(book) not in added:
+                    self._append_book_to_list(book)
+        else:
+            for book in reversed(transaction.added):
+                self._remove_book_from_list(book)
+
+        self._last_id = transaction.last_id
+
+    @_write_locked
+    def compact(self) -> None:
+        """
+        Уплотняет хранилище: записывает полный снимок книг (для JSON-хранилища очищает журнал операций).
+        """
+
+        self._save_books()
 
     def _append_book_to_list(self, book: Book) -> None:
         """
-        Добавляет книгу в список книг и обновляет last_id.
+        Добавляет книгу в индекс книг и обновляет last_id.
 
-        Проверяет, не существует ли уже книга с таким же ID.
+        Проверяет, не существует ли уже книга с таким же ID, за O(1). Единственная вставка,
+        которая может не удаться (в индекс по году), выполняется до изменения библиотеки,
+        поэтому при ошибке библиотека остается прежней.
 
         Args:
             book (Book): Книга для добавления.
 
         Raises:
-            ValueError: Если книга с таким ID уже существует.
+            ValueError: Если книга с таким ID уже существует или ее ID и год не помещаются в индекс по году.
         """
 
-        if any(existing_book.id == book.id for existing_book in self._books):
+        if book.id in self._books_by_id:
             raise ValueError(f'Книга с ID {book.id} уже существует')
-        self._books.append(book)
+        self._year_index.add(book.id, book.year)
+        if self._transaction is not None:
+            self._transaction.added.append(book)
+        self._books_by_id[book.id] = book
         self._last_id = max(self._last_id, book.id)
+        self._mutation_generation += 1
+        self._status_index.add(book.id, book.status)
+        for field, index in self._text_indexes.items():
+            index.add(book.id, getattr(book, field))
+        for field, tree in self._fuzzy_indexes.items():
+            for term in fuzzy_terms(getattr(book, field)):
+                tree.add(book.id, term)
+        for field, index in self._prefix_indexes.items():
+            index.add(getattr(book, field))
 
     def _remove_book_from_list(self, book: Book) -> None:
         """
-        Удаляет книгу из списка книг.
+        Удаляет книгу из индекса книг.
 
         Args:
             book (Book): Книга для удаления.
 
         Raises:
-            ValueError: Если книга не найдена в списке.
+            ValueError: Если книга не найдена в индексе.
         """
 
-        try:
-            self._books.remove(book)
-        except ValueError:
+        if self._books_by_id.get(book.id) is not book:
             raise ValueError(f'Книга {book} не найдена в библиотеке')
+        if self._transaction is not None and self._transaction.snapshot is None:
+            self._transaction.snapshot = list(self._books_by_id.values())
+        del self._books_by_id[book.id]
+        self._mutation_generation += 1
+        self._year_index.remove(book.id, book.year)
+        self._status_index.remove(book.id, book.status)
+        for index in self._text_indexes.values():
+            index.remove(book.id)
+        for field, tree in self._fuzzy_indexes.items():
+            for term in fuzzy_terms(getattr(book, field)):
+                tree.remove(book.id, term)
+        for field, index in self._prefix_indexes.items():
+            index.remove(getattr(book, field))
 
     def _find_book_by_id(self, book_id: int) -> Book | None:
         """
@@ -133,29 +711,229 @@ class Library:
             Book | None: Найденная книга или None, если книга не найдена.
         """
 
-        return next((book for book in self._books if book.id == book_id), None)
+        return self._books_by_id.get(book_id)
+
+    def _set_book_status(self, book: Book, status: BookStatus) -> None:
+        """
+        Изменяет статус книги в памяти.
+
+        Args:
+            book (Book): Книга из библиотеки.
+            status (BookStatus): Новый статус книги.
+        """
+
+        if self._transaction is not None:
+            self._transaction.statuses.append((book, book.status))
+        self._status_index.move(book.id, book.status, status)
+        book.status = status
+        self._mutation_generation += 1
+
+    @_timed('add_book')
+    @_write_locked
+    def add_book_record(self, title: str, author: str, year: int) -> Book:
+        """
+        Создает книгу со следующим свободным ID и фиксирует ее добавление, не выводя сообщений.
+
+        В отличие от `add_book`, возвращает добавленную книгу и сообщает об ошибке исключением,
+        поэтому подходит для программного использования (CLI, `AsyncLibrary`).
+
+        Args:
+            title (str): Название книги.
+            author (str): Автор книги.
+            year (int): Год издания книги.
+
+        Raises:
+            ValueError: Если книга не проходит валидацию.
 
+        Returns:
+            Book: Добавленная книга.
+        """
+
+        new_book = Book(self._last_id + 1, title, author, year, BookStatus.IN_STOCK)
+        self._append_book_to_list(new_book)
+        self._commit({'op': 'add', 'book': new_book.to_dict()})
+        return new_book
+
+    @_write_locked
     def add_book(self, title: str, author: str, year: int) -> None:
         """
         Добавляет книгу в библиотеку.
 
         Создает новый объект книги с указанными параметрами и добавляет его в список.
+        Внутри транзакции ошибка валидации пробрасывается, чтобы транзакция откатилась.
 
         Args:
             title (str): Название книги.
             author (str): Автор книги.
             year (int): Год издания книги.
+
+        Raises:
+            ValueError: Если книга не проходит валидацию внутри транзакции.
         """
 
-        book_id = self._last_id + 1
         try:
-            new_book = Book(book_id, title, author, year, BookStatus.IN_STOCK)
-            self._append_book_to_list(new_book)
-            self._save_books()
+            self.add_book_record(title, author, year)
             print(f'Книга \'{title}\' успешно добавлена.')
         except ValueError as e:
             print(f'Не удалось добавить книгу: {e}')
+            if self._transaction is not None:
+                raise
+
+    def add_books(self, books: Iterable[tuple[str, str, int]]) -> list[Book]:
+        """
+        Добавляет несколько книг в одной транзакции с одной записью в хранилище.
+
+        Если хотя бы одна книга не проходит валидацию, ни одна книга не добавляется.
+
+        Args:
+            books (Iterable[tuple[str, str, int]]): Кортежи (название, автор, год издания).
 
+        Raises:
+            ValueError: Если какая-либо книга не проходит валидацию.
+
+        Returns:
+            list[Book]: Добавленные книги.
+        """
+
+        added = []
+        with self.transaction():
+            for number, (title, author, year) in enumerate(books, start=1):
+                try:
+                    added.append(self.add_book_record(title, author, year))
+                except ValueError as e:
+                    raise ValueError(f'Книга №{number} ({title}): {e}') from e
+        print(f'Добавлено книг: {len(added)}')
+        return added
+
+    @_timed('import_books')
+    def import_books(
+            self,
+            stream: TextIO,
+            format: str = 'csv',
+            report: TextIO | None = None,
+            workers: int | None = None,
+            chunk_size: int = IMPORT_CHUNK_SIZE
+    ) -> dict:
+        """
+        Массово импортирует книги из CSV или JSON Lines (см. `bulk.read_rows`).
+
+        Входные данные читаются потоково и проверяются пачками в пуле процессов валидаторами `Book`.
+        Проверенные пачки добавляются в порядке входных данных, а ID выделяются блоком на пачку
+        после `_last_id`. Записи, не прошедшие проверку, пропускаются и записываются в отчет.
+        Результат записывается в хранилище один раз полным снимком. Если импорт прерван ошибкой,
+        добавленные книги удаляются из памяти, а хранилище не изменяется.
+
+        Args:
+            stream (TextIO): Входной поток.
+            format (str, optional): Формат: 'csv' или 'jsonl' (по умолчанию 'csv').
+            report (TextIO | None, optional): Поток для отчета об отклоненных записях в формате
+                JSON Lines: {"line": ..., "record": ..., "error": ...} (по умолчанию отчет не пишется).
+            workers (int | None, optional): Число процессов проверки (по умолчанию число процессоров).
+                0 или 1 - проверка в текущем процессе.
+            chunk_size (int, optional): Число записей в пачке (по умолчанию `IMPORT_CHUNK_SIZE`).
+
+        Raises:
+            ValueError: Если формат или заголовок CSV недопустимы, либо импорт вызван внутри транзакции.
+
+        Returns:
+            dict: Число импортированных ('imported') и отклоненных ('rejected') записей,
+                первый и последний выделенные ID ('first_id', 'last_id'; None, если ничего не импортировано).
+        """
+
+        if self._transaction is not None:
+            raise ValueError('Массовый импорт нельзя выполнять внутри транзакции')
+
+        rows = bulk.read_rows(stream, format)
+        with self._writing():
+            first_id = self._last_id + 1
+            imported = rejected = 0
+            try:
+                for valid, errors in bulk.validate_chunks(rows, chunk_size, workers):
+                    start = self._last_id + 1
+                    for book_id, (title, author, year, status) in enumerate(valid, start=start):
+                        self._append_book_to_list(Book.unchecked(book_id, title, author, year, status))
+                    imported += len(valid)
+                    rejected += len(errors)
+                    if report is not None and errors:
+                        bulk.write_rejected(report, errors)
+                if imported:
+                    self._save_books()
+            except BaseException:
+                for book_id in range(first_id, self._last_id + 1):
+                    self._remove_book_from_list(self._books_by_id[book_id])
+                self._last_id = first_id - 1
+                raise
+
+        return {
+            'imported': imported,
+            'rejected': rejected,
+            'first_id': first_id if imported else None,
+            'last_id': self._last_id if imported else None
+        }
+
+    @_timed('export')
+    @_read_locked
+    def export(
+            self,
+            stream: TextIO,
+            format: str = 'csv',
+            query: Query | None = None,
+            chunk_size: int = EXPORT_CHUNK_SIZE
+    ) -> int:
+        """
+        Потоково выгружает книги в CSV или JSON Lines (см. `bulk.write_books`).
+
+        Книги перебираются генератором и записываются пачками, поэтому выгрузка не строит копию
+        каталога, а дополнительная память ограничена размером пачки. Выгрузку можно ограничить
+        запросом (например, поиском по автору или статусом); он выполняется по плану `query`
+        с использованием индексов. Изменения библиотеки ждут завершения выгрузки, поэтому
+        она согласована. Результат можно загрузить обратно через `import_books`.
+
+        Args:
+            stream (TextIO): Поток вывода (для CSV файл открывается с `newline=''`).
+            format (str, optional): Формат: 'csv' или 'jsonl' (по умолчанию 'csv').
+            query (Query | None, optional): Запрос, которым отбираются книги (по умолчанию все книги).
+                С сортировкой запрос строит список ссылок на отобранные книги.
+            chunk_size (int, optional): Число книг в пачке (по умолчанию `EXPORT_CHUNK_SIZE`).
+
+        Raises:
+            ValueError: Если формат или размер пачки недопустимы.
+
+        Returns:
+            int: Число выгруженных книг.
+
+        Example:
+            >>> with open('borrowed.csv', 'w', encoding='utf-8', newline='') as file:
+            ...     library.export(file, query=Query().status_is(BookStatus.BORROWED))
+        """
+
+        books = self._books_by_id.values() if query is None else self._select(query, 'export')
+        return bulk.write_books(stream, books, format, chunk_size)
+
+    @_timed('delete_book')
+    @_write_locked
+    def remove_book(self, book_id: int) -> Book:
+        """
+        Удаляет книгу по ID и фиксирует удаление, не выводя сообщений.
+
+        Args:
+            book_id (int): ID книги для удаления.
+
+        Raises:
+            ValueError: Если книга не найдена.
+
+        Returns:
+            Book: Удаленная книга.
+        """
+
+        book = self._find_book_by_id(book_id)
+        if not book:
+            raise ValueError(f'Книга с ID {book_id} не найдена')
+        self._remove_book_from_list(book)
+        self._commit({'op': 'delete', 'id': book_id})
+        return book
+
+    @_write_locked
     def delete_book(self, book_id: int) -> None:
         """
         Удаляет книгу из библиотеки по ID.
@@ -164,22 +942,24 @@ class Library:
 
         Args:
             book_id (int): ID книги для удаления.
+
+        Raises:
+            ValueError: Если книга не найдена.
         """
 
-        book = self._find_book_by_id(book_id)
-        if book:
-            self._remove_book_from_list(book)
-            self._save_books()
-            print(f'Книга с ID {book_id} успешно удалена')
-        else:
-            raise ValueError(f'Книга с ID {book_id} не найдена')
+        self.remove_book(book_id)
+        print(f'Книга с ID {book_id} успешно удалена')
 
+    @_timed('search_books')
+    @_read_locked
     def search_books(self, keyword: str, field: str) -> list[Book]:
         """
         Ищет книги по указанному полю.
 
         Фильтрует книги по полю, которое указано в аргументе `field`,
         проверяя, содержит ли значение поля переданное ключевое слово.
+        Если для поля построен триграммный индекс, поиск выполняется по нему с тем же результатом.
+        Результаты кешируются по полю и ключевому слову в нижнем регистре до следующего изменения библиотеки.
 
         Args:
             keyword (str): Ключевое слово для поиска.
@@ -195,36 +975,374 @@ class Library:
         if field not in self.SEARCH_FIELDS:
             raise ValueError(f'Недопустимое поле для поиска. Допустимые значения: {self.SEARCH_FIELDS}')
 
-        result = [book for book in self._books if keyword.lower() in str(getattr(book, field)).lower()]
+        key = (field, keyword.lower())
+        cached = self._search_cache.get(key, self._mutation_generation)
+        if cached is not None:
+            return list(cached)
+
+        index = self._text_indexes.get(field)
+        if index is not None:
+            result = [self._books_by_id[book_id] for book_id in index.search(keyword)]
+            scanned = len(result)
+        else:
+            result = [book for book in self._books_by_id.values() if key[1] in str(getattr(book, field)).lower()]
+            scanned = len(self._books_by_id)
+        if self.metrics.enabled:
+            self.metrics.add('books_scanned', 'search_books', scanned)
+        self._search_cache.put(key, self._mutation_generation, tuple(result))
         return result
 
-    def list_books(self) -> None:
+    @_timed('search_fuzzy')
+    @_read_locked
+    def search_fuzzy(self, keyword: str, field: str, max_distance: int = 2) -> list[Book]:
+        """
+        Ищет книги с опечатками: значение поля или одно из его слов отличается от ключевого слова
+        не больше чем на `max_distance` правок (расстояние Левенштейна, без учета регистра).
+
+        Если построено BK-дерево (`fuzzy_index`), расстояние вычисляется лишь для малой части
+        различных значений. Иначе перебираются различные значения поля с тем же результатом.
+
+        Args:
+            keyword (str): Ключевое слово (например, «Толстои»).
+            field (str): Поле для поиска (`TEXT_INDEX_FIELDS`).
+            max_distance (int, optional): Максимальное число правок (по умолчанию 2).
+
+        Raises:
+            ValueError: Если поле недопустимо или число правок не является неотрицательным целым.
+
+        Returns:
+            list[Book]: Найденные книги, упорядоченные по расстоянию, а при равном - по ID.
+        """
+
+        if field not in self.TEXT_INDEX_FIELDS:
+            raise ValueError(f'Недопустимое поле для нечеткого поиска. Допустимые значения: {self.TEXT_INDEX_FIELDS}')
+        if not isinstance(max_distance, int) or max_distance < 0:
+            raise ValueError('Число правок должно быть неотрицательным целым числом')
+
+        keyword = normalize(keyword)
+        tree = self._fuzzy_indexes.get(field)
+        if tree is not None:
+            distances = tree.search(keyword, max_distance)
+        else:
+            distances = {}
+            term_distances: dict[str, int] = {}
+            for book in self._books_by_id.values():
+                best = max_distance + 1
+                for term in fuzzy_terms(getattr(book, field)):
+                    if term not in term_distances:
+                        too_far = abs(len(term) - len(keyword)) > max_distance
+                        term_distances[term] = max_distance + 1 if too_far else levenshtein(keyword, term)
+                    best = min(best, term_distances[term])
+                if best <= max_distance:
+                    distances[book.id] = best
+            if self.metrics.enabled:
+                self.metrics.add('books_scanned', 'search_fuzzy', len(self._books_by_id))
+
+        ranked = sorted(distances, key=lambda book_id: (distances[book_id], book_id))
+        return [self._books_by_id[book_id] for book_id in ranked]
+
+    @_timed('suggest')
+    @_read_locked
+    def suggest(self, field: str, prefix: str, limit: int = 10) -> list[str]:
+        """
+        Подсказывает существующие значения поля, начинающиеся с префикса без учета регистра.
+
+        Помогает не вводить одного и того же автора разными способами. Если построен индекс
+        префиксов (`prefix_index`), время ответа зависит только от длины префикса и числа подсказок.
+        Иначе перебираются все книги с тем же результатом.
+
+        Args:
+            field (str): Поле (`TEXT_INDEX_FIELDS`).
+            prefix (str): Введенное начало значения.
+            limit (int, optional): Максимальное число подсказок (по умолчанию 10).
+
+        Raises:
+            ValueError: Если поле недопустимо или ограничение не является положительным целым.
+
+        Returns:
+            list[str]: Различные значения в алфавитном порядке без учета регистра.
+
+        Example:
+            >>> library.suggest('author', 'тол')
+            ['Толстой Л.Н.']
+        """
+
+        if field not in self.TEXT_INDEX_FIELDS:
+            raise ValueError(f'Недопустимое поле для подсказок. Допустимые значения: {self.TEXT_INDEX_FIELDS}')
+        if not isinstance(limit, int) or limit < 1:
+            raise ValueError('Число подсказок должно быть положительным целым числом')
+
+        index = self._prefix_indexes.get(field)
+        if index is not None:
+            return index.suggest(prefix, limit)
+
+        prefix = prefix.lower()
+        values = {getattr(book, field) for book in self._books_by_id.values()}
+        return sorted((value for value in values if value.lower().startswith(prefix)), key=str.lower)[:limit]
+
+    def search_cache_stats(self) -> dict:
+        """
+        Возвращает статистику кеша результатов `search_books`.
+
+        Returns:
+            dict: Число попаданий и промахов, доля попаданий, текущий и максимальный размер кеша
+                (см. `SearchCache.stats`).
+        """
+
+        return self._search_cache.stats()
+
+    def _index_lookup(self, predicate: Predicate) -> tuple[int, Callable[[], Iterable[int]]] | None:
+        """
+        Подбирает индекс для условия запроса.
+
+        Args:
+            predicate (Predicate): Условие запроса.
+
+        Returns:
+            tuple[int, Callable[[], Iterable[int]]] | None: Оценка числа книг, удовлетворяющих условию,
+                и функция, возвращающая ID книг-кандидатов из индекса, или None, если индекса нет.
+        """
+
+        if isinstance(predicate, IdEquals):
+            book_id = predicate.book_id
+            found = book_id in self._books_by_id
+            return int(found), lambda: (book_id,) if found else ()
+        if isinstance(predicate, StatusEquals):
+            status = predicate.status
+            return self._status_index.count(status), lambda: self._status_index.keys(status)
+        if isinstance(predicate, YearBetween):
+            start, end = predicate.start_year, predicate.end_year
+            return self._year_index.count(start, end), lambda: self._year_index.range(start, end)
+        if isinstance(predicate, Contains):
+            index = self._text_indexes.get(predicate.field)
+            if index is not None:
+                return index.estimate(predicate.keyword), lambda: index.search(predicate.keyword)
+        return None
+
+    def _plan(self, query: Query) -> tuple[Callable[[], Iterable[int]] | None, list[Predicate], list[str]]:
+        """
+        Строит план выполнения запроса.
+
+        Для каждого условия оценивается число подходящих книг по индексу (ID, год, статус,
+        триграммы). Книги-кандидаты берутся из индекса самого селективного условия, а остальные
+        условия проверяются для каждого кандидата в порядке возрастания оценки и стоимости проверки.
+        Если ни одно условие не поддерживается индексом, выполняется полный перебор.
+
+        Args:
+            query (Query): Запрос.
+
+        Returns:
+            tuple[Callable[[], Iterable[int]] | None, list[Predicate], list[str]]: Функция, возвращающая
+                ID кандидатов (None - перебор всех книг), условия для проверки и описание плана.
+        """
+
+        steps = []
+        for predicate in query.predicates:
+            lookup = self._index_lookup(predicate)
+            estimate = lookup[0] if lookup is not None else math.inf
+            steps.append((estimate, predicate.COST, predicate, lookup))
+        steps.sort(key=lambda step: step[:2])
+
+        if steps and steps[0][3] is not None:
+            estimate, _, predicate, lookup = steps.pop(0)
+            candidates = lookup[1]
+            plan = [f'индекс: {predicate.describe()} (~{estimate} книг)']
+        else:
+            candidates = None
+            plan = [f'перебор всех книг ({len(self._books_by_id)})']
+
+        filters = [step[2] for step in steps]
+        plan.extend(f'фильтр: {predicate.describe()}' for predicate in filters)
+        if query.sort_field is not None:
+            plan.append(f'сортировка: {query.sort_field}{" по убыванию" if query.descending else ""}')
+        if query.max_results is not None:
+            plan.append(f'ограничение: {query.max_results}')
+        return candidates, filters, plan
+
+    @_timed('query')
+    @_read_locked
+    def query(self, query: Query) -> list[Book]:
+        """
+        Выполняет составной запрос (см. `Query`).
+
+        Без сортировки книги возвращаются в порядке источника кандидатов из плана
+        (индекса или порядка добавления), а при ограничении числа книг перебор прекращается досрочно.
+        С сортировкой и ограничением отбираются первые книги без сортировки всего результата.
+
+        Args:
+            query (Query): Запрос.
+
+        Returns:
+            list[Book]: Книги, удовлетворяющие всем условиям запроса.
+
+        Example:
+            >>> library.query(Query().contains('author', 'толстой').status_is(BookStatus.IN_STOCK).limit(5))
+        """
+
+        return list(self._select(query, 'query'))
+
+    def _select(self, query: Query, operation: str) -> Iterable[Book]:
+        """
+        Отбирает книги по запросу по плану `_plan`. Вызывается под блокировкой на чтение.
+
+        Без сортировки книги отдаются лениво, по мере перебора кандидатов. С сортировкой
+        результат строится целиком (список ссылок на книги).
+
+        Args:
+            query (Query): Запрос.
+            operation (str): Операция, которой учитываются просмотренные книги в метриках.
+
+        Returns:
+            Iterable[Book]: Книги, удовлетворяющие всем условиям запроса.
+        """
+
+        candidates, filters, _ = self._plan(query)
+        if candidates is None:
+            books = self._books_by_id.values()
+        else:
+            books = (self._books_by_id[book_id] for book_id in candidates())
+        if self.metrics.enabled:
+            books = self.metrics.counted('books_scanned', operation, books)
+        if filters:
+            books = (book for book in books if all(predicate.matches(book) for predicate in filters))
+
+        if query.sort_field is None:
+            return islice(books, query.max_results)
+
+        key = query.sort_key()
+        if query.max_results is None:
+            return sorted(books, key=key, reverse=query.descending)
+        select = heapq.nlargest if query.descending else heapq.nsmallest
+        return select(query.max_results, books, key=key)
+
+    @_read_locked
+    def explain(self, query: Query) -> list[str]:
+        """
+        Возвращает план выполнения запроса без его выполнения.
+
+        Args:
+            query (Query): Запрос.
+
+        Returns:
+            list[str]: Шаги плана: источник кандидатов, фильтры, сортировка и ограничение.
+        """
+
+        return self._plan(query)[2]
+
+    @_read_locked
+    def count_by_status(self) -> dict[BookStatus, int]:
+        """
+        Возвращает число книг с каждым статусом без перебора книг.
+
+        Returns:
+            dict[BookStatus, int]: Статус -> число книг (для всех статусов `BookStatus`).
+
+        Example:
+            >>> library.count_by_status()
+            {<BookStatus.IN_STOCK: 'в наличии'>: 2, <BookStatus.BORROWED: 'выдана'>: 1}
+        """
+
+        return self._status_index.counts()
+
+    @_timed('books_with_status')
+    @_read_locked
+    def books_with_status(self, status: BookStatus) -> list[Book]:
+        """
+        Возвращает книги с указанным статусом по индексу статусов, без перебора остальных книг.
+
+        Args:
+            status (BookStatus): Статус книги.
+
+        Raises:
+            ValueError: Если статус недопустим.
+
+        Returns:
+            list[Book]: Список книг, упорядоченный по ID.
+        """
+
+        Book.validate_status(status)
+        return [self._books_by_id[book_id] for book_id in self._status_index.keys(status)]
+
+    def search_by_year(self, year: int) -> list[Book]:
+        """
+        Ищет книги, изданные в указанном году.
+
+        Args:
+            year (int): Год издания.
+
+        Returns:
+            list[Book]: Список книг, упорядоченный по ID.
+        """
+
+        return self.search_by_year_range(year, year)
+
+    @_timed('search_by_year_range')
+    @_read_locked
+    def search_by_year_range(self, start_year: int, end_year: int) -> list[Book]:
+        """
+        Ищет книги, изданные в диапазоне лет включительно.
+
+        Использует упорядоченный индекс по году, поэтому запрос выполняется за O(log n + k).
+
+        Args:
+            start_year (int): Начальный год диапазона.
+            end_year (int): Конечный год диапазона.
+
+        Raises:
+            ValueError: Если начальный год больше конечного.
+
+        Returns:
+            list[Book]: Список книг, упорядоченный по году издания и ID.
+        """
+
+        if start_year > end_year:
+            raise ValueError('Начальный год не может быть больше конечного')
+
+        return [self._books_by_id[book_id] for book_id in self._year_index.range(start_year, end_year)]
+
+    @_timed('list_books')
+    def list_books(
+            self,
+            stream: TextIO | None = None,
+            page_size: int | None = None,
+            pager: Callable[[], bool] | None = None
+    ) -> None:
         """
         Отображает список всех книг.
 
         Если в библиотеке нет книг, выводит сообщение об этом.
-        В противном случае вызывает метод отображения книг.
+        В противном случае вызывает метод отображения книг. Под блокировкой берется только
+        список ссылок на книги, поэтому ожидание пейджера не мешает изменениям библиотеки.
+
+        Args:
+            stream (TextIO | None, optional): Поток вывода (по умолчанию `sys.stdout`).
+            page_size (int | None, optional): Число книг на странице (по умолчанию без разбиения на страницы).
+            pager (Callable[[], bool] | None, optional): Вызывается между страницами; если возвращает
+                False, вывод прекращается.
         """
 
-        if not self._books:
-            print('В библиотеке пока нет книг.')
+        books = self.books
+        if not books:
+            (sys.stdout if stream is None else stream).write('В библиотеке пока нет книг.\n')
         else:
-            self.display_books(self._books)
+            self.display_books(books, stream, page_size, pager)
 
     @staticmethod
-    def display_books(books: list[Book]) -> None:
+    def render_books(books: Iterable[Book], page_size: int | None = None) -> Iterator[str]:
         """
-        Выводит список книг в табличной форме.
+        Построчно формирует таблицу книг и отдает ее частями.
 
-        Отображает информацию о каждой книге в формате таблицы.
+        Генератор не материализует таблицу целиком: в памяти находится только текущая часть.
+        Если задан размер страницы, каждая часть - страница с заголовком таблицы. Иначе части
+        содержат по `DISPLAY_CHUNK_SIZE` строк, а заголовок выводится только в первой.
 
         Args:
-            books (list[Book]): Список книг для отображения.
-        """
+            books (Iterable[Book]): Книги для отображения.
+            page_size (int | None, optional): Число книг на странице.
 
-        if not books:
-            print('Нет книг для отображения.')
-            return
+        Yields:
+            str: Очередная часть таблицы, готовая к записи в поток.
+        """
 
         id_width = 7
         title_width = Book.MAX_TITLE_LENGTH
@@ -232,14 +1350,86 @@ class Library:
         year_width = 10
         status_width = max(len(status.value) for status in BookStatus)
 
-        print(f'{"ID":<{id_width}} {"Название":<{title_width}} {"Автор":<{author_width}} {"Год":<{year_width}}'
-              f' {"Статус":<{status_width}}')
-        print('-' * (id_width + title_width + author_width + year_width + status_width))
+        header = (
+            f'{"ID":<{id_width}} {"Название":<{title_width}} {"Автор":<{author_width}} {"Год":<{year_width}}'
+            f' {"Статус":<{status_width}}\n'
+            f'{"-" * (id_width + title_width + author_width + year_width + status_width)}\n'
+        )
+        chunk_size = page_size or Library.DISPLAY_CHUNK_SIZE
 
+        lines = [header]
+        rows = 0
         for book in books:
-            print(f'{book.id:<{id_width}} {book.title:<{title_width}} {book.author:<{author_width}}'
-                  f' {book.year:<{year_width}} {book.status.value:<{status_width}}')
+            lines.append(f'{book.id:<{id_width}} {book.title:<{title_width}} {book.author:<{author_width}}'
+                         f' {book.year:<{year_width}} {book.status.value:<{status_width}}\n')
+            rows += 1
+            if rows == chunk_size:
+                yield ''.join(lines)
+                lines = [header] if page_size else []
+                rows = 0
+        if rows:
+            yield ''.join(lines)
 
+    @staticmethod
+    def display_books(
+            books: Iterable[Book],
+            stream: TextIO | None = None,
+            page_size: int | None = None,
+            pager: Callable[[], bool] | None = None
+    ) -> None:
+        """
+        Выводит список книг в табличной форме.
+
+        Отображает информацию о каждой книге в формате таблицы. Таблица формируется генератором
+        `render_books` и записывается в поток частями (страницами), а не построчно.
+
+        Args:
+            books (Iterable[Book]): Книги для отображения.
+            stream (TextIO | None, optional): Поток вывода (по умолчанию `sys.stdout`).
+            page_size (int | None, optional): Число книг на странице (по умолчанию без разбиения на страницы).
+            pager (Callable[[], bool] | None, optional): Вызывается между страницами; если возвращает
+                False, вывод прекращается.
+        """
+
+        stream = sys.stdout if stream is None else stream
+        pages = Library.render_books(books, page_size)
+        page = next(pages, None)
+        if page is None:
+            stream.write('Нет книг для отображения.\n')
+            return
+
+        while page is not None:
+            stream.write(page)
+            stream.flush()
+            page = next(pages, None)
+            if page is not None and pager is not None and not pager():
+                break
+
+    @_timed('change_status')
+    @_write_locked
+    def set_status(self, book_id: int, new_status: BookStatus) -> Book:
+        """
+        Изменяет статус книги по ID и фиксирует изменение, не выводя сообщений.
+
+        Args:
+            book_id (int): ID книги для изменения статуса.
+            new_status (BookStatus): Новый статус книги.
+
+        Raises:
+            ValueError: Если книга не найдена.
+
+        Returns:
+            Book: Измененная книга.
+        """
+
+        book = self._find_book_by_id(book_id)
+        if not book:
+            raise ValueError(f'Книга с ID {book_id} не найдена')
+        self._set_book_status(book, new_status)
+        self._commit({'op': 'status', 'id': book_id, 'status': new_status.value})
+        return book
+
+    @_write_locked
     def change_status(self, book_id: int, new_status: BookStatus) -> None:
         """
         Изменяет статус книги.
@@ -251,17 +1441,37 @@ class Library:
             new_status (BookStatus): Новый статус книги.
         """
 
-        book = self._find_book_by_id(book_id)
-        if book:
-            book.status = new_status
-            self._save_books()
+        try:
+            self.set_status(book_id, new_status)
             print(f'Статус книги с ID {book_id} изменен на \'{new_status.value}\'')
-        else:
-            print(f'Книга с ID {book_id} не найдена')
+        except ValueError as e:
+            print(e)
 
     def exit(self):
         """
         Метод для выхода из библиотеки с сохранением изменений.
+
+        Останавливает фоновый поток отложенной записи и записывает все накопленные изменения.
+        Полный снимок записывается, только если этого требует хранилище
+        (например, в журналируемом режиме все изменения уже записаны в журнал).
+        Хранилище и файл блокировки закрываются, даже если запись не удалась.
+
+        Raises:
+            OSError: Если изменения не удалось записать в хранилище.
         """
 
-        self._save_books()
+        if self._flusher is not None:
+            self._flusher_stop.set()
+            self._flusher.join()
+            self._flusher = None
+
+        try:
+            with self._writing():
+                self.flush()
+                # Хранилище, совпадающее с книгами в памяти (после загрузки, сброса или импорта), не перезаписывается.
+                if self._backend.needs_save() and self._saved_generation != self._mutation_generation:
+                    self._save_books()
+        finally:
+            self._backend.close()
+            if self._file_lock is not None:
+                self._file_lock.close()
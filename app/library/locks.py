@@ -0,0 +1,146 @@
+import threading
+
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class ReadWriteLock:
+    """
+    Блокировка «читатели-писатель».
+
+    Несколько потоков могут одновременно удерживать блокировку на чтение, а блокировка на запись
+    исключительна. Ожидающий писатель получает приоритет перед новыми читателями, поэтому поток
+    изменений не голодает при постоянном потоке чтений.
+
+    Блокировка реентерабельна: поток, удерживающий запись, может повторно брать и запись, и чтение;
+    поток, удерживающий чтение, может повторно брать чтение. Повышение чтения до записи
+    не поддерживается, так как приводит к взаимной блокировке двух таких потоков.
+    """
+
+    def __init__(self):
+        """Инициализация блокировки."""
+
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer: int | None = None
+        self._writer_depth = 0
+        self._waiting_writers = 0
+        self._local = threading.local()
+
+    def _holds(self) -> list[str]:
+        """
+        Возвращает стек блокировок, удерживаемых текущим потоком.
+
+        Returns:
+            list[str]: Режимы удерживаемых блокировок ('r' - чтение, 'w' - чтение внутри записи).
+        """
+
+        holds = getattr(self._local, 'holds', None)
+        if holds is None:
+            holds = self._local.holds = []
+        return holds
+
+    def held(self) -> bool:
+        """
+        Удерживает ли текущий поток блокировку в каком-либо режиме.
+
+        Returns:
+            bool: True, если текущий поток удерживает блокировку на чтение или на запись.
+        """
+
+        return self._writer == threading.get_ident() or bool(self._holds())
+
+    def acquire_read(self) -> None:
+        """Захватывает блокировку на чтение."""
+
+        me = threading.get_ident()
+        holds = self._holds()
+        with self._condition:
+            if self._writer == me:
+                self._writer_depth += 1
+                holds.append('w')
+                return
+            if not holds:
+                while self._writer is not None or self._waiting_writers:
+                    self._condition.wait()
+            self._readers += 1
+            holds.append('r')
+
+    def release_read(self) -> None:
+        """Освобождает блокировку на чтение."""
+
+        mode = self._holds().pop()
+        if mode == 'w':
+            self.release_write()
+            return
+
+        with self._condition:
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        """
+        Захватывает блокировку на запись.
+
+        Raises:
+            RuntimeError: Если текущий поток удерживает блокировку только на чтение.
+        """
+
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer == me:
+                self._writer_depth += 1
+                return
+            if self._holds():
+                raise RuntimeError('Нельзя захватить блокировку на запись, удерживая ее на чтение')
+
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._condition.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = me
+            self._writer_depth = 1
+
+    def release_write(self) -> None:
+        """Освобождает блокировку на запись."""
+
+        with self._condition:
+            self._writer_depth -= 1
+            if not self._writer_depth:
+                self._writer = None
+                self._condition.notify_all()
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """
+        Контекстный менеджер блокировки на чтение.
+
+        Example:
+            >>> with lock.read():
+            ...     ...
+        """
+
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """
+        Контекстный менеджер блокировки на запись.
+
+        Example:
+            >>> with lock.write():
+            ...     ...
+        """
+
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
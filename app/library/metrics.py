@@ -0,0 +1,175 @@
+import json
+import threading
+
+from bisect import bisect_left
+from typing import Iterable, Iterator
+
+
+class Metrics:
+    """
+    Метрики операций библиотеки: гистограммы задержек, число вызовов и счетчики по операциям
+    (записанные байты, просмотренные книги).
+
+    Метрики включаются и выключаются во время работы. Выключенные метрики ничего не записывают,
+    а библиотека проверяет только флаг `enabled`, поэтому их накладные расходы близки к нулю.
+    Накопленные значения экспортируются в JSON или в текстовый формат Prometheus.
+
+    Attributes:
+        BUCKETS (tuple[float, ...]): Верхние границы корзин гистограммы задержек в секундах.
+        COUNTERS (dict[str, str]): Счетчики -> их описание.
+        enabled (bool): Записываются ли метрики.
+    """
+
+    BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+    COUNTERS = {
+        'bytes_written': 'Число байтов, записанных в хранилище.',
+        'books_scanned': 'Число книг, просмотренных при поиске.'
+    }
+
+    def __init__(self, enabled: bool = False):
+        """
+        Инициализация метрик.
+
+        Args:
+            enabled (bool, optional): Записывать ли метрики сразу (по умолчанию False).
+        """
+
+        self.enabled = enabled
+        self._histograms: dict[str, list] = {}
+        self._counters: dict[str, dict[str, int]] = {name: {} for name in self.COUNTERS}
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        """Включает запись метрик."""
+
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Выключает запись метрик. Накопленные значения сохраняются."""
+
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Сбрасывает накопленные значения."""
+
+        with self._lock:
+            self._histograms.clear()
+            for values in self._counters.values():
+                values.clear()
+
+    def observe(self, operation: str, seconds: float) -> None:
+        """
+        Учитывает вызов операции и его длительность.
+
+        Args:
+            operation (str): Название операции.
+            seconds (float): Длительность в секундах.
+        """
+
+        with self._lock:
+            histogram = self._histograms.get(operation)
+            if histogram is None:
+                histogram = self._histograms[operation] = [0, 0.0, [0] * (len(self.BUCKETS) + 1)]
+            histogram[0] += 1
+            histogram[1] += seconds
+            histogram[2][bisect_left(self.BUCKETS, seconds)] += 1
+
+    def add(self, counter: str, operation: str, value: int) -> None:
+        """
+        Увеличивает счетчик операции.
+
+        Args:
+            counter (str): Счетчик (`COUNTERS`).
+            operation (str): Название операции.
+            value (int): Приращение.
+        """
+
+        with self._lock:
+            values = self._counters[counter]
+            values[operation] = values.get(operation, 0) + value
+
+    def counted(self, counter: str, operation: str, items: Iterable) -> Iterator:
+        """
+        Пропускает элементы через себя и прибавляет их число к счетчику операции,
+        когда перебор завершен или прерван.
+
+        Args:
+            counter (str): Счетчик (`COUNTERS`).
+            operation (str): Название операции.
+            items (Iterable): Элементы.
+
+        Yields:
+            Any: Очередной элемент.
+        """
+
+        count = 0
+        try:
+            for item in items:
+                count += 1
+                yield item
+        finally:
+            self.add(counter, operation, count)
+
+    def snapshot(self) -> dict:
+        """
+        Возвращает накопленные значения.
+
+        Returns:
+            dict: Флаг 'enabled', операции ('operations': название -> число вызовов 'calls',
+                суммарное время 'seconds' и накопленные по корзинам числа вызовов 'buckets',
+                где ключ - верхняя граница корзины) и счетчики ('counters': счетчик -> операция -> значение).
+
+        Example:
+            >>> library.metrics.snapshot()['operations']['search_books']['calls']
+            3
+        """
+
+        with self._lock:
+            operations = {}
+            for operation, (calls, seconds, buckets) in sorted(self._histograms.items()):
+                cumulative, total = {}, 0
+                for bound, count in zip(self.BUCKETS + (float('inf'),), buckets):
+                    total += count
+                    cumulative['+Inf' if bound == float('inf') else str(bound)] = total
+                operations[operation] = {'calls': calls, 'seconds': seconds, 'buckets': cumulative}
+            counters = {name: dict(sorted(values.items())) for name, values in self._counters.items()}
+        return {'enabled': self.enabled, 'operations': operations, 'counters': counters}
+
+    def to_json(self) -> str:
+        """
+        Возвращает накопленные значения в JSON (см. `snapshot`).
+
+        Returns:
+            str: JSON-документ.
+        """
+
+        return json.dumps(self.snapshot(), ensure_ascii=False)
+
+    def to_prometheus(self, prefix: str = 'library') -> str:
+        """
+        Возвращает накопленные значения в текстовом формате Prometheus.
+
+        Задержки экспортируются гистограммой `<prefix>_operation_seconds`, счетчики - метриками
+        `<prefix>_<счетчик>_total`, с меткой operation.
+
+        Args:
+            prefix (str, optional): Префикс имен метрик (по умолчанию 'library').
+
+        Returns:
+            str: Текст для ответа на запрос Prometheus.
+        """
+
+        snapshot = self.snapshot()
+        name = f'{prefix}_operation_seconds'
+        lines = [f'# HELP {name} Длительность операций библиотеки в секундах.', f'# TYPE {name} histogram']
+        for operation, values in snapshot['operations'].items():
+            for bound, count in values['buckets'].items():
+                lines.append(f'{name}_bucket{{operation="{operation}",le="{bound}"}} {count}')
+            lines.append(f'{name}_sum{{operation="{operation}"}} {values["seconds"]}')
+            lines.append(f'{name}_count{{operation="{operation}"}} {values["calls"]}')
+
+        for counter, values in snapshot['counters'].items():
+            name = f'{prefix}_{counter}_total'
+            lines += [f'# HELP {name} {self.COUNTERS[counter]}', f'# TYPE {name} counter']
+            lines += [f'{name}{{operation="{operation}"}} {value}' for operation, value in values.items()]
+        return '\n'.join(lines) + '\n'
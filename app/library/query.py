@@ -0,0 +1,255 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable
+
+from .book import Book, BookStatus
+
+
+class Predicate(ABC):
+    """
+    Условие запроса к библиотеке.
+
+    Подкласс обязан реализовать `matches` и `describe`, иначе его экземпляр не создается.
+
+    Attributes:
+        COST (int): Относительная стоимость проверки одной книги. Условия без индекса
+            проверяются в порядке возрастания стоимости.
+    """
+
+    COST = 0
+
+    @abstractmethod
+    def matches(self, book: Book) -> bool:
+        """
+        Проверяет, удовлетворяет ли книга условию.
+
+        Args:
+            book (Book): Книга.
+
+        Returns:
+            bool: True, если книга удовлетворяет условию.
+        """
+
+    @abstractmethod
+    def describe(self) -> str:
+        """
+        Возвращает описание условия для плана запроса.
+
+        Returns:
+            str: Описание условия.
+        """
+
+
+class IdEquals(Predicate):
+    """Условие: ID книги равен заданному."""
+
+    def __init__(self, book_id: int):
+        """
+        Args:
+            book_id (int): ID книги.
+        """
+
+        self.book_id = Book.validate_id(book_id)
+
+    def matches(self, book: Book) -> bool:
+        return book.id == self.book_id
+
+    def describe(self) -> str:
+        return f'id == {self.book_id}'
+
+
+class Contains(Predicate):
+    """Условие: поле книги содержит подстроку без учета регистра (как в `Library.search_books`)."""
+
+    COST = 2
+    FIELDS = ('title', 'author', 'year')
+
+    def __init__(self, field: str, keyword: str):
+        """
+        Args:
+            field (str): Поле книги (`FIELDS`).
+            keyword (str): Искомая подстрока.
+
+        Raises:
+            ValueError: Если поле недопустимо.
+        """
+
+        if field not in self.FIELDS:
+            raise ValueError(f'Недопустимое поле для поиска. Допустимые значения: {self.FIELDS}')
+        self.field = field
+        self.keyword = keyword.lower()
+
+    def matches(self, book: Book) -> bool:
+        return self.keyword in str(getattr(book, self.field)).lower()
+
+    def describe(self) -> str:
+        return f'{self.field} содержит {self.keyword!r}'
+
+
+class YearBetween(Predicate):
+    """Условие: год издания книги в диапазоне включительно."""
+
+    COST = 1
+
+    def __init__(self, start_year: int, end_year: int):
+        """
+        Args:
+            start_year (int): Начальный год диапазона.
+            end_year (int): Конечный год диапазона.
+
+        Raises:
+            ValueError: Если начальный год больше конечного.
+        """
+
+        if start_year > end_year:
+            raise ValueError('Начальный год не может быть больше конечного')
+        self.start_year = start_year
+        self.end_year = end_year
+
+    def matches(self, book: Book) -> bool:
+        return self.start_year <= book.year <= self.end_year
+
+    def describe(self) -> str:
+        return f'год от {self.start_year} до {self.end_year}'
+
+
+class StatusEquals(Predicate):
+    """Условие: статус книги равен заданному."""
+
+    COST = 1
+
+    def __init__(self, status: BookStatus):
+        """
+        Args:
+            status (BookStatus): Статус книги.
+
+        Raises:
+            ValueError: Если статус недопустим.
+        """
+
+        self.status = Book.validate_status(status)
+
+    def matches(self, book: Book) -> bool:
+        return book.status is self.status
+
+    def describe(self) -> str:
+        return f'статус == {self.status.value!r}'
+
+
+class Query:
+    """
+    Составной запрос к библиотеке: условия, объединенные по «И», сортировка и ограничение числа книг.
+
+    Методы построения возвращают тот же запрос, поэтому их можно объединять в цепочку.
+    Запрос выполняется методом `Library.query`.
+
+    Attributes:
+        SORT_FIELDS (tuple[str, ...]): Поля, по которым можно сортировать результат.
+        predicates (list[Predicate]): Условия запроса.
+        sort_field (str | None): Поле сортировки или None, если порядок определяется планом запроса.
+        descending (bool): Сортировать по убыванию.
+        max_results (int | None): Максимальное число книг в результате.
+
+    Example:
+        >>> query = (Query().contains('author', 'толстой').year_between(1860, 1880)
+        ...          .status_is(BookStatus.IN_STOCK).order_by('year').limit(10))
+        >>> library.query(query)
+    """
+
+    SORT_FIELDS = ('id', 'title', 'author', 'year', 'status')
+
+    def __init__(self):
+        """Инициализация пустого запроса (все книги библиотеки)."""
+
+        self.predicates: list[Predicate] = []
+        self.sort_field: str | None = None
+        self.descending = False
+        self.max_results: int | None = None
+
+    def where(self, predicate: Predicate) -> 'Query':
+        """
+        Добавляет условие.
+
+        Args:
+            predicate (Predicate): Условие.
+
+        Returns:
+            Query: Текущий запрос.
+        """
+
+        self.predicates.append(predicate)
+        return self
+
+    def id_equals(self, book_id: int) -> 'Query':
+        """Добавляет условие на ID книги (см. `IdEquals`)."""
+
+        return self.where(IdEquals(book_id))
+
+    def contains(self, field: str, keyword: str) -> 'Query':
+        """Добавляет условие на подстроку в поле книги (см. `Contains`)."""
+
+        return self.where(Contains(field, keyword))
+
+    def year_between(self, start_year: int, end_year: int) -> 'Query':
+        """Добавляет условие на диапазон лет издания (см. `YearBetween`)."""
+
+        return self.where(YearBetween(start_year, end_year))
+
+    def status_is(self, status: BookStatus) -> 'Query':
+        """Добавляет условие на статус книги (см. `StatusEquals`)."""
+
+        return self.where(StatusEquals(status))
+
+    def order_by(self, field: str, descending: bool = False) -> 'Query':
+        """
+        Задает сортировку результата. Строки сравниваются без учета регистра.
+
+        Args:
+            field (str): Поле сортировки (`SORT_FIELDS`).
+            descending (bool, optional): Сортировать по убыванию (по умолчанию False).
+
+        Raises:
+            ValueError: Если поле недопустимо.
+
+        Returns:
+            Query: Текущий запрос.
+        """
+
+        if field not in self.SORT_FIELDS:
+            raise ValueError(f'Недопустимое поле для сортировки. Допустимые значения: {self.SORT_FIELDS}')
+        self.sort_field = field
+        self.descending = descending
+        return self
+
+    def limit(self, count: int) -> 'Query':
+        """
+        Ограничивает число книг в результате.
+
+        Args:
+            count (int): Максимальное число книг.
+
+        Raises:
+            ValueError: Если число не является неотрицательным целым.
+
+        Returns:
+            Query: Текущий запрос.
+        """
+
+        if not isinstance(count, int) or count < 0:
+            raise ValueError('Ограничение числа книг должно быть неотрицательным целым числом')
+        self.max_results = count
+        return self
+
+    def sort_key(self) -> Callable[[Book], Any]:
+        """
+        Возвращает функцию ключа сортировки по `sort_field`.
+
+        Returns:
+            Callable[[Book], Any]: Функция ключа сортировки.
+        """
+
+        field = self.sort_field
+        if field == 'status':
+            return lambda book: book.status.value
+        if field in ('title', 'author'):
+            return lambda book: getattr(book, field).lower()
+        return lambda book: getattr(book, field)
@@ -0,0 +1,356 @@
+import json
+import os
+import re
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator
+
+from .book import Book, BookStatus
+
+
+def read_shard(path: str) -> tuple[list[tuple], list[dict]]:
+    """
+    Читает и проверяет файл сегмента. Выполняется в процессах пула при параллельной загрузке.
+
+    Args:
+        path (str): Путь к файлу сегмента.
+
+    Raises:
+        ValueError: Если файл сегмента поврежден.
+
+    Returns:
+        tuple[list[tuple], list[dict]]: Проверенные книги в виде кортежей аргументов `Book.unchecked`
+            и записи, не прошедшие проверку.
+    """
+
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            records = json.load(file)
+    except (OSError, json.JSONDecodeError) as e:
+        raise ValueError(f'Не удалось прочитать сегмент {path}: {e}') from e
+
+    books, invalid = [], []
+    for record in records:
+        try:
+            book = Book.from_dict(record)
+        except ValueError:
+            invalid.append(record)
+            continue
+        books.append((book.id, book.title, book.author, book.year, book.status))
+    return books, invalid
+
+
+class ShardedStorage:
+    """
+    Хранилище, разбитое на сегменты по диапазонам ID.
+
+    Хранилище - каталог с файлами сегментов и манифестом. Сегмент с номером k хранит книги
+    с ID от k * shard_size + 1 до (k + 1) * shard_size в виде JSON-массива. Манифест (`manifest.json`)
+    хранит размер сегмента, последний использованный ID и имена действующих файлов сегментов.
+
+    Изменение перезаписывает только затронутые сегменты, поэтому стоимость записи ограничена
+    размером сегмента, а не размером каталога. Новые версии сегментов записываются в новые файлы,
+    а затем манифест атомарно заменяется (`os.replace`), поэтому пакет изменений, затронувший
+    несколько сегментов, фиксируется целиком или не фиксируется вовсе. Прежние версии файлов
+    удаляются после замены манифеста.
+
+    Сегменты при загрузке читаются и проверяются параллельно в пуле процессов.
+
+    Attributes:
+        MANIFEST (str): Имя файла манифеста.
+        FORMAT (int): Версия формата манифеста.
+        path (str): Путь к каталогу хранилища.
+        shard_size (int): Число ID в одном сегменте.
+        workers (int | None): Число процессов для загрузки сегментов (None - число процессоров,
+            0 или 1 - загрузка в текущем процессе).
+        bytes_written (int): Число байтов, записанных в файлы хранилища с момента создания.
+    """
+
+    MANIFEST = 'manifest.json'
+    FORMAT = 1
+    SHARD_FILE = re.compile(r'shard-\d+-\d+\.json')
+
+    def __init__(self, path: str, shard_size: int = 10000, workers: int | None = None):
+        """
+        Инициализация хранилища. Создает каталог, если его нет.
+
+        Размер сегмента существующего хранилища берется из его манифеста.
+
+        Args:
+            path (str): Путь к каталогу хранилища.
+            shard_size (int, optional): Число ID в одном сегменте для нового хранилища (по умолчанию 10000).
+            workers (int | None, optional): Число процессов для загрузки сегментов (по умолчанию
+                число процессоров). 0 или 1 - загрузка в текущем процессе.
+
+        Raises:
+            ValueError: Если размер сегмента или число процессов недопустимы.
+        """
+
+        if not isinstance(shard_size, int) or shard_size < 1:
+            raise ValueError('Размер сегмента должен быть положительным целым числом')
+        if workers is not None and (not isinstance(workers, int) or workers < 0):
+            raise ValueError('Число процессов должно быть неотрицательным целым числом')
+
+        self.path = path
+        self.shard_size = shard_size
+        self.workers = workers
+        self.bytes_written = 0
+        self._last_id = 0
+        self._generation = 0
+        self._shards: dict[int, str] = {}
+        os.makedirs(path, exist_ok=True)
+        self._read_manifest()
+
+    def _read_manifest(self) -> None:
+        """
+        Читает манифест: размер сегмента, последний ID, поколение и файлы сегментов.
+
+        Raises:
+            ValueError: Если манифест поврежден.
+        """
+
+        try:
+            with open(os.path.join(self.path, self.MANIFEST), 'r', encoding='utf-8') as file:
+                manifest = json.load(file)
+        except FileNotFoundError:
+            self._last_id, self._generation, self._shards = 0, 0, {}
+            return
+        except json.JSONDecodeError as e:
+            raise ValueError(f'Манифест хранилища {self.path} поврежден: {e}') from e
+
+        self.shard_size = manifest['shard_size']
+        self._last_id = manifest['last_id']
+        self._generation = manifest['generation']
+        self._shards = {int(index): name for index, name in manifest['shards'].items()}
+
+    def _write_manifest(self, last_id: int, generation: int, shards: dict[int, str]) -> None:
+        """
+        Атомарно заменяет манифест и запоминает его содержимое.
+
+        Args:
+            last_id (int): Последний использованный ID.
+            generation (int): Поколение хранилища.
+            shards (dict[int, str]): Номер сегмента -> имя файла.
+        """
+
+        manifest = {
+            'format': self.FORMAT,
+            'shard_size': self.shard_size,
+            'last_id': last_id,
+            'generation': generation,
+            'shards': {str(index): shards[index] for index in sorted(shards)}
+        }
+        path = os.path.join(self.path, self.MANIFEST)
+        temp_path = f'{path}.tmp'
+        try:
+            self.bytes_written += self._write_file(temp_path, json.dumps(manifest, indent=4))
+            os.replace(temp_path, path)
+        except BaseException:
+            # Прежний манифест остается действующим; недописанные файлы сегментов удалит следующая запись.
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self._last_id, self._generation, self._shards = last_id, generation, shards
+
+    @staticmethod
+    def _write_file(path: str, text: str) -> int:
+        """
+        Записывает файл и дожидается его записи на диск.
+
+        Args:
+            path (str): Путь к файлу.
+            text (str): Содержимое.
+
+        Returns:
+            int: Число записанных байтов.
+        """
+
+        data = text.encode('utf-8')
+        with open(path, 'wb') as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        return len(data)
+
+    def _shard_index(self, book_id: int) -> int:
+        """
+        Возвращает номер сегмента для ID книги.
+
+        Args:
+            book_id (int): ID книги.
+
+        Returns:
+            int: Номер сегмента.
+        """
+
+        return (book_id - 1) // self.shard_size
+
+    def _write_shard(self, index: int, generation: int, books: Iterable[dict]) -> str:
+        """
+        Записывает новую версию сегмента в новый файл, по одной книге в строке.
+
+        Args:
+            index (int): Номер сегмента.
+            generation (int): Поколение хранилища, в котором записывается версия.
+            books (Iterable[dict]): Книги сегмента в формате `Book.to_dict`.
+
+        Returns:
+            str: Имя файла сегмента.
+        """
+
+        name = f'shard-{index:06d}-{generation}.json'
+        text = '[\n' + ',\n'.join(json.dumps(book, ensure_ascii=False) for book in books) + '\n]\n'
+        self.bytes_written += self._write_file(os.path.join(self.path, name), text)
+        return name
+
+    def _remove_unused(self) -> None:
+        """Удаляет файлы сегментов, на которые не ссылается манифест (прежние версии и остатки сбоев)."""
+
+        used = set(self._shards.values())
+        for name in os.listdir(self.path):
+            if self.SHARD_FILE.fullmatch(name) and name not in used:
+                os.remove(os.path.join(self.path, name))
+
+    def load(self) -> Iterator[dict]:
+        """
+        Читает сегменты в порядке номеров. Сегменты читаются и проверяются параллельно
+        в пуле процессов, пока библиотека применяет уже прочитанные.
+
+        Raises:
+            ValueError: Если манифест или файл сегмента поврежден.
+
+        Yields:
+            dict: Очередная операция загрузки. Проверенные книги передаются готовыми объектами `Book`,
+                а записи, не прошедшие проверку, - словарями, чтобы библиотека сообщила об ошибке.
+        """
+
+        self._read_manifest()
+        yield {'op': 'last_id', 'last_id': self._last_id}
+
+        paths = [os.path.join(self.path, self._shards[index]) for index in sorted(self._shards)]
+        workers = min(self.workers if self.workers is not None else os.cpu_count() or 1, len(paths))
+        if workers <= 1:
+            shards = map(read_shard, paths)
+            yield from self._shard_operations(shards)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from self._shard_operations(executor.map(read_shard, paths))
+
+    @staticmethod
+    def _shard_operations(shards: Iterable[tuple[list[tuple], list[dict]]]) -> Iterator[dict]:
+        """
+        Превращает прочитанные сегменты в операции загрузки.
+
+        Args:
+            shards (Iterable[tuple[list[tuple], list[dict]]]): Результаты `read_shard`.
+
+        Yields:
+            dict: Операция 'add'.
+        """
+
+        for books, invalid in shards:
+            for values in books:
+                yield {'op': 'add', 'book': Book.unchecked(*values)}
+            for record in invalid:
+                yield {'op': 'add', 'book': record}
+
+    def save(self, last_id: int, books: Iterable[Book]) -> None:
+        """
+        Перезаписывает все сегменты и манифест.
+
+        Args:
+            last_id (int): Последний использованный ID.
+            books (Iterable[Book]): Все книги библиотеки.
+        """
+
+        grouped: dict[int, list[Book]] = {}
+        for book in books:
+            grouped.setdefault(self._shard_index(book.id), []).append(book)
+
+        generation = self._generation + 1
+        shards = {}
+        for index, shard_books in grouped.items():
+            shard_books.sort(key=lambda book: book.id)
+            shards[index] = self._write_shard(index, generation, (book.to_dict() for book in shard_books))
+        self._write_manifest(last_id, generation, shards)
+        self._remove_unused()
+
+    def _read_shard_books(self, index: int) -> dict[int, dict]:
+        """
+        Читает текущую версию сегмента без проверки книг.
+
+        Args:
+            index (int): Номер сегмента.
+
+        Returns:
+            dict[int, dict]: ID -> словарь книги; пустой словарь, если сегмента нет.
+        """
+
+        name = self._shards.get(index)
+        if name is None:
+            return {}
+        with open(os.path.join(self.path, name), 'r', encoding='utf-8') as file:
+            return {book['id']: book for book in json.load(file)}
+
+    def commit(self, operations: list[dict]) -> bool:
+        """
+        Фиксирует изменения, перезаписывая только затронутые сегменты, и заменяет манифест.
+
+        Args:
+            operations (list[dict]): Операции 'add', 'delete' или 'status'.
+
+        Raises:
+            ValueError: Если операция неизвестна. Хранилище в этом случае не изменяется.
+
+        Returns:
+            bool: Всегда False - полный снимок не требуется.
+        """
+
+        # Манифест мог заменить другой процесс, работающий с хранилищем.
+        self._read_manifest()
+        touched: dict[int, list[dict]] = {}
+        last_id = self._last_id
+        for operation in operations:
+            kind = operation.get('op')
+            if kind == 'add':
+                book_id = operation['book']['id']
+                last_id = max(last_id, book_id)
+            elif kind in ('delete', 'status'):
+                book_id = operation['id']
+            else:
+                raise ValueError(f'Неизвестная операция: {kind}')
+            touched.setdefault(self._shard_index(book_id), []).append(operation)
+
+        generation = self._generation + 1
+        shards = dict(self._shards)
+        for index, shard_operations in touched.items():
+            books = self._read_shard_books(index)
+            for operation in shard_operations:
+                kind = operation['op']
+                if kind == 'add':
+                    books[operation['book']['id']] = operation['book']
+                elif kind == 'delete':
+                    books.pop(operation['id'], None)
+                elif operation['id'] in books:
+                    books[operation['id']]['status'] = BookStatus.from_value(operation['status']).value
+            if books:
+                shards[index] = self._write_shard(index, generation, (books[key] for key in sorted(books)))
+            else:
+                shards.pop(index, None)
+        self._write_manifest(last_id, generation, shards)
+        self._remove_unused()
+        return False
+
+    def needs_save(self) -> bool:
+        """
+        Все изменения фиксируются сразу, поэтому снимок перед завершением не требуется.
+
+        Returns:
+            bool: Всегда False.
+        """
+
+        return False
+
+    def close(self) -> None:
+        """Файлы открываются только на время операций, освобождать нечего."""
@@ -0,0 +1,176 @@
+import os
+import struct
+import zlib
+
+from typing import Iterable, Iterator
+
+from .book import Book, BookStatus
+
+
+class BinarySnapshot:
+    """
+    Компактный бинарный снимок библиотеки для быстрого запуска.
+
+    Снимок хранится рядом с JSON-файлом и содержит заголовок и записи фиксированной структуры
+    с префиксами длины строк. В заголовке хранятся версия схемы, отпечаток JSON-файла
+    (размер и CRC32), для которого снимок был построен, и контрольная сумма CRC32 записей.
+    Снимок используется, только если все они совпадают, а книги из него создаются без повторной
+    валидации. JSON остается основным форматом хранения и обмена.
+
+    Attributes:
+        path (str): Путь к файлу снимка.
+        MAGIC (bytes): Сигнатура файла снимка.
+        VERSION (int): Версия схемы снимка.
+    """
+
+    MAGIC = b'LIBS'
+    VERSION = 2
+    # Сигнатура, версия, размер JSON, CRC32 JSON, last_id, число книг, CRC32 записей.
+    HEADER = struct.Struct('<4sHQIQII')
+    CHUNK_SIZE = 1024 * 1024
+    # ID, год, индекс статуса, длина названия, длина автора (в байтах UTF-8).
+    RECORD = struct.Struct('<QHBHB')
+    STATUSES = tuple(BookStatus)
+
+    def __init__(self, path: str):
+        """
+        Инициализация снимка.
+
+        Args:
+            path (str): Путь к файлу снимка.
+        """
+
+        self.path = path
+
+    @classmethod
+    def fingerprint(cls, source: str) -> tuple[int, int] | None:
+        """
+        Возвращает отпечаток исходного JSON-файла.
+
+        Вычисление CRC32 по сырым байтам на порядок дешевле разбора JSON и валидации книг.
+
+        Args:
+            source (str): Путь к JSON-файлу.
+
+        Returns:
+            tuple[int, int] | None: Размер и CRC32 файла или None, если файла нет.
+        """
+
+        size = 0
+        checksum = 0
+        try:
+            with open(source, 'rb') as file:
+                while chunk := file.read(cls.CHUNK_SIZE):
+                    size += len(chunk)
+                    checksum = zlib.crc32(chunk, checksum)
+        except FileNotFoundError:
+            return None
+        return size, checksum
+
+    def write(self, source: str, last_id: int, books: Iterable[Book]) -> None:
+        """
+        Записывает снимок для уже сохраненного JSON-файла.
+
+        Файл записывается во временный файл и атомарно заменяет прежний снимок. Снимок - только
+        ускорение запуска, поэтому если книги не помещаются в записи фиксированной структуры,
+        прежний снимок удаляется, и библиотека загружается из JSON.
+
+        Args:
+            source (str): Путь к JSON-файлу, которому соответствует снимок.
+            last_id (int): Последний использованный ID.
+            books (Iterable[Book]): Все книги библиотеки.
+        """
+
+        fingerprint = self.fingerprint(source)
+        if fingerprint is None:
+            return
+
+        status_codes = {status: code for code, status in enumerate(self.STATUSES)}
+        chunks = []
+        count = 0
+        try:
+            for book in books:
+                title = book.title.encode('utf-8')
+                author = book.author.encode('utf-8')
+                chunks.append(self.RECORD.pack(book.id, book.year, status_codes[book.status], len(title), len(author)))
+                chunks.append(title)
+                chunks.append(author)
+                count += 1
+            payload = b''.join(chunks)
+
+            header = self.HEADER.pack(
+                self.MAGIC, self.VERSION, fingerprint[0], fingerprint[1], last_id, count, zlib.crc32(payload)
+            )
+        except struct.error:
+            self.clear()
+            return
+        temp_path = f'{self.path}.tmp'
+        try:
+            with open(temp_path, 'wb') as file:
+                file.write(header)
+                file.write(payload)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def read(self, source: str) -> tuple[int, Iterator[Book]] | None:
+        """
+        Читает снимок, если он соответствует JSON-файлу.
+
+        Args:
+            source (str): Путь к JSON-файлу, которому должен соответствовать снимок.
+
+        Returns:
+            tuple[int, Iterator[Book]] | None: Последний использованный ID и книги или None,
+                если снимка нет либо не совпадают сигнатура, версия схемы, отпечаток JSON-файла
+                или контрольная сумма.
+        """
+
+        try:
+            with open(self.path, 'rb') as file:
+                data = file.read()
+        except FileNotFoundError:
+            return None
+
+        if len(data) < self.HEADER.size:
+            return None
+
+        magic, version, size, source_checksum, last_id, count, checksum = self.HEADER.unpack_from(data)
+        payload = memoryview(data)[self.HEADER.size:]
+        if (magic != self.MAGIC or version != self.VERSION
+                or (size, source_checksum) != self.fingerprint(source) or zlib.crc32(payload) != checksum):
+            return None
+
+        return last_id, self._iter_books(payload, count)
+
+    def _iter_books(self, payload: memoryview, count: int) -> Iterator[Book]:
+        """
+        Последовательно создает книги из записей снимка без валидации.
+
+        Args:
+            payload (memoryview): Записи снимка.
+            count (int): Количество записей.
+
+        Yields:
+            Book: Очередная книга.
+        """
+
+        record = self.RECORD
+        statuses = self.STATUSES
+        offset = 0
+        for _ in range(count):
+            id_, year, status_code, title_length, author_length = record.unpack_from(payload, offset)
+            offset += record.size
+            title = str(payload[offset:offset + title_length], 'utf-8')
+            offset += title_length
+            author = str(payload[offset:offset + author_length], 'utf-8')
+            offset += author_length
+            yield Book.unchecked(id_, title, author, year, statuses[status_code])
+
+    def clear(self) -> None:
+        """Удаляет файл снимка."""
+
+        if os.path.exists(self.path):
+            os.remove(self.path)
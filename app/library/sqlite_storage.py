@@ -0,0 +1,198 @@
+import sqlite3
+
+from typing import Iterable, Iterator
+
+from .book import Book
+
+
+class SqliteStorage:
+    """
+    Хранилище в базе данных SQLite.
+
+    Каждая книга - отдельная строка таблицы `books`, поэтому добавление, удаление и изменение
+    статуса выполняются одним запросом к одной строке, без перезаписи всего каталога.
+    Поиск выполняется библиотекой по книгам в памяти, которые загружаются из хранилища при запуске.
+
+    Attributes:
+        path (str): Путь к файлу базы данных.
+    """
+
+    SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS books ('
+        '    id INTEGER PRIMARY KEY,'
+        '    title TEXT NOT NULL,'
+        '    author TEXT NOT NULL,'
+        '    year INTEGER NOT NULL,'
+        '    status TEXT NOT NULL'
+        ')',
+        'CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)',
+    )
+    COLUMNS = 'id, title, author, year, status'
+    # Столбцы прежней схемы для поиска в SQL: библиотека ищет по книгам в памяти, поэтому они не нужны.
+    LEGACY_COLUMNS = ('title_lower', 'author_lower')
+
+    def __init__(self, path: str):
+        """
+        Инициализация хранилища. Создает файл базы данных и схему, если их нет.
+
+        Args:
+            path (str): Путь к файлу базы данных.
+        """
+
+        self.path = path
+        # Доступ к соединению сериализуется блокировкой библиотеки, поэтому его можно
+        # использовать из фонового потока отложенной записи.
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            for statement in self.SCHEMA:
+                self._connection.execute(statement)
+        self._drop_legacy_columns()
+
+    def _drop_legacy_columns(self) -> None:
+        """
+        Переводит базу данных прежней схемы на текущую: пересоздает таблицу `books` без столбцов
+        `LEGACY_COLUMNS` и ее индексов. Таблица пересоздается одной транзакцией, так как
+        `ALTER TABLE ... DROP COLUMN` доступен не во всех версиях SQLite.
+        """
+
+        columns = {row[1] for row in self._connection.execute('PRAGMA table_info(books)')}
+        if not columns.intersection(self.LEGACY_COLUMNS):
+            return
+
+        with self._connection:
+            self._connection.execute('BEGIN')
+            self._connection.execute('ALTER TABLE books RENAME TO books_legacy')
+            self._connection.execute(self.SCHEMA[0])
+            self._connection.execute(f'INSERT INTO books SELECT {self.COLUMNS} FROM books_legacy')
+            self._connection.execute('DROP TABLE books_legacy')
+
+    @staticmethod
+    def _row_to_dict(row: tuple) -> dict:
+        """
+        Преобразует строку таблицы `books` в словарь формата `Book.to_dict`.
+
+        Args:
+            row (tuple): Значения столбцов `COLUMNS`.
+
+        Returns:
+            dict: Словарь книги.
+        """
+
+        id_, title, author, year, status = row
+        return {'id': id_, 'title': title, 'author': author, 'year': year, 'status': status}
+
+    @staticmethod
+    def _book_to_row(book: dict) -> tuple:
+        """
+        Преобразует словарь книги в строку таблицы `books`.
+
+        Args:
+            book (dict): Словарь книги в формате `Book.to_dict`.
+
+        Returns:
+            tuple: Значения столбцов `COLUMNS`.
+        """
+
+        return book['id'], book['title'], book['author'], book['year'], book['status']
+
+    def _set_last_id(self, last_id: int) -> None:
+        """
+        Обновляет последний использованный ID, если новое значение больше сохраненного.
+
+        Args:
+            last_id (int): Последний использованный ID.
+        """
+
+        self._connection.execute(
+            'INSERT INTO meta (key, value) VALUES (\'last_id\', ?) '
+            'ON CONFLICT (key) DO UPDATE SET value = max(value, excluded.value)',
+            (last_id,)
+        )
+
+    @property
+    def last_id(self) -> int:
+        """
+        Последний использованный ID.
+
+        Returns:
+            int: Последний ID или 0, если книг еще не было.
+        """
+
+        row = self._connection.execute('SELECT value FROM meta WHERE key = \'last_id\'').fetchone()
+        return row[0] if row else 0
+
+    def load(self) -> Iterator[dict]:
+        """
+        Последовательно читает книги из базы данных в порядке ID.
+
+        Yields:
+            dict: Очередная операция загрузки.
+        """
+
+        yield {'op': 'last_id', 'last_id': self.last_id}
+        for row in self._connection.execute(f'SELECT {self.COLUMNS} FROM books ORDER BY id'):
+            yield {'op': 'add', 'book': self._row_to_dict(row)}
+
+    def save(self, last_id: int, books: Iterable[Book]) -> None:
+        """
+        Заменяет содержимое базы данных полным снимком в одной транзакции.
+
+        Args:
+            last_id (int): Последний использованный ID.
+            books (Iterable[Book]): Все книги библиотеки.
+        """
+
+        with self._connection:
+            self._connection.execute('DELETE FROM books')
+            self._connection.execute('DELETE FROM meta WHERE key = \'last_id\'')
+            self._connection.executemany(
+                'INSERT INTO books VALUES (?, ?, ?, ?, ?)',
+                (self._book_to_row(book.to_dict()) for book in books)
+            )
+            self._set_last_id(last_id)
+
+    def commit(self, operations: list[dict]) -> bool:
+        """
+        Фиксирует изменения в одной транзакции, по одному запросу к одной строке на операцию.
+
+        Args:
+            operations (list[dict]): Операции 'add', 'delete' или 'status'.
+
+        Raises:
+            ValueError: Если операция неизвестна. Транзакция в этом случае откатывается.
+
+        Returns:
+            bool: Всегда False - полный снимок не требуется.
+        """
+
+        with self._connection:
+            for operation in operations:
+                kind = operation.get('op')
+                if kind == 'add':
+                    row = self._book_to_row(operation['book'])
+                    self._connection.execute('INSERT OR REPLACE INTO books VALUES (?, ?, ?, ?, ?)', row)
+                    self._set_last_id(row[0])
+                elif kind == 'delete':
+                    self._connection.execute('DELETE FROM books WHERE id = ?', (operation['id'],))
+                elif kind == 'status':
+                    self._connection.execute(
+                        'UPDATE books SET status = ? WHERE id = ?', (operation['status'], operation['id'])
+                    )
+                else:
+                    raise ValueError(f'Неизвестная операция: {kind}')
+        return False
+
+    def needs_save(self) -> bool:
+        """
+        Все изменения фиксируются сразу, поэтому снимок перед завершением не требуется.
+
+        Returns:
+            bool: Всегда False.
+        """
+
+        return False
+
+    def close(self) -> None:
+        """Закрывает соединение с базой данных."""
+
+        self._connection.close()
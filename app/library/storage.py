@@ -0,0 +1,304 @@
+import json
+import os
+
+from itertools import islice
+from typing import Iterable, Iterator, Protocol, TextIO
+
+from .book import Book
+from .journal import Journal
+from .jsonstream import iter_json_object
+from .snapshot import BinarySnapshot
+
+
+class StorageBackend(Protocol):
+    """
+    Протокол хранилища данных библиотеки.
+
+    Хранилище отдает свое содержимое в виде последовательности операций, которые библиотека
+    применяет к книгам в памяти:
+
+    - {'op': 'reset'} - сбросить все загруженные ранее данные;
+    - {'op': 'last_id', 'last_id': int} - последний использованный ID;
+    - {'op': 'add', 'book': dict | Book} - добавить книгу (словарь в формате `Book.to_dict`, который
+      проходит валидацию, или готовый объект `Book` из доверенного источника);
+    - {'op': 'delete', 'id': int} - удалить книгу;
+    - {'op': 'status', 'id': int, 'status': str} - изменить статус книги.
+
+    Операции 'add', 'delete' и 'status' передаются и в обратную сторону - в метод `commit`
+    (по одной или пакетом, если изменения сделаны в транзакции).
+
+    Attributes:
+        path (str): Путь к хранилищу.
+    """
+
+    path: str
+
+    def load(self) -> Iterator[dict]:
+        """
+        Последовательно читает содержимое хранилища.
+
+        Yields:
+            dict: Очередная операция загрузки.
+        """
+
+    def save(self, last_id: int, books: Iterable[Book]) -> None:
+        """
+        Записывает полный снимок библиотеки.
+
+        Args:
+            last_id (int): Последний использованный ID.
+            books (Iterable[Book]): Все книги библиотеки.
+        """
+
+    def commit(self, operations: list[dict]) -> bool:
+        """
+        Атомарно фиксирует пакет изменений.
+
+        Args:
+            operations (list[dict]): Операции 'add', 'delete' или 'status' в порядке выполнения.
+
+        Returns:
+            bool: True, если для фиксации изменения требуется записать полный снимок через `save`.
+        """
+
+    def needs_save(self) -> bool:
+        """
+        Проверяет, нужно ли записать полный снимок перед завершением работы.
+
+        Returns:
+            bool: True, если перед завершением требуется записать полный снимок через `save`.
+        """
+
+    def close(self) -> None:
+        """Освобождает ресурсы хранилища."""
+
+
+class JsonStorage:
+    """
+    Хранилище в виде JSON-документа с необязательным журналом операций.
+
+    Без журнала любое изменение приводит к полной перезаписи документа. В журналируемом режиме
+    изменения дописываются в журнал, а при превышении лимитов журнал уплотняется записью
+    полного снимка. Непустой журнал воспроизводится при загрузке в любом режиме, поэтому
+    переключение режима не теряет изменений.
+
+    Дополнительно рядом с JSON-файлом может вестись бинарный снимок (`BinarySnapshot`),
+    из которого книги загружаются без разбора JSON и повторной валидации, если снимок
+    соответствует текущему JSON-файлу.
+
+    Attributes:
+        path (str): Путь к JSON-файлу снимка.
+        journal (Journal): Журнал операций (файл с расширением .journal рядом со снимком).
+        journal_enabled (bool): Включен ли журналируемый режим.
+        max_size (int): Размер журнала в байтах, после превышения которого требуется уплотнение.
+        max_ratio (float): Отношение числа операций в журнале к числу книг,
+            после превышения которого требуется уплотнение.
+        snapshot (BinarySnapshot | None): Бинарный снимок (файл с расширением .snapshot рядом со снимком)
+            или None, если он выключен.
+        bytes_written (int): Число байтов, записанных в файлы хранилища с момента создания.
+    """
+
+    # Число книг, которые сериализуются и записываются в файл снимка одной записью.
+    SAVE_CHUNK_SIZE = 1000
+
+    def __init__(
+            self,
+            path: str,
+            journal: bool = False,
+            max_size: int = 1024 * 1024,
+            max_ratio: float = 0.5,
+            binary_snapshot: bool = False
+    ):
+        """
+        Инициализация хранилища.
+
+        Args:
+            path (str): Путь к JSON-файлу снимка.
+            journal (bool, optional): Включает журналируемый режим (по умолчанию False).
+            max_size (int, optional): Лимит размера журнала в байтах (по умолчанию 1 МиБ).
+            max_ratio (float, optional): Лимит отношения числа операций к числу книг (по умолчанию 0.5).
+            binary_snapshot (bool, optional): Включает бинарный снимок для быстрого запуска (по умолчанию False).
+        """
+
+        self.path = path
+        base_path = os.path.splitext(path)[0]
+        self.journal = Journal(base_path + '.journal')
+        self.snapshot = BinarySnapshot(base_path + '.snapshot') if binary_snapshot else None
+        self._snapshot_stale = False
+        self.journal_enabled = journal
+        self.max_size = max_size
+        self.max_ratio = max_ratio
+        self._books_count = 0
+        self.bytes_written = 0
+
+    def _track(self, operation: dict) -> None:
+        """
+        Учитывает операцию в счетчике книг, по которому оценивается размер журнала.
+
+        Args:
+            operation (dict): Операция загрузки или изменения.
+        """
+
+        kind = operation.get('op')
+        if kind == 'add':
+            self._books_count += 1
+        elif kind == 'delete':
+            self._books_count = max(self._books_count - 1, 0)
+        elif kind == 'reset':
+            self._books_count = 0
+
+    def _load_snapshot(self) -> Iterator[dict]:
+        """
+        Потоково читает JSON-снимок.
+
+        Если бинарный снимок включен и соответствует JSON-файлу, книги загружаются из него.
+        Иначе бинарный снимок помечается устаревшим и будет перезаписан при следующем сохранении.
+        Если файл отсутствует, ничего не возвращает. Если документ поврежден, возвращает операцию 'reset'.
+
+        Yields:
+            dict: Очередная операция загрузки.
+        """
+
+        if self.snapshot is not None:
+            cached = self.snapshot.read(self.path)
+            if cached is not None:
+                last_id, books = cached
+                yield {'op': 'last_id', 'last_id': last_id}
+                for book in books:
+                    yield {'op': 'add', 'book': book}
+                return
+            self._snapshot_stale = True
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                for key, value in iter_json_object(file, stream_keys=('books',)):
+                    if key == 'books':
+                        yield {'op': 'add', 'book': value}
+                    elif key == 'last_id':
+                        yield {'op': 'last_id', 'last_id': value}
+        except FileNotFoundError:
+            return
+        except json.JSONDecodeError:
+            yield {'op': 'reset'}
+
+    def load(self) -> Iterator[dict]:
+        """
+        Читает снимок, а затем воспроизводит поверх него операции журнала.
+
+        Yields:
+            dict: Очередная операция загрузки.
+        """
+
+        self._books_count = 0
+        for operation in self._load_snapshot():
+            self._track(operation)
+            yield operation
+        for operation in self.journal.replay():
+            self._track(operation)
+            yield operation
+
+    def save(self, last_id: int, books: Iterable[Book]) -> None:
+        """
+        Перезаписывает JSON-снимок и очищает журнал, так как снимок включает все его операции.
+
+        Документ записывается во временный файл, который затем атомарно заменяет прежний
+        (`os.replace`), поэтому сбой во время записи не повреждает сохраненные данные.
+
+        Args:
+            last_id (int): Последний использованный ID.
+            books (Iterable[Book]): Все книги библиотеки.
+        """
+
+        temp_path = f'{self.path}.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                count = self._write_document(file, last_id, books)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self.path)
+        except BaseException:
+            # Недописанный временный файл не должен оставаться рядом с хранилищем.
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self.bytes_written += os.path.getsize(self.path)
+
+        if self.snapshot is not None:
+            self.snapshot.write(self.path, last_id, books)
+            self._snapshot_stale = False
+            self.bytes_written += os.path.getsize(self.snapshot.path)
+
+        self._books_count = count
+        if self.journal.size:
+            self.journal.clear()
+
+    @classmethod
+    def _write_document(cls, file: TextIO, last_id: int, books: Iterable[Book]) -> int:
+        """
+        Потоково записывает JSON-документ снимка: книги сериализуются и записываются пачками
+        по `SAVE_CHUNK_SIZE`, по одной книге в строке, без построения списка всех книг.
+
+        Args:
+            file (TextIO): Файл для записи.
+            last_id (int): Последний использованный ID.
+            books (Iterable[Book]): Все книги библиотеки.
+
+        Returns:
+            int: Число записанных книг.
+        """
+
+        file.write(f'{{\n    "last_id": {json.dumps(last_id)},\n    "books": [')
+        books = iter(books)
+        count = 0
+        while chunk := list(islice(books, cls.SAVE_CHUNK_SIZE)):
+            separator = ',\n        ' if count else '\n        '
+            file.write(separator + ',\n        '.join(
+                json.dumps(book.to_dict(), ensure_ascii=False) for book in chunk
+            ))
+            count += len(chunk)
+        file.write('\n    ]\n}\n' if count else ']\n}\n')
+        return count
+
+    def needs_compaction(self) -> bool:
+        """
+        Проверяет, превышен ли допустимый размер журнала.
+
+        Returns:
+            bool: True, если журнал превысил лимит по размеру или по отношению к числу книг.
+        """
+
+        return (self.journal.size > self.max_size
+                or self.journal.entries > self.max_ratio * self._books_count)
+
+    def commit(self, operations: list[dict]) -> bool:
+        """
+        Фиксирует изменения: в журналируемом режиме дописывает операции в журнал одной записью.
+
+        Args:
+            operations (list[dict]): Операции изменения.
+
+        Returns:
+            bool: True, если требуется полная перезапись (журнал выключен или требует уплотнения).
+        """
+
+        if not self.journal_enabled:
+            return True
+
+        self.bytes_written += self.journal.append(operations)
+        for operation in operations:
+            self._track(operation)
+        return self.needs_compaction()
+
+    def needs_save(self) -> bool:
+        """
+        Без журнала документ перезаписывается при завершении, с журналом - только для уплотнения
+        или для обновления устаревшего бинарного снимка.
+
+        Returns:
+            bool: True, если требуется записать полный снимок.
+        """
+
+        return not self.journal_enabled or self.needs_compaction() or self._snapshot_stale
+
+    def close(self) -> None:
+        """Файлы открываются только на время операций, освобождать нечего."""
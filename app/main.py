@@ -1,9 +1,134 @@
-from app.library import Library, BookInterface, BookStatus
-from app.utils import get_int_input, get_str_input
+from datetime import datetime, timezone
+from functools import partial
 
+from app.library import Book, Library, BookInterface, BookStatus, Query
+from app.utils import get_int_input, get_optional_input, get_str_input
 
-def main(library_: Library):
-    """Основная функция для взаимодействия с пользователем."""
+# Число книг на одной странице при просмотре всех книг.
+PAGE_SIZE = 20
+
+
+def next_page() -> bool:
+    """
+    Пейджер: запрашивает у пользователя, показывать ли следующую страницу.
+
+    Returns:
+        bool: False, если пользователь прекратил просмотр.
+    """
+
+    return input('Enter - следующая страница, q - закончить просмотр: ').strip().lower() != 'q'
+
+
+def parse_year(value: str) -> int:
+    """
+    Преобразует введенную строку в год издания с валидацией.
+
+    Args:
+        value (str): Введенная строка.
+
+    Raises:
+        ValueError: Если строка не является допустимым годом издания.
+
+    Returns:
+        int: Год издания.
+    """
+
+    if not value.lstrip('-').isdigit():
+        raise ValueError('Введено не число')
+    return Book.validate_year(int(value))
+
+
+def parse_limit(value: str) -> int:
+    """
+    Преобразует введенную строку в ограничение числа книг.
+
+    Args:
+        value (str): Введенная строка.
+
+    Raises:
+        ValueError: Если строка не является положительным целым числом.
+
+    Returns:
+        int: Максимальное число книг.
+    """
+
+    if not value.isdigit() or int(value) < 1:
+        raise ValueError('Ограничение должно быть положительным целым числом')
+    return int(value)
+
+
+def parse_sort_field(value: str) -> str:
+    """
+    Проверяет введенное поле сортировки.
+
+    Args:
+        value (str): Введенная строка.
+
+    Raises:
+        ValueError: Если поле недопустимо.
+
+    Returns:
+        str: Поле сортировки.
+    """
+
+    if value not in Query.SORT_FIELDS:
+        raise ValueError(f'Допустимые значения: {Query.SORT_FIELDS}')
+    return value
+
+
+def input_query() -> Query:
+    """
+    Запрашивает у пользователя условия комбинированного поиска.
+
+    Любое условие можно пропустить пустым вводом.
+
+    Raises:
+        ValueError: Если начальный год больше конечного.
+
+    Returns:
+        Query: Составной запрос.
+    """
+
+    skip = ' (Enter - пропустить): '
+    query = Query()
+
+    author = get_optional_input(f'Автор содержит{skip}')
+    if author:
+        query.contains('author', author)
+    title = get_optional_input(f'Название содержит{skip}')
+    if title:
+        query.contains('title', title)
+
+    start_year = get_optional_input(f'Год издания от{skip}', parse_year)
+    end_year = get_optional_input(f'Год издания до{skip}', parse_year)
+    if start_year is not None or end_year is not None:
+        query.year_between(
+            Book.MIN_YEAR if start_year is None else start_year,
+            datetime.now(timezone.utc).year if end_year is None else end_year
+        )
+
+    status = get_optional_input(f'Статус {tuple(BookStatus.values())}{skip}', BookStatus.from_value)
+    if status is not None:
+        query.status_is(status)
+
+    sort_field = get_optional_input(f'Сортировать по {Query.SORT_FIELDS}{skip}', parse_sort_field)
+    if sort_field is not None:
+        query.order_by(sort_field)
+    limit = get_optional_input(f'Максимальное число книг{skip}', parse_limit)
+    if limit is not None:
+        query.limit(limit)
+    return query
+
+
+def main(library_: Library, page_size: int | None = PAGE_SIZE):
+    """
+    Основная функция для взаимодействия с пользователем.
+
+    Args:
+        library_ (Library): Библиотека.
+        page_size (int | None, optional): Число книг на странице при просмотре всех книг
+            (по умолчанию `PAGE_SIZE`). None - выводить все книги без остановки.
+    """
 
     while True:
         print(
@@ -12,15 +137,19 @@ def main(library_: Library):
             '3. Найти книгу\n'
             '4. Показать все книги\n'
             '5. Изменить статус книги\n'
-            '6. Выйти\n'
+            '6. Найти книги по годам издания\n'
+            '7. Комбинированный поиск\n'
+            '8. Сводка по статусам\n'
+            '9. Выйти\n'
         )
 
-        choice = get_int_input('Выберите действие: ', valid_values=range(1, 7))
+        choice = get_int_input('Выберите действие: ', valid_values=range(1, 10))
 
         if choice == 1:
             # Добавляем книгу
-            title = BookInterface.input_title()
-            author = BookInterface.input_author()
+            # По Tab подсказываются уже существующие названия и авторы
+            title = BookInterface.input_title(complete=partial(library_.suggest, 'title'))
+            author = BookInterface.input_author(complete=partial(library_.suggest, 'author'))
             year = BookInterface.input_year()
             print()
             library_.add_book(title, author, year)
@@ -39,12 +168,19 @@ def main(library_: Library):
                 f'Введите по какому полю искать {library_.SEARCH_FIELDS}: ',
                 valid_values=library_.SEARCH_FIELDS
             )
-            keyword = get_str_input('Введите ключевое слово для поиска: ')
+            keyword = get_str_input(
+                'Введите ключевое слово для поиска: ',
+                complete=partial(library_.suggest, field) if field in library_.TEXT_INDEX_FIELDS else None
+            )
             print()
             found_books = library_.search_books(keyword, field)
             if found_books:
                 print('Результат поиска:')
                 library_.display_books(found_books)
+            elif field in library_.TEXT_INDEX_FIELDS and (similar_books := library_.search_fuzzy(keyword, field)):
+                # Точных совпадений нет - показываем книги с похожим написанием
+                print('Точных совпадений нет. Возможно, вы искали:')
+                library_.display_books(similar_books)
             else:
                 print('Книги не найдены.')
             print(f'{"-" * 25}')
@@ -52,7 +188,7 @@ def main(library_: Library):
         elif choice == 4:
             # Выводим список доступных книг
             print()
-            library_.list_books()
+            library_.list_books(page_size=page_size, pager=next_page if page_size else None)
             print(f'{"-" * 25}')
 
         elif choice == 5:
@@ -64,8 +200,49 @@ def main(library_: Library):
             print(f'{"-" * 25}')
 
         elif choice == 6:
-            # Завершаем работу
-            library_.exit()
+            # Ищем книги по диапазону лет
+            start_year = BookInterface.input_year('Введите начальный год: ')
+            end_year = BookInterface.input_year('Введите конечный год: ')
+            print()
+            try:
+                found_books = library_.search_by_year_range(start_year, end_year)
+            except ValueError as e:
+                print(f'Ошибка: {e}')
+            else:
+                if found_books:
+                    print('Результат поиска:')
+                    library_.display_books(found_books)
+                else:
+                    print('Книги не найдены.')
+            print(f'{"-" * 25}')
+
+        elif choice == 7:
+            # Ищем книги по нескольким условиям
+            try:
+                query = input_query()
+            except ValueError as e:
+                print(f'\nОшибка: {e}')
+            else:
+                print()
+                found_books = library_.query(query)
+                if found_books:
+                    print('Результат поиска:')
+                    library_.display_books(found_books)
+                else:
+                    print('Книги не найдены.')
+            print(f'{"-" * 25}')
+
+        elif choice == 8:
+            # Выводим число книг с каждым статусом
+            counts = library_.count_by_status()
+            print()
+            for status, count in counts.items():
+                print(f'{status.value.capitalize()}: {count}')
+            print(f'Всего: {sum(counts.values())}')
+            print(f'{"-" * 25}')
+
+        elif choice == 9:
+            # Завершаем работу; изменения записывает library.exit() в вызывающем коде
             print('\nСпасибо за использование библиотеки!')
             break
 
@@ -74,9 +251,14 @@ def main(library_: Library):
 
 
 if __name__ == '__main__':
-    library = Library()
+    # Изменения записываются фоновым потоком не чаще раза в секунду, а при любом завершении
+    # (выход из меню, Ctrl+C или необработанная ошибка) метод exit гарантированно сбрасывает их на диск.
+    # Несколько запущенных приложений могут работать с одним файлом, не затирая изменения друг друга.
+    library = Library(flush_interval=1.0, multiprocess=True, fuzzy_index=True, prefix_index=True)
     try:
-        main(library)
+        try:
+            main(library)
+        finally:
+            library.exit()
     except KeyboardInterrupt:
-        library.exit()
         print('\n\nСпасибо за использование библиотеки!')
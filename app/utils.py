@@ -1,5 +1,11 @@
+from contextlib import contextmanager
 from functools import wraps
-from typing import Iterable, Callable
+from typing import Any, Iterable, Iterator, Callable
+
+try:
+    import readline
+except ImportError:  # Windows: автодополнение ввода недоступно
+    readline = None
 
 
 def handle_input_errors(func: Callable) -> Callable:
@@ -27,6 +33,42 @@ def handle_input_errors(func: Callable) -> Callable:
     return _wrapper
 
 
+@contextmanager
+def autocomplete(complete: Callable[[str], list[str]] | None) -> Iterator[None]:
+    """
+    Контекстный менеджер автодополнения ввода по клавише Tab.
+
+    На время блока подсказки для введенного начала строки берутся из функции `complete`.
+    Дополняется вся строка целиком, поэтому подсказки могут содержать пробелы (например, имя автора).
+    Если модуль `readline` недоступен или функция не указана, ввод работает как обычно.
+
+    Args:
+        complete (Callable[[str], list[str]] | None): Функция, возвращающая подсказки для префикса.
+    """
+
+    if complete is None or readline is None:
+        yield
+        return
+
+    matches: list[str] = []
+
+    def _completer(text: str, state: int) -> str | None:
+        if state == 0:
+            matches[:] = complete(readline.get_line_buffer())
+        return matches[state] if state < len(matches) else None
+
+    previous_completer = readline.get_completer()
+    previous_delims = readline.get_completer_delims()
+    readline.set_completer(_completer)
+    readline.set_completer_delims('')
+    readline.parse_and_bind('tab: complete')
+    try:
+        yield
+    finally:
+        readline.set_completer(previous_completer)
+        readline.set_completer_delims(previous_delims)
+
+
 @handle_input_errors
 def get_int_input(prompt: str, valid_values: Iterable[int] | None = None) -> int:
     """
@@ -62,7 +104,11 @@ def get_int_input(prompt: str, valid_values: Iterable[int] | None = None) -> int
 
 
 @handle_input_errors
-def get_str_input(prompt: str, valid_values: Iterable[str] | None = None) -> str:
+def get_str_input(
+        prompt: str,
+        valid_values: Iterable[str] | None = None,
+        complete: Callable[[str], list[str]] | None = None
+) -> str:
     """
     Функция для получения строкового ввода от пользователя.
 
@@ -73,6 +119,8 @@ def get_str_input(prompt: str, valid_values: Iterable[str] | None = None) -> str
         prompt (str): Сообщение, отображаемое пользователю для ввода.
         valid_values (Iterable[str], optional): Набор допустимых строк.
             Если указан, введенное значение должно быть в этом наборе.
+        complete (Callable[[str], list[str]], optional): Функция подсказок для автодополнения
+            по клавише Tab (см. `autocomplete`).
 
     Raises:
         ValueError: Если введенное значение не входит в набор допустимых значений.
@@ -81,9 +129,33 @@ def get_str_input(prompt: str, valid_values: Iterable[str] | None = None) -> str
         str: Корректная строка, введенная пользователем.
     """
 
-    user_input = input(prompt).strip()
+    with autocomplete(complete):
+        user_input = input(prompt).strip()
 
     if valid_values and user_input not in valid_values:
         raise ValueError(f'Допустимые значения: {tuple(valid_values)}')
 
     return user_input
+
+
+@handle_input_errors
+def get_optional_input(prompt: str, convert: Callable[[str], Any] = str) -> Any | None:
+    """
+    Функция для получения необязательного ввода от пользователя.
+
+    Пустой ввод означает, что значение пропущено. Непустой ввод преобразуется
+    функцией `convert`, которая может выполнять и валидацию.
+
+    Args:
+        prompt (str): Сообщение, отображаемое пользователю для ввода.
+        convert (Callable[[str], Any], optional): Функция преобразования введенной строки (по умолчанию str).
+
+    Raises:
+        ValueError: Если введенное значение не проходит преобразование.
+
+    Returns:
+        Any | None: Преобразованное значение или None, если ввод пустой.
+    """
+
+    user_input = input(prompt).strip()
+    return convert(user_input) if user_input else None
@@ -0,0 +1,2 @@
+from .catalog import generate_books, write_catalog
+from .runner import benchmark_catalog, compare, run_benchmarks
@@ -0,0 +1,75 @@
+import argparse
+import json
+import sys
+import tempfile
+
+from .runner import STORAGE_EXTENSIONS, compare, run_benchmarks
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Разбирает аргументы командной строки.
+
+    Args:
+        argv (list[str] | None, optional): Аргументы (по умолчанию `sys.argv[1:]`).
+
+    Returns:
+        argparse.Namespace: Разобранные аргументы.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Замеры производительности Library на синтетических каталогах.'
+    )
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help='размеры каталогов (по умолчанию 1000 10000 100000)')
+    parser.add_argument('--repeat', type=int, default=5, help='число замеров каждой операции (по умолчанию 5)')
+    parser.add_argument('--storage', choices=tuple(STORAGE_EXTENSIONS), default='json',
+                        help='тип хранилища (по умолчанию json)')
+    parser.add_argument('--seed', type=int, default=0, help='начальное значение генератора каталога')
+    parser.add_argument('--output', default='-', help='файл для результатов в JSON (по умолчанию stdout)')
+    parser.add_argument('--baseline', help='файл результатов предыдущего запуска для поиска регрессий')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='допустимое относительное замедление (по умолчанию 0.2)')
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Выполняет замеры, записывает результаты и сравнивает их с базовым запуском.
+
+    Args:
+        argv (list[str] | None, optional): Аргументы командной строки (по умолчанию `sys.argv[1:]`).
+
+    Returns:
+        int: Код завершения: 1, если найдены регрессии, иначе 0.
+    """
+
+    args = parse_args(argv)
+    with tempfile.TemporaryDirectory() as workdir:
+        results = run_benchmarks(args.sizes, workdir, args.repeat, args.storage, args.seed)
+
+    document = json.dumps(results, ensure_ascii=False, indent=4)
+    if args.output == '-':
+        print(document)
+    else:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(document)
+
+    for result in results['results']:
+        print(f"{result['size']:>9} {result['operation']:<22} {result['median_seconds'] * 1000:>11.3f} мс"
+              f" {result['peak_memory_bytes'] / 1024 / 1024:>9.2f} МиБ", file=sys.stderr)
+
+    if args.baseline is None:
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as file:
+        regressions = compare(json.load(file), results, args.tolerance)
+    for regression in regressions:
+        print(f"Регрессия: {regression['operation']} на {regression['size']} книгах -"
+              f" в {regression['ratio']:.2f} раза медленнее", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
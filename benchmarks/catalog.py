@@ -0,0 +1,109 @@
+import random
+
+from datetime import datetime, timezone
+from typing import Iterator
+
+from app.library import Book, BookStatus, JsonStorage, Library, SqliteStorage
+
+SURNAMES = (
+    'Толстой', 'Достоевский', 'Чехов', 'Тургенев', 'Гоголь', 'Пушкин', 'Лермонтов', 'Булгаков',
+    'Бунин', 'Куприн', 'Гончаров', 'Лесков', 'Островский', 'Шолохов', 'Пастернак', 'Набоков',
+    'Ахматова', 'Цветаева', 'Платонов', 'Салтыков',
+    'Austen', 'Dickens', 'Hemingway', 'Orwell', 'Tolkien', 'Twain', 'Woolf', 'Joyce',
+    'Faulkner', 'Steinbeck', 'Hardy', 'Bronte', 'Eliot', 'Melville', 'Poe', 'Wilde'
+)
+CYRILLIC_INITIALS = 'АБВГДЕЖЗИКЛМНОПРСТФЭЮЯ'
+LATIN_INITIALS = 'ABCDEFGHIJKLMNOPRSTW'
+TITLE_WORDS = (
+    'Война', 'мир', 'Преступление', 'наказание', 'Отцы', 'дети', 'Белая', 'гвардия', 'Тихий', 'Дон',
+    'Мастер', 'Маргарита', 'Мертвые', 'души', 'Герой', 'нашего', 'времени', 'Вишневый', 'сад',
+    'Pride', 'Prejudice', 'Great', 'Expectations', 'Old', 'Man', 'Sea', 'Animal', 'Farm',
+    'Hobbit', 'Ulysses', 'Waves', 'Moby', 'Dick', 'Raven', 'Portrait', 'Light', 'August'
+)
+
+
+def generate_author(rng: random.Random) -> str:
+    """
+    Генерирует имя автора в формате «Фамилия И.О.», проходящее `Book.validate_author`.
+
+    Фамилия и инициалы берутся из одного алфавита (кириллица или латиница).
+
+    Args:
+        rng (random.Random): Генератор случайных чисел.
+
+    Returns:
+        str: Имя автора.
+    """
+
+    surname = rng.choice(SURNAMES)
+    initials = CYRILLIC_INITIALS if surname[0] >= 'А' else LATIN_INITIALS
+    return f'{surname} {rng.choice(initials)}.{rng.choice(initials)}.'
+
+
+def generate_title(rng: random.Random, number: int) -> str:
+    """
+    Генерирует название книги из 1-4 слов и номера, проходящее `Book.validate_title`.
+
+    Args:
+        rng (random.Random): Генератор случайных чисел.
+        number (int): Номер книги, который делает название уникальным.
+
+    Returns:
+        str: Название книги.
+    """
+
+    words = ' '.join(rng.sample(TITLE_WORDS, rng.randint(1, 4)))
+    return f'{words} {number}'[-Book.MAX_TITLE_LENGTH:].strip()
+
+
+def generate_books(count: int, seed: int = 0) -> Iterator[Book]:
+    """
+    Генерирует синтетический каталог валидных книг с ID от 1 до `count`.
+
+    При одинаковом `seed` генерируется один и тот же каталог, поэтому результаты замеров
+    разных запусков сопоставимы.
+
+    Args:
+        count (int): Число книг.
+        seed (int, optional): Начальное значение генератора случайных чисел (по умолчанию 0).
+
+    Raises:
+        ValueError: Если число книг отрицательное.
+
+    Yields:
+        Book: Очередная книга.
+    """
+
+    if not isinstance(count, int) or count < 0:
+        raise ValueError('Число книг должно быть неотрицательным целым числом')
+
+    rng = random.Random(seed)
+    current_year = datetime.now(timezone.utc).year
+    for book_id in range(1, count + 1):
+        status = BookStatus.BORROWED if rng.random() < 0.3 else BookStatus.IN_STOCK
+        yield Book(
+            book_id,
+            generate_title(rng, book_id),
+            generate_author(rng),
+            rng.randint(Book.MIN_YEAR, current_year),
+            status
+        )
+
+
+def write_catalog(path: str, count: int, seed: int = 0) -> None:
+    """
+    Записывает синтетический каталог в хранилище, не создавая `Library`.
+
+    Тип хранилища выбирается по расширению файла так же, как в `Library`.
+
+    Args:
+        path (str): Путь к файлу хранилища ('.json' или '.db').
+        count (int): Число книг.
+        seed (int, optional): Начальное значение генератора случайных чисел (по умолчанию 0).
+    """
+
+    backend = SqliteStorage(path) if path.lower().endswith(Library.SQLITE_EXTENSIONS) else JsonStorage(path)
+    try:
+        backend.save(count, generate_books(count, seed))
+    finally:
+        backend.close()
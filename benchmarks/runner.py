@@ -0,0 +1,210 @@
+import contextlib
+import io
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from app.library import Library
+
+from .catalog import write_catalog
+
+# Версия формата файла результатов. Увеличивается при несовместимых изменениях.
+RESULTS_FORMAT = 1
+STORAGE_EXTENSIONS = {'json': '.json', 'sqlite': '.db'}
+SEARCHES = (('title', 'мир'), ('author', 'толстой'), ('year', '19'))
+
+
+class _NullStream(io.TextIOBase):
+    """Поток вывода, который отбрасывает все записанное."""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+def measure(function: Callable[[], Any], repeat: int) -> dict:
+    """
+    Замеряет время выполнения функции и пиковый расход памяти.
+
+    Функция выполняется `repeat` раз без трассировки памяти, а затем еще один раз под `tracemalloc`,
+    чтобы трассировка не искажала время.
+
+    Args:
+        function (Callable[[], Any]): Замеряемая функция без аргументов.
+        repeat (int): Число замеров времени.
+
+    Returns:
+        dict: Число замеров ('repeat'), минимальное, медианное и максимальное время в секундах
+            ('min_seconds', 'median_seconds', 'max_seconds') и пиковый объем памяти, выделенной
+            во время выполнения, в байтах ('peak_memory_bytes').
+    """
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'repeat': repeat,
+        'min_seconds': min(timings),
+        'median_seconds': statistics.median(timings),
+        'max_seconds': max(timings),
+        'peak_memory_bytes': peak
+    }
+
+
+def benchmark_catalog(size: int, workdir: str, repeat: int = 5, storage: str = 'json', seed: int = 0) -> list[dict]:
+    """
+    Генерирует каталог заданного размера и замеряет на нем основные операции `Library`.
+
+    Замеряются загрузка (`_load_books`) и сохранение (`_save_books`) каталога, добавление
+    и удаление книги с записью в хранилище, поиск по каждому полю без кеша и вывод всех книг
+    в таблицу (в поток, который отбрасывает вывод).
+
+    Args:
+        size (int): Число книг в каталоге.
+        workdir (str): Каталог для файла хранилища.
+        repeat (int, optional): Число замеров каждой операции (по умолчанию 5).
+        storage (str, optional): Тип хранилища: 'json' или 'sqlite' (по умолчанию 'json').
+        seed (int, optional): Начальное значение генератора каталога (по умолчанию 0).
+
+    Raises:
+        ValueError: Если тип хранилища или число замеров недопустимы.
+
+    Returns:
+        list[dict]: Результаты замеров (см. `measure`) с размером каталога ('size'),
+            названием операции ('operation') и размером файла хранилища ('storage_bytes').
+    """
+
+    if storage not in STORAGE_EXTENSIONS:
+        raise ValueError(f'Недопустимый тип хранилища. Допустимые значения: {tuple(STORAGE_EXTENSIONS)}')
+    if not isinstance(repeat, int) or repeat < 1:
+        raise ValueError('Число замеров должно быть положительным целым числом')
+
+    path = os.path.join(workdir, f'catalog-{size}{STORAGE_EXTENSIONS[storage]}')
+    write_catalog(path, size, seed)
+    storage_bytes = os.path.getsize(path)
+
+    def reload() -> None:
+        library._reset_books()
+        library._load_books()
+
+    added: list[int] = []
+
+    def add() -> None:
+        library.add_book('Новая книга', 'Толстой Л.Н.', 1869)
+        added.append(library._last_id)
+
+    def delete() -> None:
+        library.delete_book(added.pop(0))
+
+    operations: list[tuple[str, Callable[[], Any]]] = [
+        ('load', reload),
+        ('save', lambda: library._save_books()),
+        ('add_book', add),
+        ('delete_book', delete)
+    ]
+    operations += [
+        (f'search_books({field})', lambda field=field, keyword=keyword: library.search_books(keyword, field))
+        for field, keyword in SEARCHES
+    ]
+    operations.append(('display_books', lambda: Library.display_books(library.books, stream=_NullStream())))
+
+    results = []
+    with contextlib.redirect_stdout(_NullStream()):
+        library = Library(path, search_cache_size=0)
+        try:
+            for name, function in operations:
+                result = {'size': size, 'operation': name, 'storage_bytes': storage_bytes}
+                result.update(measure(function, repeat))
+                results.append(result)
+        finally:
+            library.exit()
+    os.remove(path)
+    return results
+
+
+def run_benchmarks(sizes: list[int], workdir: str, repeat: int = 5, storage: str = 'json', seed: int = 0) -> dict:
+    """
+    Выполняет замеры для каталогов нескольких размеров.
+
+    Args:
+        sizes (list[int]): Размеры каталогов.
+        workdir (str): Каталог для файлов хранилища.
+        repeat (int, optional): Число замеров каждой операции (по умолчанию 5).
+        storage (str, optional): Тип хранилища: 'json' или 'sqlite' (по умолчанию 'json').
+        seed (int, optional): Начальное значение генератора каталога (по умолчанию 0).
+
+    Returns:
+        dict: Документ с результатами: версия формата ('format'), время запуска ('created'),
+            окружение ('python', 'platform'), параметры запуска и список замеров ('results').
+    """
+
+    results = []
+    for size in sizes:
+        results.extend(benchmark_catalog(size, workdir, repeat, storage, seed))
+
+    return {
+        'format': RESULTS_FORMAT,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'storage': storage,
+        'repeat': repeat,
+        'seed': seed,
+        'results': results
+    }
+
+
+def compare(baseline: dict, current: dict, tolerance: float = 0.2) -> list[dict]:
+    """
+    Сравнивает результаты двух запусков и находит регрессии по медианному времени.
+
+    Сравниваются только замеры, которые есть в обоих запусках (одинаковые размер и операция).
+
+    Args:
+        baseline (dict): Результаты базового запуска (`run_benchmarks`).
+        current (dict): Результаты текущего запуска.
+        tolerance (float, optional): Допустимое относительное замедление (по умолчанию 0.2 - 20%).
+
+    Raises:
+        ValueError: Если результаты получены в разных форматах или на разных типах хранилища.
+
+    Returns:
+        list[dict]: Регрессии: размер ('size'), операция ('operation'), медианное время
+            базового и текущего запуска ('baseline_seconds', 'current_seconds') и их отношение ('ratio').
+    """
+
+    if baseline.get('format') != current.get('format'):
+        raise ValueError('Результаты записаны в разных форматах и не могут быть сравнены')
+    if baseline.get('storage') != current.get('storage'):
+        raise ValueError('Результаты получены на разных типах хранилища и не могут быть сравнены')
+
+    previous = {(result['size'], result['operation']): result for result in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        base = previous.get((result['size'], result['operation']))
+        if base is None or not base['median_seconds']:
+            continue
+        ratio = result['median_seconds'] / base['median_seconds']
+        if ratio > 1 + tolerance:
+            regressions.append({
+                'size': result['size'],
+                'operation': result['operation'],
+                'baseline_seconds': base['median_seconds'],
+                'current_seconds': result['median_seconds'],
+                'ratio': ratio
+            })
+    return regressions
@@ -33,6 +33,11 @@ class TestBook(TestCase):
         with self.assertRaises(ValueError):
             Book.validate_id(0)
 
+    def test_validate_id_invalid_too_large(self):
+        self.assertEqual(Book.validate_id(Book.MAX_ID), Book.MAX_ID)
+        with self.assertRaises(ValueError):
+            Book.validate_id(Book.MAX_ID + 1)
+
     def test_validate_id_invalid_non_int(self):
         with self.assertRaises(ValueError):
             Book.validate_id('1')
@@ -129,4 +134,21 @@ class TestBook(TestCase):
             'year': self.valid_year,
             'status': self.valid_status.value
         }
-        self.assertEqual(book.to_dict(), expected_dict)
\ No newline at end of file
+        self.assertEqual(book.to_dict(), expected_dict)
+    # Тесты компактного представления
+    def test_slots_without_dict(self):
+        book = Book(self.valid_id, self.valid_title, self.valid_author, self.valid_year, self.valid_status)
+        self.assertFalse(hasattr(book, '__dict__'))
+        with self.assertRaises(AttributeError):
+            book.extra = 1
+
+    def test_author_interned(self):
+        first = Book(1, self.valid_title, ''.join(['Толстой', ' Л.Н.']), self.valid_year, self.valid_status)
+        second = Book(2, self.valid_title, ''.join(['Толстой Л.', 'Н.']), self.valid_year, self.valid_status)
+        self.assertIs(first.author, second.author)
+
+    # Тесты для from_dict
+    def test_from_dict(self):
+        book = Book(self.valid_id, self.valid_title, self.valid_author, self.valid_year, self.valid_status)
+        restored = Book.from_dict(book.to_dict())
+        self.assertEqual(restored.to_dict(), book.to_dict())
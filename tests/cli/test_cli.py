@@ -0,0 +1,128 @@
+import io
+import json
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from app.cli import main
+from app.library import Library
+from app.library.filelock import FileLock
+from app.library.storage import JsonStorage
+
+
+class TestCli(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage = os.path.join(self.tmp_dir.name, 'library.json')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def run_cli(self, *argv: str, stdin: str = '') -> tuple[int, list[dict]]:
+        stream = io.StringIO()
+        with patch('sys.stdin', io.StringIO(stdin)), patch('sys.stderr', io.StringIO()):
+            code = main(['--storage', self.storage, *argv], stream)
+        return code, [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    def test_commands(self):
+        code, output = self.run_cli('add', 'Война и мир', 'Толстой Л.Н.', '1869')
+        self.assertEqual(code, 0)
+        self.assertEqual(output, [{'ok': True, 'result': {
+            'id': 1, 'title': 'Война и мир', 'author': 'Толстой Л.Н.', 'year': 1869, 'status': 'в наличии'
+        }}])
+
+        self.assertEqual(self.run_cli('status', '1', 'выдана')[1][0]['result']['status'], 'выдана')
+        self.assertEqual([book['id'] for book in self.run_cli('search', 'толстой', '--field', 'author')[1][0]['result']], [1])
+        self.assertEqual(len(self.run_cli('list', '--status', 'в наличии')[1][0]['result']), 0)
+        self.assertEqual(self.run_cli('delete', '1')[1][0]['result']['id'], 1)
+        self.assertEqual(self.run_cli('list')[1], [{'ok': True, 'result': []}])
+
+    def test_errors(self):
+        code, output = self.run_cli('delete', '5')
+        self.assertEqual(code, 1)
+        self.assertFalse(output[0]['ok'])
+        self.assertIn('не найдена', output[0]['error'])
+
+        code, output = self.run_cli('add', 'Война и мир', 'Толстой Л.Н.', 'год')
+        self.assertEqual(code, 2)
+        self.assertFalse(output[0]['ok'])
+
+    def test_read_only_commands_do_not_write(self):
+        self.run_cli('add', 'Война и мир', 'Толстой Л.Н.', '1869')
+        mtime = os.stat(self.storage).st_mtime_ns
+        lock = FileLock(f'{self.storage}.lock')
+        generation = lock.read_state()[0]
+
+        self.assertEqual(self.run_cli('list')[0], 0)
+        self.assertEqual(self.run_cli('search', 'мир')[0], 0)
+        self.assertEqual(os.stat(self.storage).st_mtime_ns, mtime)
+        self.assertEqual(lock.read_state()[0], generation)
+        lock.close()
+
+    def test_failed_save_reported(self):
+        self.run_cli('add', 'Война и мир', 'Толстой Л.Н.', '1869')
+        with patch.object(JsonStorage, 'save', side_effect=OSError('disk full')):
+            code, output = self.run_cli('add', 'Анна Каренина', 'Толстой Л.Н.', '1877')
+            self.assertEqual(code, 1)
+            self.assertEqual([result['ok'] for result in output], [False])
+            self.assertIn('disk full', output[0]['error'])
+
+            code, output = self.run_cli('batch', stdin='add "Анна Каренина" "Толстой Л.Н." 1877\n')
+            self.assertEqual(code, 1)
+            self.assertEqual([result['ok'] for result in output], [True, False])
+        self.assertEqual(len(Library(self.storage).books), 1)
+
+    def test_batch_saves_once(self):
+        script = '\n'.join([
+            '# каталог',
+            'add "Война и мир" "Толстой Л.Н." 1869',
+            'add "Анна Каренина" "Толстой Л.Н." 1877',
+            '',
+            'delete 42',
+            'status 2 выдана',
+            'search толстой --field author',
+        ])
+        with patch.object(JsonStorage, 'save', autospec=True, side_effect=JsonStorage.save) as mock_save:
+            code, output = self.run_cli('batch', stdin=script)
+        mock_save.assert_called_once()
+
+        self.assertEqual(code, 1)
+        self.assertEqual([result['ok'] for result in output], [True, True, False, True, True])
+        self.assertEqual([book['id'] for book in output[-1]['result']], [1, 2])
+        lib = Library(self.storage)
+        self.assertEqual(len(lib.books), 2)
+        self.assertEqual(lib._find_book_by_id(2).status.value, 'выдана')
+
+    def test_batch_from_file(self):
+        path = os.path.join(self.tmp_dir.name, 'commands.txt')
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write('add "Война и мир" "Толстой Л.Н." 1869\nbatch\n')
+        code, output = self.run_cli('batch', path)
+        self.assertEqual(code, 1)
+        self.assertEqual([result['ok'] for result in output], [True, False])
+
+    def test_import(self):
+        path = os.path.join(self.tmp_dir.name, 'books.csv')
+        report = os.path.join(self.tmp_dir.name, 'rejected.jsonl')
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write('title,author,year\nВойна и мир,Толстой Л.Н.,1869\nАнна Каренина,Толстой 1,1877\n')
+        code, output = self.run_cli('import', path, '--report', report, '--workers', '0')
+        self.assertEqual(code, 0)
+        self.assertEqual(output[0]['result'], {'imported': 1, 'rejected': 1, 'first_id': 1, 'last_id': 1})
+        with open(report, encoding='utf-8') as file:
+            self.assertEqual(json.loads(file.readline())['line'], 3)
+
+        code, output = self.run_cli('import', os.path.join(self.tmp_dir.name, 'missing.csv'))
+        self.assertEqual(code, 1)
+
+    def test_export(self):
+        self.run_cli('add', 'Война и мир', 'Толстой Л.Н.', '1869')
+        self.run_cli('add', 'Мертвые души', 'Гоголь Н.В.', '1842')
+        path = os.path.join(self.tmp_dir.name, 'books.jsonl')
+        code, output = self.run_cli('export', path, '--search', 'гоголь', '--field', 'author')
+        self.assertEqual(code, 0)
+        self.assertEqual(output[0]['result'], {'exported': 1})
+        with open(path, encoding='utf-8') as file:
+            self.assertEqual(json.loads(file.readline())['title'], 'Мертвые души')
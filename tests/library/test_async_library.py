@@ -0,0 +1,61 @@
+import asyncio
+import os
+import tempfile
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from app.library import AsyncLibrary, Library, BookStatus
+
+
+class TestAsyncLibrary(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage = os.path.join(self.tmp_dir.name, 'library.json')
+        self.library = await AsyncLibrary.open(self.storage)
+
+    async def asyncTearDown(self):
+        await self.library.close()
+        self.tmp_dir.cleanup()
+
+    @patch('builtins.print')
+    async def test_returns_data_without_printing(self, mock_print):
+        book = await self.library.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+        self.assertEqual(book.id, 1)
+        changed = await self.library.change_status(1, BookStatus.BORROWED)
+        self.assertEqual(changed.status, BookStatus.BORROWED)
+        self.assertEqual(await self.library.search_books('мир', 'title'), [book])
+        self.assertEqual(await self.library.search_by_year_range(1800, 1900), [book])
+        self.assertEqual(await self.library.delete_book(1), book)
+        self.assertEqual(await self.library.list_books(), [])
+        mock_print.assert_not_called()
+
+    async def test_errors_are_raised(self):
+        with self.assertRaises(ValueError):
+            await self.library.add_book('', 'Толстой Л.Н.', 1869)
+        with self.assertRaises(ValueError):
+            await self.library.delete_book(1)
+        with self.assertRaises(ValueError):
+            await self.library.change_status(1, BookStatus.BORROWED)
+
+    async def test_changes_are_persisted(self):
+        await self.library.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+        self.assertEqual(len(Library(self.storage).books), 1)
+
+    async def test_concurrent_saves_coalesced(self):
+        backend = self.library._library._backend
+        with patch.object(backend, 'save', wraps=backend.save) as mock_save:
+            books = await asyncio.gather(*(
+                self.library.add_book(f'Книга {number}', 'Толстой Л.Н.', 1869) for number in range(20)
+            ))
+        self.assertEqual(sorted(book.id for book in books), list(range(1, 21)))
+        self.assertLess(mock_save.call_count, 20)
+        self.assertEqual(len(Library(self.storage).books), 20)
+
+    async def test_failed_save_is_retried(self):
+        backend = self.library._library._backend
+        with patch.object(backend, 'save', side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                await self.library.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+        await self.library.add_book('Анна Каренина', 'Толстой Л.Н.', 1877)
+        self.assertEqual(len(Library(self.storage).books), 2)
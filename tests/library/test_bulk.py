@@ -0,0 +1,117 @@
+import io
+import json
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from app.library import Library, BookStatus
+from app.library.bulk import read_rows, validate_chunks, validate_record
+
+CSV_DATA = '''title,author,year,status
+Война и мир,Толстой Л.Н.,1869,
+Анна Каренина,Толстой Л.Н.,1877,выдана
+X,Толстой Л.Н.,1877,
+Воскресение,Толстой 1,1899,
+"Мертвые души, том 1",Гоголь Н.В.,1842,в наличии
+'''
+
+
+class TestBulkValidation(TestCase):
+
+    def test_read_rows(self):
+        rows = list(read_rows(io.StringIO(CSV_DATA), 'csv'))
+        self.assertEqual([line for line, _ in rows], [2, 3, 4, 5, 6])
+        self.assertEqual(rows[4][1]['title'], 'Мертвые души, том 1')
+
+        rows = list(read_rows(io.StringIO('{"title": "А"}\n\n{"title": "Б"}\n'), 'jsonl'))
+        self.assertEqual([line for line, _ in rows], [1, 3])
+
+        with self.assertRaises(ValueError):
+            list(read_rows(io.StringIO('title,year\nА,1869\n'), 'csv'))
+        with self.assertRaises(ValueError):
+            list(read_rows(io.StringIO(''), 'xml'))
+
+    def test_validate_record(self):
+        self.assertEqual(
+            validate_record({'title': ' Война и мир ', 'author': 'Толстой Л.Н.', 'year': '1869', 'status': 'Выдана'}),
+            ('Война и мир', 'Толстой Л.Н.', 1869, BookStatus.BORROWED)
+        )
+        self.assertEqual(validate_record({'title': 'Война и мир', 'author': 'Толстой Л.Н.', 'year': 1869})[3],
+                         BookStatus.IN_STOCK)
+        for record in ({'title': 'Война и мир', 'author': 'Толстой Л.Н.', 'year': 'давно'},
+                       {'title': 'Война и мир', 'author': 'Толстой Л.Н.', 'year': 1869, 'status': 'утеряна'},
+                       {'title': 'Война и мир', 'author': 'Толстой Л.Н.', 'year': 1869, 'status': 1}):
+            with self.assertRaises(ValueError):
+                validate_record(record)
+
+    def test_chunks_keep_order_in_process_pool(self):
+        rows = [(number, {'title': f'Книга {number}', 'author': 'Толстой Л.Н.', 'year': 1869})
+                for number in range(1, 101)]
+        rows[10] = (11, {'title': 'К', 'author': 'Толстой Л.Н.', 'year': 1869})
+        results = list(validate_chunks(rows, chunk_size=7, workers=2))
+        self.assertEqual(len(results), 15)
+        titles = [title for valid, _ in results for title, *_ in valid]
+        self.assertEqual(titles, [f'Книга {number}' for number in range(1, 101) if number != 11])
+        self.assertEqual([line for _, rejected in results for line, *_ in rejected], [11])
+
+        with self.assertRaises(ValueError):
+            list(validate_chunks(rows, chunk_size=0))
+
+
+@patch('builtins.print')
+class TestLibraryImport(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage = os.path.join(self.tmp_dir.name, 'library.json')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_import_csv(self, _):
+        lib = Library(self.storage)
+        lib.add_book('Отцы и дети', 'Тургенев И.С.', 1862)
+        report = io.StringIO()
+        with patch.object(lib._backend, 'save', wraps=lib._backend.save) as mock_save:
+            result = lib.import_books(io.StringIO(CSV_DATA), 'csv', report=report, workers=0, chunk_size=2)
+            lib.exit()
+        mock_save.assert_called_once()
+
+        self.assertEqual(result, {'imported': 3, 'rejected': 2, 'first_id': 2, 'last_id': 4})
+        rejected = [json.loads(line) for line in report.getvalue().splitlines()]
+        self.assertEqual([entry['line'] for entry in rejected], [4, 5])
+        self.assertEqual(rejected[1]['record']['author'], 'Толстой 1')
+
+        loaded = Library(self.storage)
+        self.assertEqual([book.id for book in loaded.books], [1, 2, 3, 4])
+        self.assertEqual(loaded._find_book_by_id(3).status, BookStatus.BORROWED)
+        self.assertEqual([book.id for book in loaded.search_by_year_range(1860, 1870)], [1, 2])
+        self.assertEqual(loaded._last_id, 4)
+
+    def test_import_jsonl_in_process_pool(self, _):
+        lines = [json.dumps({'title': f'Книга {number}', 'author': 'Толстой Л.Н.', 'year': 1869}, ensure_ascii=False)
+                 for number in range(50)]
+        lines.insert(5, '{"title": ')
+        lib = Library(self.storage)
+        result = lib.import_books(io.StringIO('\n'.join(lines)), 'jsonl', workers=2, chunk_size=8)
+        self.assertEqual(result['imported'], 50)
+        self.assertEqual(result['rejected'], 1)
+        self.assertEqual(lib.books[-1].title, 'Книга 49')
+        self.assertEqual(len(Library(self.storage).books), 50)
+
+    def test_failed_import_is_rolled_back(self, _):
+        lib = Library(self.storage)
+        lib.add_book('Отцы и дети', 'Тургенев И.С.', 1862)
+        with patch.object(lib._backend, 'save', side_effect=OSError('диск заполнен')):
+            with self.assertRaises(OSError):
+                lib.import_books(io.StringIO(CSV_DATA), 'csv', workers=0)
+        self.assertEqual([book.id for book in lib.books], [1])
+        self.assertEqual(lib._last_id, 1)
+        self.assertEqual(lib.count_by_status()[BookStatus.IN_STOCK], 1)
+
+    def test_import_not_allowed_in_transaction(self, _):
+        lib = Library(self.storage)
+        with self.assertRaises(ValueError):
+            with lib.transaction():
+                lib.import_books(io.StringIO(CSV_DATA), 'csv', workers=0)
@@ -0,0 +1,90 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from app.library import Library, BookStatus
+from app.library.cache import SearchCache
+
+
+class TestSearchCache(TestCase):
+
+    def test_lru_eviction(self):
+        cache = SearchCache(max_size=2)
+        cache.put('a', 0, (1,))
+        cache.put('b', 0, (2,))
+        cache.get('a', 0)
+        cache.put('c', 0, (3,))
+        self.assertEqual(cache.get('a', 0), (1,))
+        self.assertIsNone(cache.get('b', 0))
+        self.assertEqual(len(cache), 2)
+
+    def test_stale_generation_is_miss(self):
+        cache = SearchCache()
+        cache.put('a', 0, (1,))
+        self.assertIsNone(cache.get('a', 1))
+        self.assertEqual(len(cache), 0)
+
+    def test_stats(self):
+        cache = SearchCache(max_size=10)
+        cache.get('a', 0)
+        cache.put('a', 0, ())
+        cache.get('a', 0)
+        self.assertEqual(cache.stats(), {'hits': 1, 'misses': 1, 'hit_rate': 0.5, 'size': 1, 'max_size': 10})
+
+    def test_disabled_and_invalid_size(self):
+        cache = SearchCache(max_size=0)
+        cache.put('a', 0, (1,))
+        self.assertEqual(len(cache), 0)
+        with self.assertRaises(ValueError):
+            SearchCache(max_size=-1)
+
+
+@patch('builtins.print')
+class TestLibrarySearchCache(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage = os.path.join(self.tmp_dir.name, 'library.json')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_repeated_search_hits_cache(self, _):
+        lib = Library(self.storage)
+        lib.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+        first = lib.search_books('МИР', 'title')
+        second = lib.search_books('мир', 'title')
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        stats = lib.search_cache_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+    def test_mutations_invalidate(self, _):
+        lib = Library(self.storage)
+        lib.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+        self.assertEqual(len(lib.search_books('толстой', 'author')), 1)
+        lib.add_book('Анна Каренина', 'Толстой Л.Н.', 1877)
+        self.assertEqual(len(lib.search_books('толстой', 'author')), 2)
+        lib.delete_book(1)
+        self.assertEqual(len(lib.search_books('толстой', 'author')), 1)
+        generation = lib._mutation_generation
+        lib.change_status(2, BookStatus.BORROWED)
+        self.assertGreater(lib._mutation_generation, generation)
+        self.assertEqual(lib.search_cache_stats()['hits'], 0)
+
+    def test_rollback_invalidates(self, _):
+        lib = Library(self.storage)
+        with self.assertRaises(ValueError):
+            with lib.transaction():
+                lib.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+                self.assertEqual(len(lib.search_books('мир', 'title')), 1)
+                raise ValueError('откат')
+        self.assertEqual(lib.search_books('мир', 'title'), [])
+
+    def test_cache_disabled(self, _):
+        lib = Library(self.storage, search_cache_size=0)
+        lib.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+        lib.search_books('мир', 'title')
+        lib.search_books('мир', 'title')
+        self.assertEqual(lib.search_cache_stats()['hits'], 0)
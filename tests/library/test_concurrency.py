@@ -0,0 +1,109 @@
+import os
+import random
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+from unittest.mock import patch
+
+from app.library import Library, BookStatus
+from app.library.locks import ReadWriteLock
+
+
+class TestReadWriteLock(TestCase):
+
+    def test_readers_run_in_parallel(self):
+        lock = ReadWriteLock()
+        barrier = threading.Barrier(2, timeout=5)
+
+        def reader():
+            with lock.read():
+                barrier.wait()
+
+        threads = [threading.Thread(target=reader) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertFalse(barrier.broken)
+
+    def test_writer_excludes_readers(self):
+        lock = ReadWriteLock()
+        entered = threading.Event()
+        lock.acquire_write()
+        thread = threading.Thread(target=lambda: (lock.acquire_read(), entered.set(), lock.release_read()))
+        thread.start()
+        self.assertFalse(entered.wait(0.05))
+        lock.release_write()
+        thread.join()
+        self.assertTrue(entered.is_set())
+
+    def test_writer_is_reentrant(self):
+        lock = ReadWriteLock()
+        with lock.write():
+            with lock.write():
+                with lock.read():
+                    pass
+        with lock.write():
+            pass
+
+    def test_upgrade_not_supported(self):
+        lock = ReadWriteLock()
+        with lock.read():
+            with self.assertRaises(RuntimeError):
+                lock.acquire_write()
+
+
+class TestLibraryConcurrency(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage = os.path.join(self.tmp_dir.name, 'library.json')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    @patch('builtins.print')
+    def test_mixed_operations_stress(self, _):
+        lib = Library(self.storage, text_index=True, flush_interval=3600)
+        added = []
+
+        def worker(seed: int) -> None:
+            rng = random.Random(seed)
+            for number in range(50):
+                action = rng.random()
+                if action < 0.4:
+                    lib.add_book(f'Книга {seed}-{number}', 'Толстой Л.Н.', 1800 + number)
+                    added.append(1)
+                elif action < 0.55:
+                    books = lib.books
+                    if books:
+                        try:
+                            lib.delete_book(rng.choice(books).id)
+                        except ValueError:
+                            pass
+                elif action < 0.65:
+                    books = lib.books
+                    if books:
+                        lib.change_status(rng.choice(books).id, BookStatus.BORROWED)
+                elif action < 0.85:
+                    lib.search_books('книга', 'title')
+                    lib.search_by_year_range(1800, 1850)
+                else:
+                    lib.list_books()
+
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(worker, range(16)))
+
+            books = lib.books
+            ids = [book.id for book in books]
+            self.assertEqual(len(ids), len(set(ids)))
+            self.assertEqual(lib._last_id, len(added))
+            self.assertTrue(all(book_id <= lib._last_id for book_id in ids))
+            self.assertEqual(len(lib.search_books('книга', 'title')), len(books))
+            self.assertEqual(len(lib.search_by_year_range(1000, 3000)), len(books))
+        finally:
+            lib.exit()
+
+        self.assertEqual(sorted(book.id for book in Library(self.storage).books), sorted(ids))
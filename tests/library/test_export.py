@@ -0,0 +1,80 @@
+import csv
+import io
+import json
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from app.library import Library, BookStatus, Query
+
+
+@patch('builtins.print')
+class TestExport(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage = os.path.join(self.tmp_dir.name, 'library.json')
+        with patch('builtins.print'):
+            self.lib = Library(self.storage)
+            self.lib.add_books([
+                ('Война и мир', 'Толстой Л.Н.', 1869),
+                ('Мертвые души, том 1', 'Гоголь Н.В.', 1842),
+                ('Анна Каренина', 'Толстой Л.Н.', 1877),
+            ])
+            self.lib.change_status(3, BookStatus.BORROWED)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_export_csv(self, _):
+        stream = io.StringIO()
+        self.assertEqual(self.lib.export(stream, chunk_size=2), 3)
+        rows = list(csv.DictReader(io.StringIO(stream.getvalue())))
+        self.assertEqual([row['id'] for row in rows], ['1', '2', '3'])
+        self.assertEqual(rows[1]['title'], 'Мертвые души, том 1')
+        self.assertEqual(rows[2]['status'], 'выдана')
+
+    def test_export_jsonl_with_query(self, _):
+        stream = io.StringIO()
+        query = Query().contains('author', 'толстой').status_is(BookStatus.IN_STOCK)
+        self.assertEqual(self.lib.export(stream, 'jsonl', query), 1)
+        self.assertEqual([json.loads(line) for line in stream.getvalue().splitlines()], [
+            {'id': 1, 'title': 'Война и мир', 'author': 'Толстой Л.Н.', 'year': 1869, 'status': 'в наличии'}
+        ])
+
+    def test_export_writes_in_chunks(self, _):
+        stream = io.StringIO()
+        with patch.object(stream, 'write', wraps=stream.write) as mock_write:
+            self.lib.export(stream, 'jsonl', chunk_size=2)
+        self.assertEqual(mock_write.call_count, 2)
+
+    def test_export_empty_and_invalid(self, _):
+        stream = io.StringIO()
+        self.assertEqual(self.lib.export(stream, query=Query().contains('title', 'нет такой')), 0)
+        self.assertEqual(stream.getvalue(), 'id,title,author,year,status\n')
+        with self.assertRaises(ValueError):
+            self.lib.export(stream, 'xml')
+        with self.assertRaises(ValueError):
+            self.lib.export(stream, chunk_size=0)
+
+    def test_roundtrip_with_import(self, _):
+        for format in ('csv', 'jsonl'):
+            stream = io.StringIO()
+            self.lib.export(stream, format)
+            stream.seek(0)
+            target = Library(os.path.join(self.tmp_dir.name, f'copy-{format}.json'))
+            self.assertEqual(target.import_books(stream, format, workers=0)['imported'], 3)
+            self.assertEqual([book.to_dict() for book in target.books], [book.to_dict() for book in self.lib.books])
+
+    def test_saved_document_is_streamed_json(self, _):
+        with open(self.storage, encoding='utf-8') as file:
+            data = json.load(file)
+        self.assertEqual(data['last_id'], 3)
+        self.assertEqual([book['id'] for book in data['books']], [1, 2, 3])
+
+        self.lib.delete_book(1)
+        self.lib.delete_book(2)
+        self.lib.delete_book(3)
+        with open(self.storage, encoding='utf-8') as file:
+            self.assertEqual(json.load(file), {'last_id': 3, 'books': []})
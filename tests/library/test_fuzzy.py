@@ -0,0 +1,106 @@
+import os
+import random
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from app.library import Library
+from app.library.fuzzy import BKTree, fuzzy_terms, levenshtein
+
+
+class TestLevenshtein(TestCase):
+
+    def test_distance(self):
+        self.assertEqual(levenshtein('kitten', 'sitting'), 3)
+        self.assertEqual(levenshtein('толстои', 'толстой'), 1)
+        self.assertEqual(levenshtein('dostoevsky', 'dostoyevsky'), 1)
+        self.assertEqual(levenshtein('', 'abc'), 3)
+        self.assertEqual(levenshtein('abc', 'abc'), 0)
+
+    def test_matches_dynamic_programming(self):
+        def reference(first, second):
+            previous = list(range(len(second) + 1))
+            for i, first_char in enumerate(first, start=1):
+                current = [i]
+                for j, second_char in enumerate(second, start=1):
+                    current.append(min(previous[j] + 1, current[j - 1] + 1,
+                                       previous[j - 1] + (first_char != second_char)))
+                previous = current
+            return previous[-1]
+
+        rng = random.Random(5)
+        for _ in range(500):
+            first = ''.join(rng.choice('абв г') for _ in range(rng.randint(0, 70)))
+            second = ''.join(rng.choice('абв г') for _ in range(rng.randint(0, 70)))
+            self.assertEqual(levenshtein(first, second), reference(first, second))
+
+    def test_fuzzy_terms(self):
+        self.assertEqual(fuzzy_terms('Толстой  Л.Н.'), {'толстой л.н.', 'толстой', 'л.н.'})
+
+
+class TestBKTree(TestCase):
+
+    def test_matches_brute_force(self):
+        rng = random.Random(1)
+        words = {''.join(rng.choice('абвгд') for _ in range(rng.randint(2, 7))) for _ in range(300)}
+        tree = BKTree()
+        for key, word in enumerate(words):
+            tree.add(key, word)
+        for query in ('абв', 'гдаб', 'ааааа'):
+            expected = {key: levenshtein(query, word) for key, word in enumerate(words)
+                        if levenshtein(query, word) <= 2}
+            self.assertEqual(tree.search(query, 2), expected)
+
+    def test_remove_and_rebuild(self):
+        tree = BKTree()
+        tree.add(1, 'толстой')
+        tree.add(2, 'толстая')
+        tree.add(3, 'пушкин')
+        tree.remove(1, 'толстой')
+        self.assertEqual(tree.search('толстои', 1), {})
+        tree.remove(2, 'толстая')
+        self.assertEqual(len(tree), 1)
+        tree.add(4, 'толстой')
+        self.assertEqual(tree.search('толстои', 1), {4: 1})
+
+
+@patch('builtins.print')
+class TestLibraryFuzzySearch(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage = os.path.join(self.tmp_dir.name, 'library.json')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _fill(self, lib):
+        lib.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+        lib.add_book('Идиот', 'Dostoyevsky', 1869)
+        lib.add_book('Анна Каренина', 'Толстая', 1877)
+
+    def test_ranked_by_distance(self, _):
+        for fuzzy_index in (True, False):
+            lib = Library(self.storage, fuzzy_index=fuzzy_index)
+            self._fill(lib)
+            self.assertEqual([book.id for book in lib.search_fuzzy('Толстои', 'author')], [1, 3])
+            self.assertEqual([book.id for book in lib.search_fuzzy('Dostoevsky', 'author', 1)], [2])
+            self.assertEqual(lib.search_fuzzy('Dostoevsky', 'author', 0), [])
+            self.assertEqual([book.id for book in lib.search_fuzzy('война и мор', 'title')], [1])
+            os.remove(self.storage)
+
+    def test_index_maintained(self, _):
+        lib = Library(self.storage, fuzzy_index=True)
+        self._fill(lib)
+        lib.delete_book(1)
+        self.assertEqual([book.id for book in lib.search_fuzzy('Толстои', 'author')], [3])
+        self.assertEqual(
+            [book.id for book in Library(self.storage, fuzzy_index=True).search_fuzzy('Толстои', 'author')], [3]
+        )
+
+    def test_invalid_arguments(self, _):
+        lib = Library(self.storage)
+        with self.assertRaises(ValueError):
+            lib.search_fuzzy('1869', 'year')
+        with self.assertRaises(ValueError):
+            lib.search_fuzzy('Толстой', 'author', -1)
@@ -0,0 +1,240 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from app.library import Library, BookStatus
+from app.library.indexes import GroupIndex, NGramIndex, PrefixIndex, SortedIndex
+
+
+class TestNGramIndex(TestCase):
+
+    def setUp(self):
+        self.index = NGramIndex()
+        self.index.add(1, 'Война и мир')
+        self.index.add(2, 'Анна Каренина')
+        self.index.add(3, 'Мир полудня')
+
+    def test_search_substring(self):
+        self.assertEqual(self.index.search('мир'), [1, 3])
+
+    def test_search_case_insensitive(self):
+        self.assertEqual(self.index.search('КАРЕН'), [2])
+
+    def test_search_short_keyword(self):
+        self.assertEqual(self.index.search('и'), [1, 2, 3])
+        self.assertEqual(self.index.search(''), [1, 2, 3])
+
+    def test_search_filters_false_positives(self):
+        self.index.add(4, 'абв где')
+        self.assertEqual(self.index.search('абвгде'), [])
+
+    def test_remove(self):
+        self.index.remove(1)
+        self.assertEqual(self.index.search('мир'), [3])
+        self.assertEqual(len(self.index), 2)
+
+
+class TestLibraryTextIndex(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage = os.path.join(self.tmp_dir.name, 'library.json')
+        self.lib = Library(self.storage, text_index=True)
+        self.lib.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+        self.lib.add_book('Анна Каренина', 'Толстой Л.Н.', 1877)
+        self.lib.add_book('Мир полудня', 'Стругацкие', 1962)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_results_match_scan(self):
+        scan = Library(self.storage)
+        for field in Library.TEXT_INDEX_FIELDS:
+            for keyword in ('мир', 'ТОЛ', 'на', 'а', '', 'нет такого'):
+                self.assertEqual(
+                    [book.id for book in self.lib.search_books(keyword, field)],
+                    [book.id for book in scan.search_books(keyword, field)]
+                )
+
+    def test_index_updated_on_delete(self):
+        self.lib.delete_book(1)
+        self.assertEqual([book.id for book in self.lib.search_books('мир', 'title')], [3])
+
+    def test_index_built_on_load(self):
+        reloaded = Library(self.storage, text_index=True)
+        self.assertEqual([book.id for book in reloaded.search_books('толстой', 'author')], [1, 2])
+
+
+class TestSortedIndex(TestCase):
+
+    def setUp(self):
+        self.index = SortedIndex()
+        for key, value in ((1, 1869), (2, 2019), (3, 1900), (4, 1877), (5, 1900)):
+            self.index.add(key, value)
+
+    def test_range(self):
+        self.assertEqual(self.index.range(1850, 1900), [1, 4, 3, 5])
+
+    def test_range_exact(self):
+        self.assertEqual(self.index.range(1900, 1900), [3, 5])
+
+    def test_range_empty(self):
+        self.assertEqual(self.index.range(1950, 2000), [])
+
+    def test_out_of_range(self):
+        with self.assertRaises(ValueError):
+            self.index.add(2 ** SortedIndex.KEY_BITS, 1900)
+        with self.assertRaises(ValueError):
+            self.index.add(1, -1)
+
+    def test_remove(self):
+        self.index.remove(3, 1900)
+        self.assertEqual(self.index.range(1900, 1900), [5])
+        self.assertEqual(len(self.index), 4)
+
+
+class TestLibraryYearIndex(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.lib = Library(os.path.join(self.tmp_dir.name, 'library.json'))
+        self.lib.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+        self.lib.add_book('Мастер и Маргарита', 'Булгаков', 1967)
+        self.lib.add_book('Анна Каренина', 'Толстой Л.Н.', 1877)
+        self.lib.add_book('Задача', 'Автор', 2019)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_search_by_year(self):
+        self.assertEqual([book.id for book in self.lib.search_by_year(1869)], [1])
+        self.assertEqual(self.lib.search_by_year(1900), [])
+
+    def test_search_by_year_range(self):
+        self.assertEqual([book.id for book in self.lib.search_by_year_range(1850, 1900)], [1, 3])
+
+    def test_search_by_year_range_invalid(self):
+        with self.assertRaises(ValueError):
+            self.lib.search_by_year_range(1900, 1850)
+
+    def test_year_index_updated_on_delete(self):
+        self.lib.delete_book(1)
+        self.assertEqual([book.id for book in self.lib.search_by_year_range(1850, 1900)], [3])
+
+
+class TestGroupIndex(TestCase):
+
+    def test_counts_and_keys(self):
+        index = GroupIndex(['a', 'b'])
+        index.add(2, 'a')
+        index.add(1, 'a')
+        self.assertEqual(index.counts(), {'a': 2, 'b': 0})
+        self.assertEqual(index.keys('a'), [1, 2])
+
+    def test_move_and_remove(self):
+        index = GroupIndex()
+        index.add(1, 'a')
+        index.move(1, 'a', 'b')
+        self.assertEqual((index.count('a'), index.count('b')), (0, 1))
+        index.remove(1, 'b')
+        self.assertEqual(len(index), 0)
+
+
+class TestLibraryStatusIndex(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage = os.path.join(self.tmp_dir.name, 'library.json')
+        self.lib = Library(self.storage)
+        self.lib.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+        self.lib.add_book('Мастер и Маргарита', 'Булгаков', 1967)
+        self.lib.add_book('Анна Каренина', 'Толстой Л.Н.', 1877)
+        self.lib.change_status(2, BookStatus.BORROWED)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_count_by_status(self):
+        self.assertEqual(self.lib.count_by_status(), {BookStatus.IN_STOCK: 2, BookStatus.BORROWED: 1})
+
+    def test_books_with_status(self):
+        self.assertEqual([book.id for book in self.lib.books_with_status(BookStatus.IN_STOCK)], [1, 3])
+        with self.assertRaises(ValueError):
+            self.lib.books_with_status('выдана')
+
+    def test_status_index_updated(self):
+        self.lib.delete_book(2)
+        self.lib.change_status(1, BookStatus.BORROWED)
+        self.assertEqual([book.id for book in self.lib.books_with_status(BookStatus.BORROWED)], [1])
+        self.assertEqual(Library(self.storage).count_by_status(), {BookStatus.IN_STOCK: 1, BookStatus.BORROWED: 1})
+
+    def test_status_index_rolled_back(self):
+        with self.assertRaises(ValueError):
+            with self.lib.transaction():
+                self.lib.change_status(1, BookStatus.BORROWED)
+                self.lib.delete_book(2)
+                raise ValueError('откат')
+        self.assertEqual(self.lib.count_by_status(), {BookStatus.IN_STOCK: 2, BookStatus.BORROWED: 1})
+        self.assertEqual([book.id for book in self.lib.books_with_status(BookStatus.BORROWED)], [2])
+
+
+class TestPrefixIndex(TestCase):
+
+    def setUp(self):
+        self.index = PrefixIndex()
+        for value in ('Толстой Л.Н.', 'Тургенев И.С.', 'толстая Т.Н.', 'Пушкин А.С.', 'Толстой Л.Н.'):
+            self.index.add(value)
+
+    def test_suggest(self):
+        self.assertEqual(self.index.suggest('тол', 10), ['толстая Т.Н.', 'Толстой Л.Н.'])
+        self.assertEqual(self.index.suggest('Т', 2), ['толстая Т.Н.', 'Толстой Л.Н.'])
+        self.assertEqual(self.index.suggest('я', 10), [])
+        self.assertEqual(len(self.index.suggest('', 10)), 4)
+
+    def test_remove_counts_books(self):
+        self.index.remove('Толстой Л.Н.')
+        self.assertIn('Толстой Л.Н.', self.index.suggest('тол', 10))
+        self.index.remove('Толстой Л.Н.')
+        self.assertNotIn('Толстой Л.Н.', self.index.suggest('тол', 10))
+        self.index.add('Толстой Л.Н.')
+        self.assertIn('Толстой Л.Н.', self.index.suggest('тол', 10))
+
+    def test_bulk_merge_and_compaction(self):
+        index = PrefixIndex()
+        values = [f'Автор {number:03}' for number in range(200)]
+        for value in values:
+            index.add(value)
+        self.assertEqual(index.suggest('автор 01', 3), ['Автор 010', 'Автор 011', 'Автор 012'])
+        for value in values[:150]:
+            index.remove(value)
+        self.assertEqual(index.suggest('автор', 1), ['Автор 150'])
+        self.assertEqual(len(index), 50)
+
+
+class TestLibrarySuggest(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage = os.path.join(self.tmp_dir.name, 'library.json')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_suggest_matches_scan(self):
+        for prefix_index in (True, False):
+            lib = Library(self.storage, prefix_index=prefix_index)
+            lib.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+            lib.add_book('Анна Каренина', 'Толстой Л.Н.', 1877)
+            lib.add_book('Воскресение', 'Толстой Л.Н.', 1899)
+            lib.delete_book(3)
+            self.assertEqual(lib.suggest('author', 'тол'), ['Толстой Л.Н.'])
+            self.assertEqual(lib.suggest('title', 'во'), ['Война и мир'])
+            self.assertEqual(lib.suggest('title', 'а', limit=1), ['Анна Каренина'])
+            os.remove(self.storage)
+
+    def test_suggest_invalid(self):
+        lib = Library(self.storage)
+        with self.assertRaises(ValueError):
+            lib.suggest('year', '18')
+        with self.assertRaises(ValueError):
+            lib.suggest('title', 'в', limit=0)
@@ -0,0 +1,69 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+from app.library import Library, BookStatus
+
+
+class TestJournal(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage = os.path.join(self.tmp_dir.name, 'library.json')
+        self.journal = os.path.join(self.tmp_dir.name, 'library.journal')
+        self.lib = Library(self.storage, journal=True, journal_max_ratio=100)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_mutations_append_to_journal(self):
+        self.lib.add_book('Title', 'Author', 2000)
+        self.lib.change_status(1, BookStatus.BORROWED)
+        self.assertFalse(os.path.exists(self.storage))
+        with open(self.journal, encoding='utf-8') as file:
+            operations = [json.loads(line) for line in file]
+        self.assertEqual([operation['op'] for operation in operations], ['add', 'status'])
+
+    def test_replay_on_load(self):
+        self.lib.add_book('Title', 'Author', 2000)
+        self.lib.add_book('Other', 'Author', 2001)
+        self.lib.change_status(2, BookStatus.BORROWED)
+        self.lib.delete_book(1)
+        reloaded = Library(self.storage, journal=True)
+        self.assertEqual(list(reloaded._books_by_id), [2])
+        self.assertEqual(reloaded._books_by_id[2].status, BookStatus.BORROWED)
+        self.assertEqual(reloaded._last_id, 2)
+
+    def test_replay_skips_truncated_line(self):
+        self.lib.add_book('Title', 'Author', 2000)
+        with open(self.journal, 'a', encoding='utf-8') as file:
+            file.write('{"op": "delete", "id"')
+        reloaded = Library(self.storage, journal=True)
+        self.assertEqual(list(reloaded._books_by_id), [1])
+
+    def test_compaction_by_size(self):
+        lib = Library(self.storage, journal=True, journal_max_size=1, journal_max_ratio=100)
+        lib.add_book('Title', 'Author', 2000)
+        self.assertTrue(os.path.exists(self.storage))
+        self.assertFalse(os.path.exists(self.journal))
+
+    def test_compaction_by_ratio(self):
+        lib = Library(self.storage, journal=True, journal_max_ratio=1)
+        lib.add_book('Title', 'Author', 2000)
+        self.assertTrue(os.path.exists(self.journal))
+        lib.change_status(1, BookStatus.BORROWED)
+        self.assertFalse(os.path.exists(self.journal))
+        self.assertTrue(os.path.exists(self.storage))
+
+    def test_replay_is_idempotent_over_snapshot(self):
+        self.lib.add_book('Title', 'Author', 2000)
+        self.lib.change_status(1, BookStatus.BORROWED)
+        with open(self.journal, encoding='utf-8') as file:
+            journal_data = file.read()
+        self.lib.compact()
+        with open(self.journal, 'w', encoding='utf-8') as file:
+            file.write(journal_data)
+        reloaded = Library(self.storage, journal=True)
+        self.assertEqual(len(reloaded._books_by_id), 1)
+        self.assertEqual(reloaded._books_by_id[1].status, BookStatus.BORROWED)
@@ -0,0 +1,71 @@
+import io
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+from app.library import Library
+from app.library.jsonstream import iter_json_object
+
+
+class TestIterJsonObject(TestCase):
+
+    def setUp(self):
+        self.document = {
+            'last_id': 12345,
+            'books': [{'id': i, 'title': f'Книга {i}', 'year': 1900 + i} for i in range(1, 20)],
+            'meta': {'nested': [1, 2.5, None, True]}
+        }
+
+    def _items(self, text: str, chunk_size: int) -> list:
+        return list(iter_json_object(io.StringIO(text), stream_keys=('books',), chunk_size=chunk_size))
+
+    def test_streams_array_elements(self):
+        text = json.dumps(self.document, ensure_ascii=False, indent=4)
+        for chunk_size in (1, 3, 7, 64, 65536):
+            items = self._items(text, chunk_size)
+            self.assertEqual([value for key, value in items if key == 'books'], self.document['books'])
+            self.assertIn(('last_id', 12345), items)
+            self.assertIn(('meta', self.document['meta']), items)
+
+    def test_number_split_between_chunks(self):
+        self.assertEqual(self._items('{"books": [], "last_id": 1234567}', 2), [('last_id', 1234567)])
+
+    def test_empty_object(self):
+        self.assertEqual(self._items('  {  }  ', 1), [])
+
+    def test_non_streamed_array(self):
+        items = list(iter_json_object(io.StringIO('{"books": [1, 2]}'), chunk_size=1))
+        self.assertEqual(items, [('books', [1, 2])])
+
+    def test_invalid_document(self):
+        for text in ('', '[1, 2]', '{"books": [1, 2}', '{"last_id": 1', '{"a" 1}'):
+            with self.assertRaises(json.JSONDecodeError):
+                self._items(text, 4)
+
+
+class TestLibraryStreamingLoad(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage = os.path.join(self.tmp_dir.name, 'library.json')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _write(self, text: str) -> None:
+        with open(self.storage, 'w', encoding='utf-8') as file:
+            file.write(text)
+
+    def test_last_id_after_books(self):
+        book = {'id': 2, 'title': 'Title', 'author': 'Author', 'year': 2000, 'status': 'в наличии'}
+        self._write(json.dumps({'books': [book], 'last_id': 7}, ensure_ascii=False))
+        lib = Library(self.storage)
+        self.assertEqual(list(lib._books_by_id), [2])
+        self.assertEqual(lib._last_id, 7)
+
+    def test_invalid_document_resets(self):
+        self._write('{"last_id": 3, "books": [{"id": 1,')
+        lib = Library(self.storage)
+        self.assertEqual(lib.books, [])
+        self.assertEqual(lib._last_id, 0)
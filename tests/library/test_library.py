@@ -1,8 +1,9 @@
+import io
 import os
 from unittest import TestCase
 from unittest.mock import patch, MagicMock
 
-from app.library import Library, BookStatus
+from app.library import Library, Book, BookStatus
 
 
 class TestLibrary(TestCase):
@@ -20,13 +21,13 @@ class TestLibrary(TestCase):
 
     def test_add_book_valid(self):
         self.lib.add_book('Title', 'Author', 2000)
-        self.assertEqual(len(self.lib._books), 1)
+        self.assertEqual(len(self.lib.books), 1)
 
     def test_delete_book_valid(self):
         self.lib.add_book('Title', 'Author', 2000)
-        book_id = self.lib._books[0].id
+        book_id = self.lib.books[0].id
         self.lib.delete_book(book_id)
-        self.assertEqual(len(self.lib._books), 0)
+        self.assertEqual(len(self.lib.books), 0)
 
     def test_delete_book_invalid(self):
         with self.assertRaises(ValueError):
@@ -43,12 +44,91 @@ class TestLibrary(TestCase):
 
     def test_change_status_valid(self):
         self.lib.add_book('Title', 'Author', 2000)
-        book_id = self.lib._books[0].id
+        book_id = self.lib.books[0].id
         self.lib.change_status(book_id, BookStatus.IN_STOCK)
-        self.assertEqual(self.lib._books[0].status, BookStatus.IN_STOCK)
+        self.assertEqual(self.lib.books[0].status, BookStatus.IN_STOCK)
 
     def test_save_books(self):
         self.lib.add_book('Title', 'Author', 2000)
-        with patch('builtins.open', new_callable=MagicMock) as mock_open:
+        with patch('builtins.open', new_callable=MagicMock) as mock_open, \
+                patch('os.fsync'), patch('os.replace') as mock_replace:
             self.lib._save_books()
-            mock_open.assert_called_once_with('test_library.json', 'w', encoding='utf-8')
+            mock_open.assert_called_once_with('test_library.json.tmp', 'w', encoding='utf-8')
+            mock_replace.assert_called_once_with('test_library.json.tmp', 'test_library.json')
+
+    @patch('builtins.print')
+    def test_record_methods_return_books_without_output(self, mock_print):
+        book = self.lib.add_book_record('Title', 'Author', 2000)
+        self.assertEqual(self.lib.books, [book])
+        self.assertIs(self.lib.set_status(book.id, BookStatus.BORROWED), book)
+        self.assertEqual(book.status, BookStatus.BORROWED)
+        self.assertIs(self.lib.remove_book(book.id), book)
+        with self.assertRaises(ValueError):
+            self.lib.remove_book(book.id)
+        self.assertEqual(self.lib.books, [])
+        mock_print.assert_not_called()
+
+    def test_find_book_by_id_uses_index(self):
+        self.lib.add_book('Title', 'Author', 2000)
+        self.lib.add_book('Other', 'Author', 2001)
+        self.assertIs(self.lib._find_book_by_id(2), self.lib._books_by_id[2])
+        self.assertIsNone(self.lib._find_book_by_id(3))
+
+    def test_append_book_duplicate_id(self):
+        self.lib.add_book('Title', 'Author', 2000)
+        duplicate = Book(1, 'Other', 'Author', 2001, BookStatus.IN_STOCK)
+        with self.assertRaises(ValueError):
+            self.lib._append_book_to_list(duplicate)
+
+    def test_append_book_out_of_range_id_leaves_library_unchanged(self):
+        book = Book.unchecked(5000000000, 'Title', 'Author', 2000, BookStatus.IN_STOCK)
+        with self.assertRaises(ValueError):
+            self.lib._append_book_to_list(book)
+        self.assertEqual(self.lib._books_by_id, {})
+        self.assertEqual(self.lib._last_id, 0)
+        self.assertEqual(self.lib.books_with_status(BookStatus.IN_STOCK), [])
+
+    @patch('builtins.print')
+    def test_out_of_range_id_rejected_on_load(self, _):
+        with open('test_library.json', 'w', encoding='utf-8') as file:
+            file.write('{"last_id": 1, "books": ['
+                       '{"id": 5000000000, "title": "Title", "author": "Author", "year": 2000, "status": "в наличии"}]}')
+        lib = Library('test_library.json')
+        self.assertEqual(lib._books_by_id, {})
+        lib.add_book('Other', 'Author', 2001)
+        self.assertEqual(list(lib._books_by_id), [2])
+
+    def test_index_consistent_after_reload(self):
+        self.lib.add_book('Title', 'Author', 2000)
+        self.lib.add_book('Other', 'Author', 2001)
+        self.lib.delete_book(1)
+        reloaded = Library('test_library.json')
+        self.assertEqual(list(reloaded._books_by_id), [2])
+        self.assertEqual(reloaded._last_id, 2)
+
+    def test_render_books_chunks(self):
+        books = [Book(number, f'Title {number}', 'Author', 2000, BookStatus.IN_STOCK) for number in range(1, 6)]
+        pages = list(Library.render_books(books, page_size=2))
+        self.assertEqual(len(pages), 3)
+        self.assertTrue(all(page.startswith('ID') for page in pages))
+        self.assertEqual(pages[2].count('Title'), 1)
+
+        chunks = list(Library.render_books(iter(books)))
+        self.assertEqual(len(chunks), 1)
+        self.assertEqual(chunks[0].count('\n'), 7)
+
+    def test_display_books_pager(self):
+        books = [Book(number, f'Title {number}', 'Author', 2000, BookStatus.IN_STOCK) for number in range(1, 6)]
+        stream = io.StringIO()
+        pager = MagicMock(side_effect=[True, False])
+        Library.display_books(books, stream, page_size=2, pager=pager)
+        self.assertEqual(pager.call_count, 2)
+        self.assertIn('Title 4', stream.getvalue())
+        self.assertNotIn('Title 5', stream.getvalue())
+
+    def test_list_books_empty(self):
+        stream = io.StringIO()
+        self.lib.list_books(stream)
+        self.assertEqual(stream.getvalue(), 'В библиотеке пока нет книг.\n')
+        Library.display_books([], stream)
+        self.assertIn('Нет книг для отображения.', stream.getvalue())
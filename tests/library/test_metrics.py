@@ -0,0 +1,106 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from app.library import Library, Query
+from app.library.metrics import Metrics
+
+
+class TestMetrics(TestCase):
+
+    def test_histogram_and_counters(self):
+        metrics = Metrics(enabled=True)
+        metrics.observe('load', 0.0002)
+        metrics.observe('load', 2.0)
+        metrics.add('bytes_written', 'save', 100)
+        metrics.add('bytes_written', 'save', 20)
+
+        snapshot = metrics.snapshot()
+        load = snapshot['operations']['load']
+        self.assertEqual(load['calls'], 2)
+        self.assertAlmostEqual(load['seconds'], 2.0002)
+        self.assertEqual(load['buckets']['0.0001'], 0)
+        self.assertEqual(load['buckets']['0.0005'], 1)
+        self.assertEqual(load['buckets']['5.0'], 2)
+        self.assertEqual(load['buckets']['+Inf'], 2)
+        self.assertEqual(snapshot['counters']['bytes_written'], {'save': 120})
+        self.assertEqual(json.loads(metrics.to_json()), snapshot)
+
+        metrics.reset()
+        self.assertEqual(metrics.snapshot()['operations'], {})
+        self.assertEqual(metrics.snapshot()['counters']['bytes_written'], {})
+
+    def test_prometheus(self):
+        metrics = Metrics(enabled=True)
+        metrics.observe('search_books', 0.003)
+        metrics.add('books_scanned', 'search_books', 7)
+
+        text = metrics.to_prometheus()
+        self.assertIn('# TYPE library_operation_seconds histogram', text)
+        self.assertIn('library_operation_seconds_bucket{operation="search_books",le="0.005"} 1', text)
+        self.assertIn('library_operation_seconds_bucket{operation="search_books",le="+Inf"} 1', text)
+        self.assertIn('library_operation_seconds_count{operation="search_books"} 1', text)
+        self.assertIn('# TYPE library_books_scanned_total counter', text)
+        self.assertIn('library_books_scanned_total{operation="search_books"} 7', text)
+
+    def test_counted(self):
+        metrics = Metrics(enabled=True)
+        items = metrics.counted('books_scanned', 'query', range(10))
+        self.assertEqual(next(items), 0)
+        items.close()
+        self.assertEqual(metrics.snapshot()['counters']['books_scanned'], {'query': 1})
+
+
+@patch('builtins.print')
+class TestLibraryMetrics(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage = os.path.join(self.tmp_dir.name, 'library.json')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_disabled_by_default(self, _):
+        lib = Library(self.storage)
+        lib.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+        lib.search_books('мир', 'title')
+        snapshot = lib.metrics.snapshot()
+        self.assertFalse(snapshot['enabled'])
+        self.assertEqual(snapshot['operations'], {})
+
+    def test_operations_are_recorded(self, _):
+        lib = Library(self.storage, metrics=True)
+        lib.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+        lib.add_book('Анна Каренина', 'Толстой Л.Н.', 1877)
+        lib.delete_book(2)
+        lib.search_books('мир', 'title')
+        lib.search_books('мир', 'title')
+        lib.query(Query().contains('author', 'толстой'))
+
+        snapshot = lib.metrics.snapshot()
+        operations = snapshot['operations']
+        self.assertEqual(operations['load']['calls'], 1)
+        self.assertEqual(operations['add_book']['calls'], 2)
+        self.assertEqual(operations['delete_book']['calls'], 1)
+        self.assertEqual(operations['commit']['calls'], 3)
+        self.assertEqual(operations['save']['calls'], 3)
+        self.assertEqual(operations['search_books']['calls'], 2)
+        # Второй поиск берется из кеша и книги не просматривает.
+        self.assertEqual(snapshot['counters']['books_scanned'], {'search_books': 1, 'query': 1})
+        self.assertEqual(snapshot['counters']['bytes_written']['save'], lib._backend.bytes_written)
+
+    def test_switch_at_runtime(self, _):
+        lib = Library(self.storage, journal=True)
+        lib.metrics.enable()
+        lib.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+        written = lib._backend.bytes_written
+        lib.metrics.disable()
+        lib.add_book('Анна Каренина', 'Толстой Л.Н.', 1877)
+
+        snapshot = lib.metrics.snapshot()
+        self.assertEqual(snapshot['operations']['add_book']['calls'], 1)
+        self.assertGreater(snapshot['counters']['bytes_written']['commit'], 0)
+        self.assertEqual(sum(snapshot['counters']['bytes_written'].values()), written)
@@ -0,0 +1,117 @@
+import contextlib
+import io
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from unittest import TestCase
+from unittest.mock import patch
+
+from app.library import Library, BookStatus
+from app.library.filelock import FileLock
+
+
+def _add_books(storage: str, count: int, worker: int) -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        lib = Library(storage, multiprocess=True)
+        for number in range(count):
+            lib.add_book(f'Книга {worker}-{number}', 'Толстой Л.Н.', 1869)
+        lib.exit()
+
+
+class TestFileLock(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'library.json.lock')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_state_roundtrip(self):
+        lock = FileLock(self.path)
+        self.assertEqual(lock.read_state(), (0, 0))
+        with lock.exclusive():
+            lock.write_state(3, 42)
+        self.assertEqual(FileLock(self.path).read_state(), (3, 42))
+        lock.close()
+
+    @patch('app.library.filelock.fcntl', None)
+    def test_without_fcntl(self):
+        storage = os.path.join(self.tmp_dir.name, 'library.json')
+        with contextlib.redirect_stdout(io.StringIO()):
+            lib = Library(storage, multiprocess=True)
+            lib.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+            lib.exit()
+        lock = FileLock(f'{storage}.lock')
+        self.assertEqual(lock.read_state()[1], 1)
+        lock.close()
+
+    def test_reentrant(self):
+        lock = FileLock(self.path)
+        with lock.exclusive():
+            with lock.shared():
+                self.assertTrue(lock.locked)
+            self.assertTrue(lock.locked)
+        self.assertFalse(lock.locked)
+        lock.close()
+
+
+@patch('builtins.print')
+class TestMultiprocessLibrary(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage = os.path.join(self.tmp_dir.name, 'library.json')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_changes_are_not_lost(self, _):
+        first = Library(self.storage, multiprocess=True)
+        second = Library(self.storage, multiprocess=True)
+        first.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+        second.add_book('Анна Каренина', 'Толстой Л.Н.', 1877)
+        first.change_status(2, BookStatus.BORROWED)
+
+        self.assertEqual([book.id for book in second.search_books('Толстой', 'author')], [1, 2])
+        self.assertEqual(second._find_book_by_id(2).status, BookStatus.BORROWED)
+        first.exit()
+        second.exit()
+        self.assertEqual(len(Library(self.storage).books), 2)
+
+    def test_reload_only_after_foreign_commit(self, _):
+        first = Library(self.storage, multiprocess=True)
+        second = Library(self.storage, multiprocess=True)
+        with patch.object(second, '_load_books', wraps=second._load_books) as mock_load:
+            second.search_books('мир', 'title')
+            second.add_book('Анна Каренина', 'Толстой Л.Н.', 1877)
+            second.search_books('мир', 'title')
+            mock_load.assert_not_called()
+
+            first.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+            self.assertEqual(len(second.search_books('мир', 'title')), 1)
+            mock_load.assert_called_once()
+        first.exit()
+        second.exit()
+
+    def test_unique_ids_with_write_behind(self, _):
+        first = Library(self.storage, multiprocess=True, flush_interval=3600)
+        second = Library(self.storage, multiprocess=True, flush_interval=3600)
+        first.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+        second.add_book('Анна Каренина', 'Толстой Л.Н.', 1877)
+        first.flush()
+        second.flush()
+        self.assertEqual(sorted(book.id for book in second.books), [1, 2])
+        first.exit()
+        second.exit()
+        self.assertEqual(sorted(book.id for book in Library(self.storage).books), [1, 2])
+
+    def test_concurrent_processes(self, _):
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=4, mp_context=context) as executor:
+            list(executor.map(_add_books, [self.storage] * 4, [10] * 4, range(4)))
+
+        lib = Library(self.storage)
+        self.assertEqual(sorted(book.id for book in lib.books), list(range(1, 41)))
+        self.assertEqual(lib._last_id, 40)
@@ -0,0 +1,89 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from app.library import Library, BookStatus, Query
+from app.library.query import Predicate
+
+
+class TestQuery(TestCase):
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            Query().contains('status', 'в наличии')
+        with self.assertRaises(ValueError):
+            Query().year_between(1900, 1800)
+        with self.assertRaises(ValueError):
+            Query().order_by('unknown')
+        with self.assertRaises(ValueError):
+            Query().limit(-1)
+        with self.assertRaises(ValueError):
+            Query().status_is('выдана')
+
+    def test_incomplete_predicate(self):
+        class Incomplete(Predicate):
+            def matches(self, book):
+                return True
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+
+@patch('builtins.print')
+class TestLibraryQuery(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage = os.path.join(self.tmp_dir.name, 'library.json')
+        with patch('builtins.print'):
+            self.lib = Library(self.storage, text_index=True)
+            self.lib.add_books([
+                ('Война и мир', 'Толстой Л.Н.', 1869),
+                ('Анна Каренина', 'Толстой Л.Н.', 1877),
+                ('Преступление и наказание', 'Достоевский Ф.М.', 1866),
+                ('Идиот', 'Достоевский Ф.М.', 1869),
+                ('Воскресение', 'Толстой Л.Н.', 1899),
+            ])
+            self.lib.change_status(2, BookStatus.BORROWED)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_combined_conditions(self, _):
+        query = Query().contains('author', 'толстой').year_between(1860, 1880).status_is(BookStatus.IN_STOCK)
+        self.assertEqual([book.id for book in self.lib.query(query)], [1])
+
+    def test_matches_scan(self, _):
+        query = Query().contains('title', 'и').year_between(1860, 1870)
+        expected = [book for book in self.lib.books
+                    if 'и' in book.title.lower() and 1860 <= book.year <= 1870]
+        self.assertEqual(sorted(self.lib.query(query), key=lambda book: book.id), expected)
+
+    def test_empty_query_returns_all(self, _):
+        self.assertEqual(self.lib.query(Query()), self.lib.books)
+
+    def test_sort_and_limit(self, _):
+        books = self.lib.query(Query().order_by('year', descending=True).limit(2))
+        self.assertEqual([book.year for book in books], [1899, 1877])
+        books = self.lib.query(Query().contains('author', 'толстой').order_by('title'))
+        self.assertEqual([book.title for book in books], ['Анна Каренина', 'Война и мир', 'Воскресение'])
+        self.assertEqual(len(self.lib.query(Query().limit(3))), 3)
+
+    def test_planner_uses_most_selective_index(self, _):
+        plan = self.lib.explain(Query().contains('author', 'толстой').year_between(1877, 1877))
+        self.assertTrue(plan[0].startswith('индекс: год'))
+        plan = self.lib.explain(Query().year_between(1800, 1900).id_equals(4))
+        self.assertTrue(plan[0].startswith('индекс: id'))
+        self.assertEqual(self.lib.query(Query().year_between(1800, 1900).id_equals(4))[0].title, 'Идиот')
+
+    def test_planner_falls_back_to_scan(self, _):
+        lib = Library(os.path.join(self.tmp_dir.name, 'other.json'))
+        plan = lib.explain(Query().contains('author', 'толстой').contains('year', '18'))
+        self.assertTrue(plan[0].startswith('перебор'))
+        self.assertEqual(plan[1:], ["фильтр: author содержит 'толстой'", "фильтр: year содержит '18'"])
+
+    def test_planner_uses_status_index(self, _):
+        plan = self.lib.explain(Query().contains('author', 'толстой').status_is(BookStatus.BORROWED))
+        self.assertTrue(plan[0].startswith('индекс: статус'))
+        self.assertEqual([book.id for book in self.lib.query(Query().status_is(BookStatus.BORROWED))], [2])
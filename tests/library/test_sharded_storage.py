@@ -0,0 +1,117 @@
+import io
+import json
+import os
+import tempfile
+from contextlib import redirect_stdout
+from unittest import TestCase
+from unittest.mock import patch
+
+from app.library import Library, BookStatus, ShardedStorage
+
+
+class TestShardedStorage(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage = os.path.join(self.tmp_dir.name, 'library.shards')
+        self.backend = ShardedStorage(self.storage, shard_size=2, workers=1)
+        self.lib = Library(self.backend)
+        with redirect_stdout(io.StringIO()):
+            for i in range(5):
+                self.lib.add_book(f'Книга {i}', 'Автор', 1900 + i)
+
+    def tearDown(self):
+        self.lib.exit()
+        self.tmp_dir.cleanup()
+
+    def shard_files(self) -> set[str]:
+        return {name for name in os.listdir(self.storage) if name.startswith('shard-')}
+
+    def reload(self, **kwargs) -> Library:
+        return Library(ShardedStorage(self.storage, **kwargs))
+
+    def test_backend_selected_by_extension(self):
+        lib = Library(os.path.join(self.tmp_dir.name, 'other.shards'))
+        self.assertIsInstance(lib._backend, ShardedStorage)
+        lib.exit()
+
+    def test_layout(self):
+        self.assertEqual(len(self.shard_files()), 3)
+        with open(os.path.join(self.storage, ShardedStorage.MANIFEST), encoding='utf-8') as file:
+            manifest = json.load(file)
+        self.assertEqual(manifest['shard_size'], 2)
+        self.assertEqual(manifest['last_id'], 5)
+        self.assertEqual(sorted(manifest['shards']), ['0', '1', '2'])
+
+    def test_change_status_rewrites_one_shard(self):
+        before = self.shard_files()
+        self.lib.change_status(3, BookStatus.BORROWED)
+        after = self.shard_files()
+        self.assertEqual(len(before - after), 1)
+        self.assertEqual(len(after - before), 1)
+        self.assertTrue((before - after).pop().startswith('shard-000001-'))
+
+    def test_reload(self):
+        with redirect_stdout(io.StringIO()):
+            self.lib.change_status(2, BookStatus.BORROWED)
+            self.lib.delete_book(1)
+        reloaded = self.reload()
+        self.assertEqual(list(reloaded._books_by_id), [2, 3, 4, 5])
+        self.assertEqual(reloaded._books_by_id[2].status, BookStatus.BORROWED)
+        self.assertEqual(reloaded._last_id, 5)
+        reloaded.exit()
+
+    def test_parallel_load(self):
+        reloaded = self.reload(workers=2)
+        self.assertEqual([book.to_dict() for book in reloaded.books], [book.to_dict() for book in self.lib.books])
+        reloaded.exit()
+
+    def test_last_id_kept_after_delete(self):
+        with redirect_stdout(io.StringIO()):
+            self.lib.delete_book(5)
+        self.assertEqual(len(self.shard_files()), 2)
+        reloaded = self.reload()
+        self.assertEqual(reloaded._last_id, 5)
+        reloaded.exit()
+
+    def test_transaction_spans_shards(self):
+        with self.lib.transaction():
+            self.lib.delete_book(1)
+            self.lib.change_status(5, BookStatus.BORROWED)
+        reloaded = self.reload()
+        self.assertNotIn(1, reloaded._books_by_id)
+        self.assertEqual(reloaded._books_by_id[5].status, BookStatus.BORROWED)
+        reloaded.exit()
+
+    def test_save_removes_stale_files(self):
+        open(os.path.join(self.storage, 'shard-000009-1.json'), 'w').close()
+        self.lib._save_books()
+        self.assertEqual(len(self.shard_files()), 3)
+
+    def test_invalid_record_skipped(self):
+        with open(os.path.join(self.storage, self.backend._shards[0]), 'w', encoding='utf-8') as file:
+            json.dump([
+                {'id': 1, 'title': '', 'author': 'Автор', 'year': 1900, 'status': 'в наличии'},
+                {'id': 2, 'title': 'Книга', 'author': 'Автор', 'year': 1900, 'status': None},
+                42
+            ], file)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            reloaded = self.reload()
+        self.assertEqual(list(reloaded._books_by_id), [3, 4, 5])
+        self.assertEqual(output.getvalue().count('Ошибка при загрузке книги'), 3)
+        self.assertIn('Ошибка при загрузке книги', output.getvalue())
+        reloaded.exit()
+
+    def test_failed_manifest_write_keeps_storage(self):
+        with patch('os.replace', side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                self.lib.change_status(3, BookStatus.BORROWED)
+        self.assertFalse(os.path.exists(os.path.join(self.storage, f'{ShardedStorage.MANIFEST}.tmp')))
+        reloaded = self.reload()
+        self.assertEqual(reloaded._books_by_id[3].status, BookStatus.IN_STOCK)
+        reloaded.exit()
+
+    def test_invalid_shard_size(self):
+        with self.assertRaises(ValueError):
+            ShardedStorage(os.path.join(self.tmp_dir.name, 'other.shards'), shard_size=0)
@@ -0,0 +1,63 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from app.library import Library, Book, BookStatus
+from app.library.snapshot import BinarySnapshot
+
+
+class TestBinarySnapshot(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage = os.path.join(self.tmp_dir.name, 'library.json')
+        self.snapshot_path = os.path.join(self.tmp_dir.name, 'library.snapshot')
+        self.lib = Library(self.storage, binary_snapshot=True)
+        self.lib.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+        self.lib.add_book('Мастер и Маргарита', 'Булгаков', 1967)
+        self.lib.change_status(2, BookStatus.BORROWED)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_snapshot_written_on_save(self):
+        self.assertTrue(os.path.exists(self.snapshot_path))
+
+    def test_load_from_snapshot_skips_validation(self):
+        with patch.object(Book, 'validate_author', side_effect=AssertionError) as mock_validate:
+            reloaded = Library(self.storage, binary_snapshot=True)
+            mock_validate.assert_not_called()
+        self.assertEqual([book.to_dict() for book in reloaded.books], [book.to_dict() for book in self.lib.books])
+        self.assertEqual(reloaded._last_id, 2)
+
+    def test_snapshot_ignored_when_json_changed(self):
+        with open(self.storage, 'a', encoding='utf-8') as file:
+            file.write(' ')
+        self.assertIsNone(BinarySnapshot(self.snapshot_path).read(self.storage))
+        reloaded = Library(self.storage, binary_snapshot=True)
+        self.assertEqual(len(reloaded.books), 2)
+        self.assertTrue(reloaded._backend.needs_save())
+
+    def test_snapshot_ignored_when_corrupted(self):
+        with open(self.snapshot_path, 'r+b') as file:
+            file.seek(-1, os.SEEK_END)
+            file.write(b'\x00')
+        self.assertIsNone(BinarySnapshot(self.snapshot_path).read(self.storage))
+        self.assertEqual(len(Library(self.storage, binary_snapshot=True).books), 2)
+
+    def test_snapshot_ignored_on_version_mismatch(self):
+        with patch.object(BinarySnapshot, 'VERSION', BinarySnapshot.VERSION + 1):
+            self.assertIsNone(BinarySnapshot(self.snapshot_path).read(self.storage))
+
+    def test_snapshot_dropped_when_record_does_not_fit(self):
+        books = [Book.unchecked(1, 'Война и мир', 'Толстой Л.Н.', 70000, BookStatus.IN_STOCK)]
+        BinarySnapshot(self.snapshot_path).write(self.storage, 1, books)
+        self.assertFalse(os.path.exists(self.snapshot_path))
+        self.assertEqual(len(Library(self.storage, binary_snapshot=True).books), 2)
+
+    def test_journal_replayed_over_snapshot(self):
+        lib = Library(self.storage, journal=True, journal_max_ratio=100, binary_snapshot=True)
+        lib.delete_book(1)
+        reloaded = Library(self.storage, journal=True, binary_snapshot=True)
+        self.assertEqual(list(reloaded._books_by_id), [2])
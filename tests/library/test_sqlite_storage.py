@@ -0,0 +1,73 @@
+import os
+import sqlite3
+import tempfile
+from unittest import TestCase
+
+from app.library import Library, BookStatus, SqliteStorage
+
+
+class TestSqliteStorage(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage = os.path.join(self.tmp_dir.name, 'library.db')
+        self.lib = Library(self.storage)
+        self.lib.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+        self.lib.add_book('Мастер и Маргарита', 'Булгаков', 1967)
+        self.lib.add_book('Анна Каренина', 'Толстой Л.Н.', 1877)
+
+    def tearDown(self):
+        self.lib.exit()
+        self.tmp_dir.cleanup()
+
+    def test_backend_selected_by_extension(self):
+        self.assertIsInstance(self.lib._backend, SqliteStorage)
+
+    def test_invalid_extension(self):
+        with self.assertRaises(ValueError):
+            Library(os.path.join(self.tmp_dir.name, 'library.txt'))
+
+    def test_reload(self):
+        self.lib.change_status(2, BookStatus.BORROWED)
+        self.lib.delete_book(1)
+        reloaded = Library(self.storage)
+        self.assertEqual(list(reloaded._books_by_id), [2, 3])
+        self.assertEqual(reloaded._books_by_id[2].status, BookStatus.BORROWED)
+        self.assertEqual(reloaded._last_id, 3)
+        reloaded.exit()
+
+    def test_last_id_kept_after_delete(self):
+        self.lib.delete_book(3)
+        reloaded = Library(self.storage)
+        self.assertEqual(reloaded._last_id, 3)
+        reloaded.exit()
+
+    def test_save_replaces_contents(self):
+        self.lib.delete_book(1)
+        self.lib._save_books()
+        self.assertEqual(self.lib._backend._connection.execute('SELECT count(*) FROM books').fetchone()[0], 2)
+        self.assertEqual(self.lib._backend.last_id, 3)
+
+    def test_legacy_schema_migrated(self):
+        path = os.path.join(self.tmp_dir.name, 'legacy.db')
+        connection = sqlite3.connect(path)
+        with connection:
+            connection.execute(
+                'CREATE TABLE books (id INTEGER PRIMARY KEY, title TEXT NOT NULL, author TEXT NOT NULL,'
+                ' year INTEGER NOT NULL, status TEXT NOT NULL, title_lower TEXT NOT NULL, author_lower TEXT NOT NULL)'
+            )
+            connection.execute('CREATE INDEX books_year ON books (year)')
+            connection.execute(
+                'INSERT INTO books VALUES (1, \'Война и мир\', \'Толстой Л.Н.\', 1869, \'в наличии\','
+                ' \'война и мир\', \'толстой л.н.\')'
+            )
+        connection.close()
+
+        lib = Library(path)
+        self.assertEqual(lib._books_by_id[1].title, 'Война и мир')
+        lib.add_book('Анна Каренина', 'Толстой Л.Н.', 1877)
+        connection = lib._backend._connection
+        self.assertEqual([row[1] for row in connection.execute('PRAGMA table_info(books)')],
+                         ['id', 'title', 'author', 'year', 'status'])
+        self.assertEqual(connection.execute('PRAGMA index_list(books)').fetchall(), [])
+        lib.exit()
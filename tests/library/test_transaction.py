@@ -0,0 +1,71 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from app.library import Library, BookStatus
+
+
+class TestTransaction(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage = os.path.join(self.tmp_dir.name, 'library.json')
+        self.lib = Library(self.storage)
+        self.lib.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+        self.lib.add_book('Анна Каренина', 'Толстой Л.Н.', 1877)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_single_save_on_commit(self):
+        with patch.object(self.lib._backend, 'save', wraps=self.lib._backend.save) as mock_save:
+            with self.lib.transaction():
+                self.lib.add_book('Мастер и Маргарита', 'Булгаков', 1967)
+                self.lib.change_status(1, BookStatus.BORROWED)
+                self.lib.delete_book(2)
+                mock_save.assert_not_called()
+            mock_save.assert_called_once()
+        reloaded = Library(self.storage)
+        self.assertEqual(list(reloaded._books_by_id), [1, 3])
+        self.assertEqual(reloaded._books_by_id[1].status, BookStatus.BORROWED)
+
+    def test_rollback_on_validation_error(self):
+        with self.assertRaises(ValueError):
+            with self.lib.transaction():
+                self.lib.delete_book(1)
+                self.lib.add_book('Мастер и Маргарита', 'Булгаков', 1967)
+                self.lib.change_status(2, BookStatus.BORROWED)
+                self.lib.add_book('Б', 'Автор', 2000)
+        self.assertEqual(list(self.lib._books_by_id), [1, 2])
+        self.assertEqual(self.lib._books_by_id[2].status, BookStatus.IN_STOCK)
+        self.assertEqual(self.lib._last_id, 2)
+        self.assertEqual([book.id for book in self.lib.search_by_year_range(1000, 2000)], [1, 2])
+        self.assertEqual([book.id for book in Library(self.storage).books], [1, 2])
+
+    def test_nested_transaction(self):
+        with patch.object(self.lib._backend, 'save', wraps=self.lib._backend.save) as mock_save:
+            with self.lib.transaction():
+                with self.lib.transaction():
+                    self.lib.add_book('Мастер и Маргарита', 'Булгаков', 1967)
+                mock_save.assert_not_called()
+            mock_save.assert_called_once()
+
+    def test_add_books(self):
+        added = self.lib.add_books([('Мастер и Маргарита', 'Булгаков', 1967), ('Идиот', 'Достоевский', 1869)])
+        self.assertEqual([book.id for book in added], [3, 4])
+        self.assertEqual(len(Library(self.storage).books), 4)
+
+    def test_add_books_rolls_back(self):
+        with self.assertRaises(ValueError):
+            self.lib.add_books([('Мастер и Маргарита', 'Булгаков', 1967), ('Идиот', 'Автор1', 1869)])
+        self.assertEqual(list(self.lib._books_by_id), [1, 2])
+        self.assertEqual(self.lib._last_id, 2)
+
+    def test_journal_batch(self):
+        lib = Library(os.path.join(self.tmp_dir.name, 'journal.json'), journal=True, journal_max_ratio=100)
+        lib.add_books([('Мастер и Маргарита', 'Булгаков', 1967), ('Идиот', 'Достоевский', 1869)])
+        with open(lib._backend.journal.path, encoding='utf-8') as file:
+            self.assertEqual(len(file.readlines()), 1)
+        reloaded = Library(lib._storage, journal=True)
+        self.assertEqual(list(reloaded._books_by_id), [1, 2])
@@ -0,0 +1,81 @@
+import os
+import tempfile
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from app.library import Library, BookStatus
+
+
+class TestWriteBehind(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage = os.path.join(self.tmp_dir.name, 'library.json')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_changes_coalesced_until_flush(self):
+        lib = Library(self.storage, flush_interval=3600)
+        with patch.object(lib._backend, 'save', wraps=lib._backend.save) as mock_save:
+            lib.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+            lib.add_book('Анна Каренина', 'Толстой Л.Н.', 1877)
+            lib.change_status(1, BookStatus.BORROWED)
+            mock_save.assert_not_called()
+            self.assertTrue(lib._dirty)
+            lib.flush()
+            mock_save.assert_called_once()
+        self.assertFalse(lib._dirty)
+        self.assertEqual(len(Library(self.storage).books), 2)
+        lib.exit()
+
+    def test_background_flush(self):
+        lib = Library(self.storage, flush_interval=0.01)
+        try:
+            lib.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+            deadline = time.monotonic() + 5
+            while lib._dirty and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertFalse(lib._dirty)
+            self.assertEqual(len(Library(self.storage).books), 1)
+        finally:
+            lib.exit()
+
+    def test_exit_flushes_and_stops_thread(self):
+        lib = Library(self.storage, journal=True, journal_max_ratio=100, flush_interval=3600)
+        flusher = lib._flusher
+        lib.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+        lib.exit()
+        self.assertFalse(flusher.is_alive())
+        self.assertEqual(len(Library(self.storage, journal=True).books), 1)
+
+    def test_idle_flush_takes_no_locks(self):
+        lib = Library(self.storage, flush_interval=3600, multiprocess=True)
+        with patch.object(lib._file_lock, 'exclusive', wraps=lib._file_lock.exclusive) as mock_exclusive:
+            lib.flush()
+            mock_exclusive.assert_not_called()
+            lib.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+            mock_exclusive.reset_mock()
+            lib.flush()
+            mock_exclusive.assert_called_once()
+        lib.exit()
+
+    def test_failed_flush_keeps_changes(self):
+        lib = Library(self.storage, flush_interval=3600)
+        lib.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+        with patch.object(lib._backend, 'save', side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                lib.flush()
+        self.assertTrue(lib._dirty)
+        lib.exit()
+        self.assertEqual(len(Library(self.storage).books), 1)
+
+    def test_atomic_save_keeps_previous_file_on_error(self):
+        lib = Library(self.storage)
+        lib.add_book('Война и мир', 'Толстой Л.Н.', 1869)
+        with patch('json.dumps', side_effect=OSError('crash')):
+            with self.assertRaises(OSError):
+                lib.add_book('Анна Каренина', 'Толстой Л.Н.', 1877)
+        self.assertEqual(len(Library(self.storage).books), 1)
+        self.assertFalse(os.path.exists(f'{self.storage}.tmp'))
@@ -0,0 +1,69 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from app.library import Book, Library
+from benchmarks import benchmark_catalog, compare, generate_books, write_catalog
+
+
+class TestCatalog(TestCase):
+
+    def test_books_are_valid_and_reproducible(self):
+        books = list(generate_books(500, seed=1))
+        self.assertEqual([book.id for book in books], list(range(1, 501)))
+        for book in books:
+            self.assertEqual(Book.validate_title(book.title), book.title)
+            self.assertEqual(Book.validate_author(book.author), book.author)
+        self.assertTrue(any('А' <= book.author[0] <= 'я' for book in books))
+        self.assertTrue(any('A' <= book.author[0] <= 'z' for book in books))
+        self.assertEqual([book.to_dict() for book in generate_books(50, seed=1)],
+                         [book.to_dict() for book in books[:50]])
+
+    def test_invalid_count(self):
+        with self.assertRaises(ValueError):
+            list(generate_books(-1))
+
+    def test_write_catalog(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for name in ('catalog.json', 'catalog.db'):
+                path = os.path.join(tmp_dir, name)
+                write_catalog(path, 100)
+                lib = Library(path)
+                self.assertEqual(len(lib.books), 100)
+                self.assertEqual(lib._last_id, 100)
+                lib._backend.close()
+
+
+class TestRunner(TestCase):
+
+    def test_benchmark_catalog(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            results = benchmark_catalog(200, tmp_dir, repeat=2)
+            self.assertEqual(os.listdir(tmp_dir), [])
+
+        operations = [result['operation'] for result in results]
+        self.assertEqual(operations[:4], ['load', 'save', 'add_book', 'delete_book'])
+        self.assertIn('display_books', operations)
+        for result in results:
+            self.assertEqual(result['size'], 200)
+            self.assertEqual(result['repeat'], 2)
+            self.assertLessEqual(result['min_seconds'], result['median_seconds'])
+            self.assertGreaterEqual(result['peak_memory_bytes'], 0)
+
+    def test_benchmark_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            benchmark_catalog(10, '.', storage='csv')
+        with self.assertRaises(ValueError):
+            benchmark_catalog(10, '.', repeat=0)
+
+    def test_compare(self):
+        def run(load, save):
+            return {'format': 1, 'storage': 'json', 'results': [
+                {'size': 10, 'operation': 'load', 'median_seconds': load},
+                {'size': 10, 'operation': 'save', 'median_seconds': save}
+            ]}
+
+        regressions = compare(run(1.0, 1.0), run(1.1, 2.0), tolerance=0.2)
+        self.assertEqual([(r['operation'], r['ratio']) for r in regressions], [('save', 2.0)])
+        with self.assertRaises(ValueError):
+            compare(run(1.0, 1.0), dict(run(1.0, 1.0), storage='sqlite'))
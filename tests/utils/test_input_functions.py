@@ -1,7 +1,7 @@
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
-from app.utils import get_int_input, get_str_input
+from app.utils import get_int_input, get_optional_input, get_str_input
 
 
 class TestInputFunctions(TestCase):
@@ -55,3 +55,29 @@ class TestInputFunctions(TestCase):
     def test_get_str_input_whitespace_handling(self):
         with patch('builtins.input', side_effect=['   hello   ']):
             self.assertEqual(get_str_input('Введите строку: '), 'hello')
+
+    # Тесты get_optional_input
+    def test_get_optional_input_empty(self):
+        with patch('builtins.input', side_effect=['  ']):
+            self.assertIsNone(get_optional_input('Введите число: ', int))
+
+    def test_get_optional_input_invalid_then_valid(self):
+        with patch('builtins.input', side_effect=['abc', '42']), patch('builtins.print'):
+            self.assertEqual(get_optional_input('Введите число: ', int), 42)
+
+    # Тесты автодополнения
+    def test_get_str_input_autocomplete(self):
+        readline = MagicMock()
+        readline.get_line_buffer.return_value = 'тол'
+        complete = MagicMock(return_value=['Толстой Л.Н.'])
+
+        def fake_input(prompt):
+            completer = readline.set_completer.call_args_list[0].args[0]
+            self.assertEqual(completer('тол', 0), 'Толстой Л.Н.')
+            self.assertIsNone(completer('тол', 1))
+            return 'Толстой Л.Н.'
+
+        with patch('app.utils.readline', readline), patch('builtins.input', side_effect=fake_input):
+            self.assertEqual(get_str_input('Автор: ', complete=complete), 'Толстой Л.Н.')
+        complete.assert_called_once_with('тол')
+        self.assertEqual(readline.set_completer.call_count, 2)